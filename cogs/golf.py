@@ -2,28 +2,12 @@ import discord
 from discord.ext import commands
 from discord.utils import get
 
-import requests
 import pendulum
-import aiohttp
-from tempfile import mkstemp
-import subprocess
-import logging
-import coloredlogs
+import asyncio
 import random
-import os
 import time
-import redis
-import shlex
-import pickle
 
-
-LOGGER = logging.getLogger(__name__)
-coloredlogs.install(
-    level='DEBUG', logger=LOGGER,
-    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
-    datefmt='%Y-%m-%d %H:%M:%S',
-    style='{'
-)
+from utils.options import Option, OptionParser
 
 
 class GolfCog(commands.Cog, name="Golf"):
@@ -33,15 +17,6 @@ class GolfCog(commands.Cog, name="Golf"):
         self._debug = False
         self.bot = bot
         self.__name__ = __name__
-        try:
-            self.db = redis.from_url(
-                os.environ.get("REDIS_URL"),
-                socket_timeout=3
-            )
-        except Exception as e:
-            LOGGER.error(e)
-            pass
-
         self.default_tz = "US/Eastern"
         # ^ If a user doesn't provide a tz what should we use?
         self.default_now_tz = "US/Pacific"
@@ -65,12 +40,7 @@ class GolfCog(commands.Cog, name="Golf"):
             "pdt": "US/Pacific"
         }
 
-        try:
-            _ = self.db.get('sports_db')
-            self.user_db = pickle.loads(_)
-        except Exception as e:
-            LOGGER.debug(e)
-            self.user_db = {}
+        self.golf_options = OptionParser(Option('--player'))
 
         self.PGA_ID = (
             "exp=1617984833~"
@@ -91,24 +61,23 @@ class GolfCog(commands.Cog, name="Golf"):
             ),
         }
 
-    @classmethod
-    def _fetch_pgacom_id(self):
+    async def _fetch_pgacom_id(self):
         """pgatour.com sigh"""
         # based on https://gist.github.com/thayton/a5d0c4319d9657d1816fa94ff62e0452
 
         url = "https://microservice.pgatour.com/js"
-        resp = requests.get(url)
-        text = "window = {{}}; {}; console.log(window.pgatour.setTrackingUserId('id8730931'));".format(resp.text)
-
-        fd, path = mkstemp()
-
-        with os.fdopen(fd, "w") as fp:
-            fp.write(text)
-
-        userid = subprocess.check_output(["node", path]).strip()
-        userid = ''.join(chr(c) for c in userid) # convert to str
-        
-        os.unlink(path)
+        resp = await self.bot.web.fetch_text(url)
+        text = "window = {{}}; {}; console.log(window.pgatour.setTrackingUserId('id8730931'));".format(resp)
+
+        # feed the script to node over stdin rather than a temp file, and
+        # wait on it without tying up the loop
+        proc = await asyncio.create_subprocess_exec(
+            "node", "-",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        userid, _ = await proc.communicate(text.encode())
+        userid = userid.strip().decode()
 
         # Create the URL directly as requests will percent encode the userid
         # value causing a 403 from the server... 
@@ -116,47 +85,19 @@ class GolfCog(commands.Cog, name="Golf"):
         return userid
 
 
-    @classmethod
-    def _parseargs(self, passed_args):
-        if passed_args:
-            # passed_args = passed_args.replace("'", '')
-            args = shlex.split(passed_args)
-            # options = {}
-
-            options = {
-                k: True if v.startswith('-') else v
-                for k,v in zip(args, args[1:]+["--"]) if k.startswith('-')
-            }
-
-            extra = args
-            if options:
-                extra = []
-                for k,v in options.items():
-                    for arg in args:
-                        if arg != k and arg != v:
-                            extra.append(arg)
-
-            options['extra_text'] = ' '.join(extra)
-            return options
-        else:
-            return {}
-
-    @staticmethod
-    async def fetch_json(url: str):
-        async with aiohttp.ClientSession() as cs:
-            async with cs.get(url) as r:
-                return await r.json()
+    async def fetch_json(self, url: str):
+        return await self.bot.web.fetch_json(url)
 
     @commands.command(name='golf', aliases=["pga"])
     async def do_golf_scores(self, ctx, *, optional_input: str = None):
         """Fetches golf leaderboard for current tournament if any
         """
-        args = self._parseargs(optional_input)
-        search_player = args.get('--player') or args.get('extra_text')
+        args = self.golf_options.parse(optional_input)
+        search_player = args.get('player') or args.text
         emit = ctx.send
         embed_color = 0x003e7e
         response = await self.fetch_json(self.PGA_API_URLs['current'])
-        userid = self._fetch_pgacom_id()
+        userid = await self._fetch_pgacom_id()
         url = self.PGA_API_URLs['leaderboard'].format(
             tour_type=response.get('tc', 'r'),
             tour_id=response.get('tid', '404'),
@@ -7,7 +7,6 @@ import pendulum
 import random
 import feedparser
 import io
-import aiohttp
 import textwrap
 import asyncio
 import os
@@ -21,12 +20,8 @@ class MiscCog(commands.Cog, name="Miscellaneous"):
         self.__name__ = __name__
 
 
-    @staticmethod
-    async def fetch_img(url: str):
-        async with aiohttp.ClientSession() as cs:
-            async with cs.get(url) as r:
-                # return await r.json()
-                return io.BytesIO(await r.read())
+    async def fetch_img(self, url: str):
+        return io.BytesIO(await self.bot.web.fetch_bytes(url))
 
 
     @commands.command(name='friday')
@@ -108,21 +103,14 @@ class MiscCog(commands.Cog, name="Miscellaneous"):
                     print(err)
                     pass
         post_full_image = None
-        raw_feed = feedparser.parse(url)
-        if not raw_feed['entries']:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as r:
-                    if r.status == 200:
-                        html = await r.text()
-            # print(raw_feed)
-            raw_feed = feedparser.parse(html)
+        # fetch through the shared client, feedparser.parse(url) would do a
+        # blocking download on the loop
+        html = await self.bot.web.fetch_text(url)
+        raw_feed = feedparser.parse(html)
         if not raw_feed['entries']:
             await ctx.send("I coudn't fetch or parse the RSS feed")
             return
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url.replace("/data/rss", "")) as r:
-                if r.status == 200:
-                    html = await r.text()
+        html = await self.bot.web.fetch_text(url.replace("/data/rss", ""))
         raw_html = BeautifulSoup(html, "lxml")
         try:
             post_image = raw_html.find(
@@ -1,9 +1,7 @@
 import re
 from urllib.parse import quote_plus
 import logging
-import shlex
 import coloredlogs
-import aiohttp
 
 import discord
 from discord.ext import commands
@@ -11,7 +9,8 @@ from discord.utils import get
 
 import flag
 import pendulum
-import requests
+
+from utils.options import Option, OptionParser
 
 # import shlex
 
@@ -48,11 +47,10 @@ fighter_stats_url = (
     "stats?region=us&lang=en&contentorigin=espn"
 )
 
-try:
-    countries = requests.get("https://raw.githubusercontent.com/lukes/ISO-3166-Countries-with-Regional-Codes/master/slim-2/slim-2.json").json()
-    
-except:
-    countries = []
+countries_url = (
+    "https://raw.githubusercontent.com/lukes/ISO-3166-Countries-with-"
+    "Regional-Codes/master/slim-2/slim-2.json"
+)
 
 # def _parse_args(passed_args):
 #     if passed_args:
@@ -69,12 +67,29 @@ class MMACog(commands.Cog, name="MMA"):
     def __init__(self, bot):
         self.bot = bot
         self.__name__ = __name__
-    
-    @staticmethod
-    async def fetch_json(url: str):
-        async with aiohttp.ClientSession() as cs:
-            async with cs.get(url) as r:
-                return await r.json()
+        self.countries = None
+        self.fight_options = OptionParser(
+            Option('--prev', flag=True),
+            Option('--prelim', choices=('early',)),
+            Option('--search'),
+            Option('--date'),
+            Option('--schedule', '--sched', flag=True),
+        )
+
+    async def fetch_json(self, url: str):
+        return await self.bot.web.fetch_json(url)
+
+    async def _load_countries(self):
+        """Country list for flags, fetched once on first use"""
+        if self.countries is None:
+            try:
+                # served as text/plain so skip the content-type check
+                self.countries = await self.bot.web.fetch_json(
+                    countries_url, content_type=None)
+            except Exception as err:
+                LOGGER.error(err)
+                return []
+        return self.countries
 
     # @commands.command(name="fighter")
     # # @commands.example(".fighter overeem")
@@ -284,7 +299,9 @@ class MMACog(commands.Cog, name="MMA"):
         Use --date YYYYMMDD                 to fetch events on a specific date.
         """
 
-        options = self.parseargs(optional_input)
+        options = self.fight_options.parse(
+            optional_input.replace("'", "") if optional_input else None)
+        countries = await self._load_countries()
         # print(options)
         # print(trigger.group(1))#, optional_input)
         try:
@@ -296,15 +313,15 @@ class MMACog(commands.Cog, name="MMA"):
             await ctx.send("```\nI couldn't fetch the schedule\n```")
             return
 
-        pv_fight = options.get('--prev') or False
-        card_type = 'main' if not options.get('--prelim') else options.get('--prelim')
+        pv_fight = options.get('prev', False)
+        card_type = options.get('prelim') or 'main'
         if card_type == 'early':
             card_type = 'prelims2'
         elif card_type == True:
             card_type = 'prelims1'
-        search = True if options.get('--search') else False
-        search_string = options.get('--search')
-        date_search = options.get('--date', '')
+        search = True if options.get('search') else False
+        search_string = options.get('search')
+        date_search = options.get('date', '')
         
         # if options.get('--utc'):
         #     zone = "UTC"
@@ -354,7 +371,7 @@ class MMACog(commands.Cog, name="MMA"):
                 "prev": previous[::-1],
             }
 
-        if options.get('--sched') or options.get('--schedule'):
+        if options.get('schedule'):
             schd = []
             for sched_event in inp_fut[:5]:
                 venue = ""
@@ -411,9 +428,8 @@ class MMACog(commands.Cog, name="MMA"):
 
         for id_ in event_id:
             try:
-                data = requests.get(event_url.format(event_id=id_))
-                print("[MMA] event URL:", data.url)
-                data = data.json()
+                print("[MMA] event URL:", event_url.format(event_id=id_))
+                data = await self.fetch_json(event_url.format(event_id=id_))
             except:
                 await ctx.send("```\nI couldn't fetch current event JSON\n```")
                 return
@@ -733,29 +749,5 @@ class MMACog(commands.Cog, name="MMA"):
         s = self._stripItalic(s)
         return s.replace('\x0f', '')
 
-    def parseargs(self, passed_args):
-        if passed_args:
-            passed_args = passed_args.replace("'", "")
-            args = shlex.split(passed_args)
-            # options = {}
-
-            options = {
-                k: True if v.startswith('-') else v
-                for k,v in zip(args, args[1:]+["--"]) if k.startswith('-')
-            }
-
-            extra = args
-            if options:
-                extra = []
-                for k,v in options.items():
-                    for arg in args:
-                        if arg != k and arg != v:
-                            extra.append(arg)
-
-            options['extra_text'] = ' '.join(extra)
-            return options
-        else:
-            return {}
-
 def setup(bot):
     bot.add_cog(MMACog(bot))
\ No newline at end of file
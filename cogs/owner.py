@@ -82,6 +82,33 @@ class OwnerCog(commands.Cog, name="Owner Commands"):
         await self.bot.logout()
         sys.exit(0)
 
+    @commands.command(name='httpstats', hidden=True)
+    @commands.is_owner()
+    async def http_stats(self, ctx, count: int = 10):
+        """Command which shows what conditional requests saved, per endpoint."""
+        lines = []
+        for endpoint, stats in self.bot.web.savings()[:count]:
+            lines.append(
+                "`{}` {} requests · {} not modified · {} saved of {} · "
+                "{:.2f}s parsing saved".format(
+                    endpoint[-60:],
+                    stats['requests'],
+                    stats['not_modified'],
+                    self._size(stats['bytes_saved']),
+                    self._size(stats['bytes'] + stats['bytes_saved']),
+                    stats['parse_saved'],
+                )
+            )
+        await ctx.send("\n".join(lines)[:2000] or "Nothing fetched yet")
+
+    @staticmethod
+    def _size(num):
+        for unit in ('B', 'KB', 'MB'):
+            if num < 1024:
+                return f"{num:.0f} {unit}"
+            num /= 1024
+        return f"{num:.1f} GB"
+
     # @commands.command(hidden=True)
     # @commands.is_owner()
     # async def restart(self, ctx):
@@ -1,18 +1,28 @@
 # coding=utf-8
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import asyncio
+import functools
 import logging
-import pickle
-import shlex
+import time
 
-import aiohttp
 import coloredlogs
 import pendulum
-import requests
 
 import discord
 from discord.ext import commands, tasks
-from discord.utils import get
+
+from utils.dedupe import DedupeStore
+from utils.games import StatsAPIAdapter
+from utils.live import LEAGUE_FEEDS, LiveEngine
+from utils.options import Option, OptionParser
+from utils.projection import fields, project
+from utils.subscriptions import EVENTS, SubscriptionIndex
+from utils.tracker import (
+    DELAYED, FINAL, LIVE, POSTPONED, SCHEDULED, WARMUP, GameDelayed,
+    GameFinal, GameLive, GamePostponed, GameTracker, GameWarmup, LeadChanged,
+    PlaysSeen, ScoreChanged, ScoringPlay)
+from utils.web import max_age
 
 
 LOGGER = logging.getLogger(__name__)
@@ -55,9 +65,60 @@ class ScoresCog(commands.Cog, name="Scores"):
         self.date = pendulum.today()
         self.api_date = self.date.format("YYYY-MM-DD")
 
-        self.mlb_json = self.fetch_json_requests(self.base_mlb_url.format(
-            date=self.api_date
-        ))
+        self.mlb_pbp_url = (
+            "https://statsapi.mlb.com/api/v1/game/{gid}/playByPlay"
+        )
+        self.mlb_diff_url = (
+            "https://statsapi.mlb.com/api/v1.1/game/{gid}/feed/live/diffPatch"
+            "?startTimecode={timecode}"
+        )
+        self.mlb_timestamps_url = (
+            "https://statsapi.mlb.com/api/v1.1/game/{gid}/feed/live/timestamps"
+        )
+        self.mlb_boxscore_url = (
+            "https://statsapi.mlb.com/api/v1/game/{gid}/boxscore"
+        )
+
+        # live game polling runs concurrently, capped at poll_concurrency
+        # games in flight, each given poll_timeout seconds
+        self.poll_concurrency = int(
+            self.bot.environs.get("SCORES_MAX_CONCURRENCY", 6))
+        self.poll_timeout = float(
+            self.bot.environs.get("SCORES_POLL_TIMEOUT", 8))
+        self.poll_limit = asyncio.Semaphore(self.poll_concurrency)
+        # polls a scoring play's alert gets before it's skipped
+        self.play_retries = 3
+        self.tick_stats = {'last': 0.0, 'worst': 0.0, 'ticks': 0}
+
+        # _check_games only wakes up every `tick` seconds to poll the games
+        # that are due; each game picks its own next poll from what's going
+        # on in it. Upstream hints (Cache-Control max-age, the feed's
+        # metaData.wait) are a floor on these.
+        self.tick = 5
+        self.poll_delays = {
+            'pregame': 60,  # warmup, waiting on lineups
+            'live': 10,
+            'late': 5,      # 8th inning on
+            'break': 45,    # between half innings
+            'delay': 120,   # in-game (rain) delay
+        }
+        # the schedule is fetched often while games are on or about to be,
+        # and backs off toward max_check otherwise
+        self.schedule_delays = {'active': 15, 'soon': 30}
+        self.schedule_soon = 30 * 60
+        self.schedule_hints = {}
+
+        # filled in by the first _check_date run, which starts right away;
+        # only the bits of the schedule the tracker looks at are kept, plus
+        # the status, score and inning that keep followed games' states
+        # current without refetching their live feeds
+        self.mlb_json = None
+        self.schedule_fields = fields(dates=fields(games=fields(
+            'gamePk', 'gameDate', 'gameUtils',
+            status=fields('abstractGameState', 'detailedState'),
+            teams=fields(away=fields('score'), home=fields('score')),
+            linescore=fields('currentInning', 'inningState'),
+        )))
 
         self.states = {
             'live': ['isLive', 'isWarmup'],
@@ -66,128 +127,497 @@ class ScoresCog(commands.Cog, name="Scores"):
             'final': ['isFinal'],
         }
 
+        # tracker state lives in the 'scores' record, one field per piece
         try:
-            _ = pickle.loads(self.bot.db.get('scores_db'))
+            _ = self.bot.store.load('scores')
         except Exception as err:
             LOGGER.debug(err)
             _ = {}
 
-        self.monitored = _.get('monitored', {})
+        # which channels get which alerts; channels saved before there were
+        # filters keep getting what they got then, every MLB alert
+        if 'subscriptions' in _:
+            self.subscriptions = SubscriptionIndex.restore(_['subscriptions'])
+        else:
+            self.subscriptions = SubscriptionIndex()
+            for cid in _.get('monitored', []):
+                self.subscriptions.add(cid, 'MLB')
+        self.subscription_options = OptionParser(
+            Option('--league'), Option('--team'),
+            Option('--event', choices=EVENTS))
+        # which phase every game is in, and the scoring plays already seen,
+        # are replayed from the event log
+        self.tracker = GameTracker.restore(_.get('events'))
         self.mlb_games = _.get('mlb_games', {})
-        self.games_start = _.get('games_start', [])
-        self.games_end = _.get('games_end', [])
-        self.games_ppd = _.get('games_ppd', [])
-        self.dupes = _.get('dupes', [])
-
-        #     self.monitored = _.get('monitored')
-        #     self.mlb_games = {}
-        #     self.games_start = []
-        #     self.games_end = []
-        #     self.games_ppd = []
-        #     self.dupes = []
-        # except Exception as e:
-        #     LOGGER.debug(e)
-        #     pass
-
-        self._parse_mlb_json_into_gameIDs()
+        for gid, game in self.mlb_games.items():
+            emitted = game.get('cursor', {}).pop('emitted', None)
+            if emitted:
+                # saved before there was an event log, by a game that was
+                # already being followed
+                self.tracker.record(PlaysSeen(gid, emitted))
+                game['started'] = True
+        # saved as alerts go out, so a restart (even an unclean one) doesn't
+        # re-announce anything
+        self.dupes = DedupeStore.restore(_.get('dupes'))
+
+        # alerts go out from here, whichever timer noticed the change
+        for event_type, handler in (
+                (GameWarmup, self._game_started),
+                (GameLive, self._game_started),
+                (GameDelayed, self._game_delayed),
+                (GameFinal, self._announce_final),
+                (GamePostponed, self._game_postponed),
+                (ScoringPlay, self._announce_play)):
+            self.tracker.subscribe(event_type, handler)
+
+        # the other leagues are followed off their scoreboards, all on the
+        # _check_leagues loop, see utils/live.py; SCORES_MAX_QPS bounds
+        # their requests and the MLB ones made here together
+        leagues = [
+            league.strip().upper() for league in self.bot.environs.get(
+                "SCORES_LEAGUES", "NHL,NBA,NFL").split(",")
+            if league.strip().upper() in LEAGUE_FEEDS
+        ]
+        self.live = LiveEngine(
+            {league: LEAGUE_FEEDS[league] for league in leagues},
+            self.bot.web,
+            trackers={
+                league: GameTracker.restore(_.get(f"events:{league.lower()}"))
+                for league in leagues
+            },
+            max_qps=float(self.bot.environs.get("SCORES_MAX_QPS", 4)),
+        )
+        for league, tracker in self.live.trackers.items():
+            alerts = self.live.feeds[league].alerts
+            for kind, event_type, handler in (
+                    ('score', ScoreChanged, self._announce_score),
+                    ('lead', LeadChanged, self._announce_lead),
+                    ('final', GameFinal, self._announce_league_final)):
+                if kind in alerts:
+                    tracker.subscribe(
+                        event_type, functools.partial(handler, league))
 
         self._check_date.start()
         self._check_games.start()
+        self._check_leagues.start()
 
 
     def cog_unload(self):
         try:
-            del self.mlb_json
-            _ = {
-                'monitored': self.monitored,
-                'mlb_games': self.mlb_games,
-                'games_start': self.games_start,
-                'games_ppd': self.games_ppd,
-                'games_end': self.games_end,
-                'dupes': self.dupes,
-            }
-            __ = pickle.dumps(_)
-            self.bot.db.set('scores_db', __)
+            self.bot.store.update('scores', {
+                'mlb_games': self._saved_games(),
+                'events': self.tracker.snapshot(),
+                'dupes': self.dupes.snapshot(),
+            })
+            for league in self.live.trackers:
+                self._save_league_events(league)
+            self.bot.store.flush_now()
         except Exception as err:
             LOGGER.error(f"[1] {err}")
             pass
-        del self.monitored
+        del self.subscriptions
         del self.mlb_games
         del self.mlb_json
-        del self.games_start
-        del self.games_end
-        del self.games_ppd
+        del self.tracker
         del self.dupes
         self._check_date.cancel()
         self._check_games.cancel()
+        self._check_leagues.cancel()
 
 
     def _get_emoji(self, guild_query, emoji_query, mode=None):
-        emoji_name = f"{guild_query.lower()}_{emoji_query.lower()}"
-        guild = get(self.bot.guilds, name=guild_query.lower())
-        if not guild:
-            return ""
-        emoji = get(guild.emojis, name=emoji_name)
-        if not emoji:
-            return ""
+        emoji_name = f"{guild_query}_{emoji_query}"
         if mode == "url":
-            emoji = emoji.url
-        else:
-            emoji = "{} ".format(emoji)
-        return emoji
-
-
-    def _parse_mlb_json_into_gameIDs(self):
+            return self.bot.emoji_index.url(guild_query, emoji_name)
+        emoji = self.bot.emoji_index.get(guild_query, emoji_name)
+        return "{} ".format(emoji) if emoji else ""
+
+
+
+    def _phase_of(self, utils):
+        """Tracker phase for a schedule entry's gameUtils flags"""
+        def _states(state):
+            return any(utils.get(key) for key in self.states[state])
+
+        live, ppd, delay, final = (
+            _states(state) for state in ('live', 'ppd', 'delay', 'final'))
+        if live and not ppd and not final:
+            if delay:
+                return DELAYED
+            return LIVE if utils.get('isLive') else WARMUP
+        if ppd and not delay and not final:
+            return POSTPONED
+        if delay and not ppd:
+            return DELAYED
+        if final:
+            return FINAL
+        return SCHEDULED
+
+
+    async def _parse_mlb_json_into_gameIDs(self):
+        """Hand today's schedule to the tracker; only games whose phase
+        changed turn into events, and alerts come from their subscribers
+        """
         if not self.mlb_json:
             return
+        listed = set()
+        events = []
         for game in self.mlb_json['dates'][0]['games']:
+            gid = str(game['gamePk'])
+            listed.add(gid)
+            followed = self.mlb_games.get(gid)
+            if followed and followed.get('state'):
+                StatsAPIAdapter.apply_schedule(followed['state'], game)
+            event = self.tracker.observe(
+                gid, self._phase_of(game['gameUtils']))
+            if event:
+                events.append(event)
+
+        # games that dropped off the schedule (yesterday's) are forgotten
+        gone = set(self.tracker.phases) - listed
+        if gone:
+            self.tracker.forget(gone)
+            for gid in gone:
+                self.mlb_games.pop(gid, None)
 
-            def _states(state):
-                return [game['gameUtils'].get(key) for key in self.states[state]]
+        for event in events:
+            await self.tracker.publish(event)
+        if events or gone:
+            self._save_events()
 
-            gid = str(game['gamePk'])
 
-            if any(_states('live')) and not any(_states('ppd')) and not any(_states('final')):
-                if not self.mlb_games.get(gid):
-                    self.mlb_games[gid] = {'check': True}
-                    self.games_start.append(gid)
-                else:
-                    self.mlb_games[gid]['check'] = True
-                # if not self.mlb_games[gid].get('full_json'):
-                self.mlb_games[gid]['full_json'] = self.fetch_json_requests(
-                    f"https://statsapi.mlb.com/api/v1.1/game/{gid}/feed/live"
-                )
-            elif any(_states('ppd')) and not any(_states('delay')) and not any(_states('final')):
-                if not self.mlb_games.get(gid):
-                    # self.mlb_games[gid] = {'check': False}
-                    # self.games_ppd.append(gid)
-                    continue
-                # else:
-                #     self.mlb_games[gid]['check'] = False
-                # self.mlb_games[gid]['ppd'] = True
-                self.games_ppd.append(gid)
-                self.mlb_games.pop(gid, None)
-            elif any(_states('delay')) and not any(_states('ppd')):
-                if not self.mlb_games.get(gid):
-                    self.mlb_games[gid] = {'check': False}
-                    # self.games_ppd.append(gid)
-                else:
-                    self.mlb_games[gid]['check'] = False
-                self.mlb_games[gid]['delay'] = True
-            elif any(_states('final')):
-                self.mlb_games.pop(gid, None)
-                self.games_end.append(gid)
-            else:
-                for stale_game in self.mlb_games.copy():
-                    if not self.mlb_games.get(stale_game):
+    async def _refresh_state(self, gid):
+        """Boil the game's live feed down to a GameState; the last good one
+        is kept if this fetch fails
+
+        The feed (hundreds of KB) is only fetched when a game starts, or
+        when a followed game is polled (or ends) without a state, as after a
+        restart. From then on the schedule keeps the score and inning current,
+        _refresh_pitches the pitch counts, and the state goes with the game
+        at final.
+        """
+        feed = await self.fetch_json_or_none(
+            f"https://statsapi.mlb.com/api/v1.1/game/{gid}/feed/live"
+        )
+        game = self.mlb_games.setdefault(gid, {'check': False})
+        if feed:
+            game['state'] = StatsAPIAdapter.from_feed(feed)
+        return game.get('state')
+
+
+    async def _game_started(self, event):
+        """Warmup or first pitch: start polling, and announce the game the
+        first time it gets here
+        """
+        game = self.mlb_games.setdefault(event.gid, {'check': False})
+        game['check'] = True
+        game['in_delay'] = False
+        if not game.get('started'):
+            game['started'] = True
+            await self._announce_start(event.gid, game)
+
+
+    def _game_delayed(self, event):
+        # a game that was being polled keeps being polled, just slower
+        game = self.mlb_games.setdefault(event.gid, {'check': False})
+        game['in_delay'] = True
+
+
+    def _game_postponed(self, event):
+        self.mlb_games.pop(event.gid, None)
+
+
+    async def _announce_start(self, gid, game):
+        state = game.get('state') or await self._refresh_state(gid)
+        if not state:
+            return
+        away = state.away
+        home = state.home
+        away_lineup = []
+        home_lineup = []
+        for team, lineup in ((away, away_lineup), (home, home_lineup)):
+            for idx, (name, position) in enumerate(team.lineup):
+                lineup.append("{}. {} ({})".format(
+                    idx + 1, name, position))
+            if team.starter:
+                lineup.append("SP: {} ({})".format(*team.starter))
+        weather = (
+            "**Weather Report**\n"
+            "🌡 {temp}°F\n"
+            "🪟 Conditions: {condition}\n"
+            "💨 Wind: {wind}"
+        ).format(**state.weather)
+        venue = (
+            "**Location**\n"
+            "__{name}__ {location}\n"
+            "{details}"
+        ).format(
+            name=state.venue.get('name', 'UNK'),
+            location="{city} {stateAbbrev}".format(**state.venue.get('location', {})),
+            details="🏟 {capacity:,} / {roofType} / {turfType}".format(
+                **state.venue.get('fieldInfo', {})
+            )
+        )
+        away_emoji = self._get_emoji('mlb', away.abbreviation)
+        home_emoji = self._get_emoji('mlb', home.abbreviation)
+        embed = discord.Embed(
+            title="{}{} ({}) @ {}{} ({}) is _starting soon_".format(
+                away_emoji,
+                away.name,
+                "{}-{} {}".format(
+                    away.wins, away.losses, away.pct),
+                home_emoji,
+                home.name,
+                "{}-{} {}".format(
+                    home.wins, home.losses, home.pct),
+            ),
+            color=0x80AC5F,
+            description="\n".join([weather, venue]),
+        )
+        embed.add_field(
+            name="`{} Lineup`".format(away.abbreviation),
+            value="\n".join(away_lineup)
+        )
+        embed.add_field(
+            name="`{} Lineup`".format(home.abbreviation),
+            value="\n".join(home_lineup)
+        )
+        message = (
+            "{} ({}) @ {} ({}) is **starting soon**\n"
+            "{} Lineup: {}\n"
+            "{} Lineup: {}"
+        ).format(
+            away.name,
+            "{}-{} {}".format(away.wins, away.losses, away.pct),
+            home.name,
+            "{}-{} {}".format(home.wins, home.losses, home.pct),
+            away.abbreviation, " ".join(away_lineup),
+            home.abbreviation, " ".join(home_lineup),
+        )
+        if not self.dupes.seen(gid, message):
+            self.bot.broadcaster.broadcast(
+                self._route('MLB', state, 'start'), embed)
+            self.dupes.add(gid, message)
+            self._save_dupes()
+
+
+    async def _announce_final(self, event):
+        gid = event.gid
+        game = self.mlb_games.get(gid)
+        # games that were over before we started following them stay quiet
+        if not game or not game.get('started'):
+            self.mlb_games.pop(gid, None)
+            return
+        state = game.get('state') or await self._refresh_state(gid)
+        self.mlb_games.pop(gid, None)
+        if not state:
+            return
+        message = " is ending"
+        # SD 2 [H5 E0 LOB6] @ TEX 0 [H5 E0 LOB10] is final! 9/F (W: Craig Stammen (4.05/1-1) L: Mike Foltynewicz (4.09/0-2) S: Mark Melancon (0.00/5-0))
+        away_team = state.away.name
+        away_score = state.away.score
+        home_team = state.home.name
+        home_score = state.home.score
+        inning = state.period
+        away_emoji = self._get_emoji('mlb', state.away.abbreviation)
+        home_emoji = self._get_emoji('mlb', state.home.abbreviation)
+        if away_score > home_score:
+            away_team = f"**{away_team}"
+            away_score = f"{away_score}**"
+        elif home_score > away_score:
+            home_team = f"**{home_team}"
+            home_score = f"{home_score}**"
+        embed = discord.Embed(
+            description="{}{} {} @ {}{} {} is final! {}/F".format(
+                away_emoji,
+                away_team,
+                away_score,
+                home_emoji,
+                home_team,
+                home_score,
+                inning
+            ),
+            color=0xD0021B
+        )
+        if not self.dupes.seen(gid, message):
+            self.bot.broadcaster.broadcast(
+                self._route('MLB', state, 'final'), embed)
+            self.dupes.add(gid, message)
+            self._save_dupes()
+
+
+    def _announce_play(self, event):
+        gid = event.gid
+        game = self.mlb_games.get(gid)
+        state = game.get('state') if game else None
+        if not state:
+            return
+        scoring_play = event.play
+        away = state.away.abbreviation
+        home = state.home.abbreviation
+        halfInning = {
+            'bottom': '⬇',
+            'top': '⬆',
+        }
+        homer = False
+        event = ""
+        if scoring_play['result'].get('event'):
+            event = "{} · ".format(scoring_play['result']['event'].upper())
+            homer = True if scoring_play['result']['eventType'] == "home_run" else False
+        if homer:
+            hit_details = ""
+            for play in scoring_play['playEvents']:
+                if play.get('hitData'):
+                    try:
+                        hit_details = "**{launchSpeed} mph** · ∡{launchAngle}° · **{totalDistance} ft**".format(
+                            **play['hitData']
+                        )
+                    except KeyError as err:
+                        LOGGER.error(f"[2] {err}")
                         continue
-                    if str(stale_game) not in [str(x.get('gamePk')) for x in self.mlb_json['dates'][0]['games']]:
-                        self.mlb_games.pop(str(stale_game), None)
-                self.mlb_games.pop(gid, None)
+                    break
+        else:
+            hit_details = ""
+        message = "{} {} - {}{}{}".format(
+            halfInning.get(scoring_play['about']['halfInning']),
+            self.make_ordinal(scoring_play['about']['inning']),
+            event,
+            scoring_play['result'].get('description', 'Error fetching scoring details'),
+            hit_details,
+        )
+        away_emoji = self._get_emoji('mlb', away)
+        home_emoji = self._get_emoji('mlb', home)
+        scoring_team = ""
+        scoring_team_emoji_url = ""
+        if state:
+            if scoring_play['about']['halfInning'] == "bottom":
+                home_tag = "**"
+                away_tag = ""
+                scoring_team = "{} · ".format(home)
+                scoring_team_emoji_url = self._get_emoji('mlb', home, 'url')
+            else:
+                home_tag = ""
+                away_tag = "**"
+                scoring_team = "{} · ".format(away)
+                scoring_team_emoji_url = self._get_emoji('mlb', away, 'url')
+            # linescore = game.get('full_json', {}) \
+            #                 .get('liveData', {}) \
+            #                 .get('linescore', {})
+            message = "{}{} {}{} @ {}{} {}{} - {}".format(
+                away_tag,
+                away,
+                # linescore['teams']['away']['runs'],
+                scoring_play['result'].get('awayScore', 0),
+                away_tag,
+                home_tag,
+                home,
+                # linescore['teams']['home']['runs'],
+                scoring_play['result'].get('homeScore', 0),
+                home_tag,
+                message,
+            )
+        scoring_player = [scoring_play['matchup']['batter']['id'], scoring_play['matchup']['batter']['fullName']]
+        pitcher_id = scoring_play['matchup']['pitcher']['id']
+        num_pitches = state.pitches.get(pitcher_id, 0)
+        pitcher = "{}{}".format(
+            scoring_play['matchup']['pitcher']['fullName'],
+            " (pitch #{})".format(
+                num_pitches
+            ),
+        )
+        line = "{0}{8}{1} {2}{0} @ {3}{9}{4} {5}{3} {6} {7}".format(
+            away_tag,
+            away,
+            scoring_play['result'].get('awayScore', 0),
+            home_tag,
+            home,
+            scoring_play['result'].get('homeScore', 0),
+            halfInning.get(scoring_play['about']['halfInning']),
+            self.make_ordinal(scoring_play['about']['inning']),
+            away_emoji,
+            home_emoji
+        )
+        embed = discord.Embed(
+            description="{}\n{}".format(
+                line,
+                scoring_play['result'].get('description', 'Error fetching scoring details'),
+            ),
+            color=0xFFFFFF,
+            # timestamp=pendulum.now(),
+        )
+        embed.set_thumbnail(
+            url=scoring_team_emoji_url
+        )
+        embed.set_author(
+            name="{play_type}{team}{player}".format(
+                play_type=event,
+                team=scoring_team,
+                player=scoring_player[1]
+            ),
+            icon_url="https://img.mlbstatic.com/mlb-photos/image/upload/w_124,q_auto:best/v1/people/{player_id}/headshot/83/current".format(
+                player_id=scoring_player[0]
+            )
+        )
+        embed.add_field(
+            name="`vs`",
+            value=pitcher,
+            inline=True
+        )
+        # embed_json = {
+        #     "embed": {
+        #         # "title": "{0}{1} {2}{0} @ {3}{4} {5}{3} {6} {7}".format(
+        #         #     away_tag,
+        #         #     away,
+        #         #     scoring_play['result'].get('awayScore', 0),
+        #         #     home_tag,
+        #         #     home,
+        #         #     scoring_play['result'].get('homeScore', 0),
+        #         #     halfInning.get(scoring_play['about']['halfInning']),
+        #         #     self.make_ordinal(scoring_play['about']['inning']),
+        #         # ),
+        #         # "description": scoring_play['result']['description'],
+        #         # "color": 13632027,
+        #         # "timestamp": pendulum.now().to_iso8601_string,
+        #         # "thumbnail": {
+        #         #     "url": "https://img.mlbstatic.com/mlb-photos/image/upload/w_124,q_auto:best/v1/people/{player_id}/headshot/83/current".format(
+        #         #         player_id=scoring_player[0]
+        #         #     )
+        #         # },
+        #         # "author": {
+        #         #     # "name": "{play_type}{team}{player}".format(
+        #         #     #     play_type=event,
+        #         #     #     team=scoring_team,
+        #         #     #     player=scoring_player[1]
+        #         #     # )
+        #         # },
+        #         "fields": [
+        #             {
+        #                 "name": "`vs`",
+        #                 "value": pitcher,
+        #                 "inline": True
+        #             }
+        #         ]
+        #     }
+        # }
+        if homer:
+            embed.add_field(
+                name="`StatCast`",
+                value=hit_details,
+                inline=True
+            )
+        # LOGGER.debug(embed_json)
+        # embed = discord.Embed.from_dict(embed_json)
+        if not self.dupes.seen(gid, message):
+            self.bot.broadcaster.broadcast(self._route(
+                'MLB', state, 'score', *(('homerun',) if homer else ())),
+                embed)
+            self.dupes.add(gid, message)
+            self._save_dupes()
 
 
     @tasks.loop(seconds=10)
     async def _check_games(self):
+        started = time.monotonic()
         try:
             LOGGER.info("--------------------------------------")
             # now = pendulum.now().format("DD-MMM HH:mm:ss")
@@ -195,431 +625,290 @@ class ScoresCog(commands.Cog, name="Scores"):
 
             if not self.mlb_games:
                 old_interval = self._check_games.seconds
-                if old_interval <= self.max_check:
-                    new_interval = max(10, min(old_interval + 10, self.max_check))
+                if old_interval < self.max_check:
+                    new_interval = max(self.tick, min(old_interval + 10, self.max_check))
                     self._check_games.change_interval(seconds=new_interval)
-                    self._check_date.change_interval(seconds=new_interval)
-                    LOGGER.debug("no games, back off timers [{}s -> {}s]".format(
+                    LOGGER.debug("no games, back off timer [{}s -> {}s]".format(
                         old_interval,
                         new_interval,
                     ))
                 else:
-                    LOGGER.debug("no games, timers maxed out [{}s]".format(
+                    LOGGER.debug("no games, timer maxed out [{}s]".format(
                         self.max_check
                     ))
                 return
             else:
                 old_interval = self._check_games.seconds
-                if old_interval != 10:
-                    self._check_games.change_interval(seconds=10)
-                    self._check_date.change_interval(seconds=10)
-                    LOGGER.debug("new games, resetting timers [10s]")
-
-            # check starting games
-            for gid in self.games_start.copy():
-                if not self.mlb_games.get(gid):
+                if old_interval != self.tick:
+                    self._check_games.change_interval(seconds=self.tick)
+                    LOGGER.debug(f"new games, resetting timer [{self.tick}s]")
+
+            # check ongoing games that are due, polling all of them at once
+            # so one slow game doesn't hold up the rest
+            now = time.time()
+            polling = [
+                (gid, game) for gid, game in self.mlb_games.copy().items()
+                if game and game.get('check')
+                and game.get('next_poll', 0) <= now
+            ]
+            results = await asyncio.gather(*[
+                self._poll_game(gid, game) for gid, game in polling
+            ])
+            for (gid, game), plays in zip(polling, results):
+                phase, delay = self._poll_delay(game)
+                game['next_poll'] = time.time() + delay
+                LOGGER.debug(f"[{gid}] {phase}, next poll in {delay}s")
+                if not plays or not game.get('state'):
+                    # without a state there's nothing to describe the plays
+                    # with yet, they'll still be new next time
                     continue
-                data = self.mlb_games[gid].get('full_json')
-                if not data:
-                    continue
-                gd = data['gameData']
-                away = gd['teams']['away']
-                home = gd['teams']['home']
-                away_lineup = []
-                home_lineup = []
-                away_players = data['liveData']['boxscore']['teams']['away']
-                home_players = data['liveData']['boxscore']['teams']['home']
-                for idx, player in enumerate(away_players['battingOrder']):
-                    pd = away_players['players'].get("ID{}".format(player))
-                    away_lineup.append("{}. {} ({})".format(
-                        idx + 1,
-                        pd['person']['fullName'],
-                        pd['position']['abbreviation'],
-                    ))
-                away_pitcher = gd['probablePitchers']['away']['id']
-                home_pitcher = gd['probablePitchers']['home']['id']
-                away_lineup.append("SP: {} ({})".format(
-                    away_players['players'].get(f"ID{away_pitcher}")['person']['fullName'],
-                    away_players['players'].get(f"ID{away_pitcher}")['seasonStats']['pitching']['era'],
-                ))
-                for idx, player in enumerate(home_players['battingOrder']):
-                    pd = home_players['players'].get("ID{}".format(player))
-                    home_lineup.append("{}. {} ({})".format(
-                        idx + 1,
-                        pd['person']['fullName'],
-                        pd['position']['abbreviation'],
-                    ))
-                home_lineup.append("SP: {} ({})".format(
-                    home_players['players'].get(f"ID{home_pitcher}")['person']['fullName'],
-                    home_players['players'].get(f"ID{home_pitcher}")['seasonStats']['pitching']['era'],
-                ))
-                weather = (
-                    "**Weather Report**\n"
-                    "🌡 {temp}°F\n"
-                    "🪟 Conditions: {condition}\n"
-                    "💨 Wind: {wind}"
-                ).format(**gd.get('weather', {}))
-                venue = (
-                    "**Location**\n"
-                    "__{name}__ {location}\n"
-                    "{details}"
-                ).format(
-                    name=gd.get('venue', {}).get('name', 'UNK'),
-                    location="{city} {stateAbbrev}".format(**gd.get('venue', {}).get('location', {})),
-                    details="🏟 {capacity:,} / {roofType} / {turfType}".format(
-                        **gd.get('venue', {}).get('fieldInfo', {})
-                    )
-                )
-                away_emoji = self._get_emoji('mlb', away['abbreviation'])
-                home_emoji = self._get_emoji('mlb', home['abbreviation'])
-                embed = discord.Embed(
-                    title="{}{} ({}) @ {}{} ({}) is _starting soon_".format(
-                        away_emoji,
-                        away['teamName'],
-                        "{}-{} {}".format(
-                            away.get('record', {}).get('wins', 0),
-                            away.get('record', {}).get('losses', 0),
-                            away.get('record', {}).get('winningPercentage', '.000'),
-                        ),
-                        home_emoji,
-                        home['teamName'],
-                        "{}-{} {}".format(
-                            home.get('record', {}).get('wins', 0),
-                            home.get('record', {}).get('losses', 0),
-                            home.get('record', {}).get('winningPercentage', '.000'),
-                        ),
-                    ),
-                    color=0x80AC5F,
-                    description="\n".join([weather, venue]),
-                )
-                embed.add_field(
-                    name="`{} Lineup`".format(away['abbreviation']),
-                    value="\n".join(away_lineup)
-                )
-                embed.add_field(
-                    name="`{} Lineup`".format(home['abbreviation']),
-                    value="\n".join(home_lineup)
-                )
-                message = (
-                    "{} ({}) @ {} ({}) is **starting soon**\n"
-                    "{} Lineup: {}\n"
-                    "{} Lineup: {}"
-                ).format(
-                    away['teamName'],
-                    "{}-{} {}".format(
-                        away.get('record', {}).get('wins', 0),
-                        away.get('record', {}).get('losses', 0),
-                        away.get('record', {}).get('winningPercentage', '.000'),
-                    ),
-                    home['teamName'],
-                    "{}-{} {}".format(
-                        home.get('record', {}).get('wins', 0),
-                        home.get('record', {}).get('losses', 0),
-                        home.get('record', {}).get('winningPercentage', '.000'),
-                    ),
-                    away['abbreviation'], " ".join(away_lineup),
-                    home['abbreviation'], " ".join(home_lineup),
-                )
-                msg_hash = hash(gid + message)
-                if msg_hash not in self.dupes:
-                    for channel in self.monitored:
-                        try:
-                            await self.bot.get_channel(channel).send(embed=embed)
-                        except AttributeError as err:
-                            LOGGER.error(f"[3c] {err}")
-                            pass
-                    self.dupes.append(msg_hash)
-                self.games_start.remove(gid)
-
-            # check ending games
-            for gid in self.games_end.copy():
-                if not self.mlb_games.get(gid):
-                    continue
-                data = self.mlb_games[gid].get('full_json')
-                if not data:
-                    continue
-                message = " is ending"
-                # SD 2 [H5 E0 LOB6] @ TEX 0 [H5 E0 LOB10] is final! 9/F (W: Craig Stammen (4.05/1-1) L: Mike Foltynewicz (4.09/0-2) S: Mark Melancon (0.00/5-0))
-                away_team = data['gameData']['teams']['away']['teamName']
-                away_score = data['liveData']['linescore']['teams']['away']['runs']
-                home_team = data['gameData']['teams']['home']['teamName']
-                home_score = data['liveData']['linescore']['teams']['home']['runs']
-                inning = data['liveData']['linescore']['currentInning']
-                away_emoji = self._get_emoji('mlb', data['gameData']['teams']['away']['abbreviation'])
-                home_emoji = self._get_emoji('mlb', data['gameData']['teams']['home']['abbreviation'])
-                if away_score > home_score:
-                    away_team = f"**{away_team}"
-                    away_score = f"{away_score}**"
-                elif home_score > away_score:
-                    home_team = f"**{home_team}"
-                    home_score = f"{home_score}**"
-                embed = discord.Embed(
-                    description="{}{} {} @ {}{} {} is final! {}/F".format(
-                        away_emoji,
-                        away_team,
-                        away_score,
-                        home_emoji,
-                        home_team,
-                        home_score,
-                        inning
-                    ),
-                    color=0xD0021B
-                )
-                msg_hash = hash(gid + message)
-                if msg_hash not in self.dupes:
-                    for channel in self.monitored:
-                        try:
-                            await self.bot.get_channel(channel).send(embed=embed)
-                        except AttributeError as err:
-                            LOGGER.error(f"[3b] {err}")
-                            pass
-                    self.dupes.append(msg_hash)
-                self.games_end.remove(gid)
-
-            # check ongoing games
-            for gid, game in self.mlb_games.copy().items():
-                if not self.mlb_games.get(gid):
-                    continue
-                if not self.mlb_games[gid].get('check'):
-                    continue
-                LOGGER.debug(f"fetching json for {gid}")
-                new_json = await self.fetch_json(
-                    f"http://statsapi.mlb.com/api/v1/game/{gid}/playByPlay"
-                )
-                self.mlb_games[gid]['new_json'] = new_json
-                if not game.get('old_json'):
-                    self.mlb_games[gid]['old_json'] = new_json.copy()
-
-            for gid, game in self.mlb_games.copy().items():
-                if not self.mlb_games.get(gid):
-                    continue
-                if not game.get('check'):
-                    continue
-
-                old_plays = game['old_json']['scoringPlays']
-                new_plays = game['new_json']['scoringPlays']
-                swap = False
-                if old_plays == new_plays:
-                    swap = False
-                    continue
-                else:
-                    swap = True
-                    # LOGGER.debug(old_plays)
-                    # LOGGER.debug(new_plays)
-                    # LOGGER.debug(old_plays + new_plays)
-                    all_plays = old_plays + new_plays
-                    scoring_plays = [play for play in all_plays if all_plays.count(play) == 1]
+                scoring_plays = self._new_scoring_plays(gid, game, plays)
+                if scoring_plays:
                     LOGGER.debug(scoring_plays)
-                    # scoring_plays = set(old_plays + new_plays)
-
-                for idx in scoring_plays:
-                    scoring_play = game['new_json']['allPlays'][idx]
-                    # details = None
-                    # for gd in self.mlb_json['dates'][0]['games'].copy():
-                    #     if int(gd['gamePk']) == int(gid):
-                    #         details = gd
-                    #         LOGGER.debug((
-                    #             "{}\t[{}] found details ... "
-                    #             "mlb_json['{}'] ... {}").format(
-                    #                 now,
-                    #                 gid,
-                    #                 gd['gamePk'],
-                    #                 (int(gd['gamePk']) == int(gid)),
-                    #             ))
-                    #         break
-                    details = game.get('full_json', {}).get('gameData', {})
-                    halfInning = {
-                        'bottom': '⬇',
-                        'top': '⬆',
-                    }
-                    homer = False
-                    event = ""
-                    if scoring_play['result'].get('event'):
-                        event = "{} · ".format(scoring_play['result']['event'].upper())
-                        homer = True if scoring_play['result']['eventType'] == "home_run" else False
-                    if homer:
-                        hit_details = ""
-                        for play in scoring_play['playEvents']:
-                            if play.get('hitData'):
-                                try:
-                                    hit_details = "**{launchSpeed} mph** · ∡{launchAngle}° · **{totalDistance} ft**".format(
-                                        **play['hitData']
-                                    )
-                                except KeyError as err:
-                                    LOGGER.error(f"[2] {err}")
-                                    continue
-                                break
-                    else:
-                        hit_details = ""
-                    message = "{} {} - {}{}{}".format(
-                        halfInning.get(scoring_play['about']['halfInning']),
-                        self.make_ordinal(scoring_play['about']['inning']),
-                        event,
-                        scoring_play['result'].get('description', 'Error fetching scoring details'),
-                        hit_details,
-                    )
-                    away_emoji = self._get_emoji('mlb', details['teams']['away']['abbreviation'])
-                    home_emoji = self._get_emoji('mlb', details['teams']['home']['abbreviation'])
-                    scoring_team = ""
-                    scoring_team_emoji_url = ""
-                    if details:
-                        if scoring_play['about']['halfInning'] == "bottom":
-                            home_tag = "**"
-                            away_tag = ""
-                            scoring_team = "{} · ".format(details['teams']['home']['abbreviation'])
-                            scoring_team_emoji_url = self._get_emoji('mlb', details['teams']['home']['abbreviation'], 'url')
-                            away_or_home = "away"
-                        else:
-                            home_tag = ""
-                            away_tag = "**"
-                            scoring_team = "{} · ".format(details['teams']['away']['abbreviation'])
-                            scoring_team_emoji_url = self._get_emoji('mlb', details['teams']['away']['abbreviation'], 'url')
-                            away_or_home = "home"
-                        # linescore = game.get('full_json', {}) \
-                        #                 .get('liveData', {}) \
-                        #                 .get('linescore', {})
-                        message = "{}{} {}{} @ {}{} {}{} - {}".format(
-                            away_tag,
-                            details['teams']['away']['abbreviation'],
-                            # linescore['teams']['away']['runs'],
-                            scoring_play['result'].get('awayScore', 0),
-                            away_tag,
-                            home_tag,
-                            details['teams']['home']['abbreviation'],
-                            # linescore['teams']['home']['runs'],
-                            scoring_play['result'].get('homeScore', 0),
-                            home_tag,
-                            message,
-                        )
-                    scoring_player = [scoring_play['matchup']['batter']['id'], scoring_play['matchup']['batter']['fullName']]
-                    pitcher_id = "ID{}".format(scoring_play['matchup']['pitcher']['id'])
-                    # t = game.get('full_json')
-                    # t = t.get('liveData')
-                    # t = t.get('boxscore')
-                    # t = t.get('teams')
-                    # t = t.get(away_or_home)
-                    # t = t.get('players')
-                    # print(t, pitcher_id)
-                    # t = t.get(pitcher_id)
-                    # t = t.get('stats')
-                    # t = t.get('pitching')
-                    # t = t.get('numberOfPitches', 0)
-                    # print(t)
-                    num_pitches = game.get(
-                        'full_json', {}).get(
-                            'liveData', {}).get(
-                                'boxscore', {}).get(
-                                    'teams', {}).get(
-                                        away_or_home, {}).get(
-                                            'players', {}).get(
-                                                pitcher_id, {}).get(
-                                                    'stats', {}).get(
-                                                        'pitching', {}).get(
-                                                            'numberOfPitches', 0)
-                    pitcher = "{}{}".format(
-                        scoring_play['matchup']['pitcher']['fullName'],
-                        " (pitch #{})".format(
-                            num_pitches
-                        ),
-                    )
-                    line = "{0}{8}{1} {2}{0} @ {3}{9}{4} {5}{3} {6} {7}".format(
-                        away_tag,
-                        details['teams']['away']['abbreviation'],
-                        scoring_play['result'].get('awayScore', 0),
-                        home_tag,
-                        details['teams']['home']['abbreviation'],
-                        scoring_play['result'].get('homeScore', 0),
-                        halfInning.get(scoring_play['about']['halfInning']),
-                        self.make_ordinal(scoring_play['about']['inning']),
-                        away_emoji,
-                        home_emoji
-                    )
-                    embed = discord.Embed(
-                        description="{}\n{}".format(
-                            line,
-                            scoring_play['result'].get('description', 'Error fetching scoring details'),
-                        ),
-                        color=0xFFFFFF,
-                        # timestamp=pendulum.now(),
-                    )
-                    embed.set_thumbnail(
-                        url=scoring_team_emoji_url
-                    )
-                    embed.set_author(
-                        name="{play_type}{team}{player}".format(
-                            play_type=event,
-                            team=scoring_team,
-                            player=scoring_player[1]
-                        ),
-                        icon_url="https://img.mlbstatic.com/mlb-photos/image/upload/w_124,q_auto:best/v1/people/{player_id}/headshot/83/current".format(
-                            player_id=scoring_player[0]
-                        )
-                    )
-                    embed.add_field(
-                        name="`vs`",
-                        value=pitcher,
-                        inline=True
-                    )
-                    # embed_json = {
-                    #     "embed": {
-                    #         # "title": "{0}{1} {2}{0} @ {3}{4} {5}{3} {6} {7}".format(
-                    #         #     away_tag,
-                    #         #     details['teams']['away']['abbreviation'],
-                    #         #     scoring_play['result'].get('awayScore', 0),
-                    #         #     home_tag,
-                    #         #     details['teams']['home']['abbreviation'],
-                    #         #     scoring_play['result'].get('homeScore', 0),
-                    #         #     halfInning.get(scoring_play['about']['halfInning']),
-                    #         #     self.make_ordinal(scoring_play['about']['inning']),
-                    #         # ),
-                    #         # "description": scoring_play['result']['description'],
-                    #         # "color": 13632027,
-                    #         # "timestamp": pendulum.now().to_iso8601_string,
-                    #         # "thumbnail": {
-                    #         #     "url": "https://img.mlbstatic.com/mlb-photos/image/upload/w_124,q_auto:best/v1/people/{player_id}/headshot/83/current".format(
-                    #         #         player_id=scoring_player[0]
-                    #         #     )
-                    #         # },
-                    #         # "author": {
-                    #         #     # "name": "{play_type}{team}{player}".format(
-                    #         #     #     play_type=event,
-                    #         #     #     team=scoring_team,
-                    #         #     #     player=scoring_player[1]
-                    #         #     # )
-                    #         # },
-                    #         "fields": [
-                    #             {
-                    #                 "name": "`vs`",
-                    #                 "value": pitcher,
-                    #                 "inline": True
-                    #             }
-                    #         ]
-                    #     }
-                    # }
-                    if homer:
-                        embed.add_field(
-                            name="`StatCast`",
-                            value=hit_details,
-                            inline=True
-                        )
-                    # LOGGER.debug(embed_json)
-                    # embed = discord.Embed.from_dict(embed_json)
-                    msg_hash = hash(gid + message)
-                    if msg_hash not in self.dupes:
-                        for channel in self.monitored:
-                            try:
-                                await self.bot.get_channel(channel).send(embed=embed)
-                            except AttributeError as err:
-                                LOGGER.error(f"[3a] {err}")
-                                pass
-                        self.dupes.append(msg_hash)
-                del scoring_plays
-                if swap:
-                    self.mlb_games[gid]['old_json'] = game['new_json']
-                # self.mlb_games[gid] = game
+                    await self._refresh_pitches(gid, game)
+                if await self._publish_plays(gid, game, plays, scoring_plays):
+                    # everything up to here is handled, move the cursor on
+                    cursor = game['cursor']
+                    if 'pending' in cursor:
+                        cursor['timecode'] = cursor.pop('pending')
+                if scoring_plays:
+                    self._save_events()
         except Exception as err:
             LOGGER.error(f"[3] {err}")
             pass
+        finally:
+            self._record_tick(time.monotonic() - started)
+
+
+    async def _publish_plays(self, gid, game, plays, scoring_plays):
+        """Publish the new scoring plays in order, recording each once its
+        alert is queued with the broadcaster (which logs its own delivery
+        failures)
+
+        Returns False when one failed and should be retried next poll; the
+        plays after it wait for it. A play that fails `play_retries` polls
+        in a row is logged and skipped so it can't hold up the game's
+        alerts for good.
+        """
+        retries = game.setdefault('retries', {})
+        for idx in scoring_plays:
+            event = ScoringPlay(gid, idx, plays['allPlays'][idx])
+            try:
+                await self.tracker.publish(event, raise_errors=True)
+            except Exception as err:
+                retries[idx] = retries.get(idx, 0) + 1
+                if retries[idx] < self.play_retries:
+                    LOGGER.error(
+                        f"[{gid}] play {idx} not announced, retrying: {err}")
+                    return False
+                LOGGER.error(
+                    f"[{gid}] skipping play {idx} after {retries[idx]} "
+                    f"failed alerts: {err}")
+                self.tracker.record(PlaysSeen(gid, [idx]))
+            else:
+                self.tracker.record(event)
+            retries.pop(idx, None)
+        return True
+
+
+    async def _poll_game(self, gid, game):
+        """_poll_plays under the concurrency cap and a per-game deadline"""
+        async with self.poll_limit:
+            LOGGER.debug(f"polling plays for {gid}")
+            try:
+                return await asyncio.wait_for(
+                    self._poll_plays(gid, game), timeout=self.poll_timeout)
+            except asyncio.TimeoutError:
+                LOGGER.warning(
+                    f"[{gid}] gave up polling after {self.poll_timeout}s")
+            except Exception as err:
+                LOGGER.error(f"[{gid}] {err}")
+
+
+    async def _refresh_pitches(self, gid, game):
+        """Pitch counts out of the boxscore, a fraction of the live feed;
+        only scoring alerts show them
+        """
+        boxscore = await self.fetch_json_or_none(
+            self.mlb_boxscore_url.format(gid=gid))
+        if boxscore and game.get('state'):
+            game['state'].pitches = StatsAPIAdapter.pitch_counts(
+                boxscore.get('teams', {}))
+
+
+    def _record_tick(self, duration):
+        interval = self._check_games.seconds
+        self.tick_stats['last'] = duration
+        self.tick_stats['worst'] = max(self.tick_stats['worst'], duration)
+        self.tick_stats['ticks'] += 1
+        if duration > interval:
+            LOGGER.warning(
+                f"tick took {duration:.2f}s, longer than the {interval}s interval")
+        else:
+            LOGGER.debug(f"tick took {duration:.2f}s of {interval}s")
+
+
+    def _game_phase(self, game):
+        """Rough state of a tracked game, used to pick its poll rate"""
+        state = game.get('state')
+        if game.get('in_delay') or \
+                (state and state.detailed.startswith('Delayed')):
+            return 'delay'
+        if not state or state.state == 'pre' or not state.period:
+            return 'pregame'
+        if state.period_state in ('Middle', 'End'):
+            return 'break'
+        if state.period >= 8:
+            return 'late'
+        return 'live'
+
+
+    def _poll_delay(self, game):
+        phase = self._game_phase(game)
+        delay = self.poll_delays[phase]
+        hints = [
+            game.get('max_age'),
+            game['state'].wait if game.get('state') else None,
+        ]
+        hints = [hint for hint in hints if hint]
+        if hints:
+            delay = max(delay, min(max(hints), self.max_check))
+        return phase, delay
+
+
+    def _schedule_delay(self):
+        """Seconds until the schedule is worth fetching again"""
+        if self.mlb_games:
+            delay = self.schedule_delays['active']
+        elif self._starts_soon():
+            delay = self.schedule_delays['soon']
+        else:
+            delay = min(self._check_date.seconds + 10, self.max_check)
+        hint = self.schedule_hints.get('max_age')
+        if hint:
+            delay = max(delay, min(hint, self.max_check))
+        return delay
+
+
+    def _starts_soon(self):
+        """Whether any game today that hasn't started (or been called off) is
+        due to start within `schedule_soon` seconds
+        """
+        now = pendulum.now('UTC')
+        dates = (self.mlb_json or {}).get('dates') or [{}]
+        for game in dates[0].get('games', []):
+            utils = game.get('gameUtils', {})
+            if any(utils.get(key) for key in
+                   self.states['live'] + self.states['ppd'] + self.states['final']):
+                continue
+            try:
+                start = pendulum.parse(game['gameDate'])
+            except Exception:
+                continue
+            if (start - now).total_seconds() <= self.schedule_soon:
+                return True
+        return False
+
+
+    async def _poll_plays(self, gid, game):
+        """Returns the game's plays document when there may be new scoring
+        plays in it, or None when nothing relevant changed since last poll
+
+        Each game keeps a cursor (the live feed timecode we last saw). The
+        small diffPatch feed from that timecode tells us whether the scoring
+        plays moved at all, so the full playByPlay is only pulled when they
+        did. When plays are handed back, the new timecode is left pending
+        in the cursor until they've all been published, so a play whose
+        alert failed is still in the next diff.
+        """
+        if not game.get('state'):
+            # restored without one; picking the poll rate, keeping up with
+            # the schedule and the final alert all need it
+            await self._refresh_state(gid)
+        cursor = game.setdefault('cursor', {
+            'timecode': None,
+            'primed': False,
+        })
+        if not cursor['timecode']:
+            cursor['timecode'] = (
+                game['state'].timecode if game.get('state') else None
+            ) or await self._latest_timecode(gid)
+
+        if cursor['primed'] and cursor['timecode']:
+            diff = await self.fetch_json_or_none(self.mlb_diff_url.format(
+                gid=gid, timecode=cursor['timecode']), hints=game)
+            if isinstance(diff, dict):
+                # too far behind for patches, this is the whole live feed
+                game['state'] = StatsAPIAdapter.from_feed(diff)
+                timecode = diff.get(
+                    'metaData', {}).get('timeStamp') or cursor['timecode']
+                plays = diff.get('liveData', {}).get('plays')
+                cursor['pending' if plays else 'timecode'] = timecode
+                return plays
+            if isinstance(diff, list):
+                if not diff:
+                    return None
+                timecode, touched = self._scan_patches(diff)
+                timecode = (
+                    timecode or await self._latest_timecode(gid)
+                    or cursor['timecode']
+                )
+                if not touched:
+                    cursor['timecode'] = timecode
+                    return None
+                plays = await self.fetch_json_or_none(
+                    self.mlb_pbp_url.format(gid=gid), hints=game,
+                    revalidate=True)
+                if plays:
+                    # a failed fetch leaves the cursor put so we retry
+                    cursor['pending'] = timecode
+                return plays
+            # otherwise the diff request failed, fall back to a full fetch
+
+        return await self.fetch_json_or_none(
+            self.mlb_pbp_url.format(gid=gid), hints=game, revalidate=True)
+
+
+    async def _latest_timecode(self, gid):
+        timecodes = await self.fetch_json_or_none(
+            self.mlb_timestamps_url.format(gid=gid))
+        return timecodes[-1] if timecodes else None
+
+
+    @staticmethod
+    def _scan_patches(patches):
+        """Newest timecode in a diffPatch response and whether any of it
+        touches the scoring plays
+        """
+        timecode = None
+        touched = False
+        for patch in patches:
+            for op in patch.get('diff', []):
+                path = op.get('path', '')
+                if path == '/metaData/timeStamp':
+                    timecode = op.get('value')
+                elif path.startswith('/liveData/plays/scoringPlays') or \
+                        path in ('', '/liveData', '/liveData/plays'):
+                    touched = True
+        return timecode, touched
+
+
+    def _new_scoring_plays(self, gid, game, plays):
+        """Scoring play indexes the tracker hasn't seen for this game, in
+        order
+
+        The first look at a game only records what already happened, same as
+        before, so joining mid-game doesn't replay every run scored so far.
+        """
+        cursor = game['cursor']
+        scoring = plays.get('scoringPlays', [])
+        if not cursor['primed']:
+            self.tracker.record(PlaysSeen(gid, scoring))
+            self._save_events()
+            cursor['primed'] = True
+            return []
+        seen = self.tracker.plays(gid)
+        return [idx for idx in scoring if idx not in seen]
 
 
     @tasks.loop(seconds=10)
@@ -637,23 +926,124 @@ class ScoresCog(commands.Cog, name="Scores"):
                     self.base_mlb_url.format(date=self.api_date)
                 )
             )
-            self.mlb_json = self.fetch_json_requests(
+            mlb_json = await self.fetch_json_or_none(
                 self.base_mlb_url.format(
                     date=self.api_date
-                )
+                ),
+                hints=self.schedule_hints,
+                revalidate=True,
             )
-            self._parse_mlb_json_into_gameIDs()
+            self.mlb_json = project(mlb_json, self.schedule_fields) \
+                if mlb_json else mlb_json
+            await self._parse_mlb_json_into_gameIDs()
         except Exception as err:
             LOGGER.error(f"[4] {err}")
             pass
+        finally:
+            new_interval = self._schedule_delay()
+            if new_interval != self._check_date.seconds:
+                LOGGER.debug("schedule timer [{}s -> {}s]".format(
+                    self._check_date.seconds,
+                    new_interval,
+                ))
+                self._check_date.change_interval(seconds=new_interval)
+
+
+    @tasks.loop(seconds=5)
+    async def _check_leagues(self):
+        try:
+            for league in await self.live.tick():
+                self._save_league_events(league)
+        except Exception as err:
+            LOGGER.error(f"[6] {err}")
+
+
+    def _league_line(self, league, gid):
+        """AWAY 2 @ HOME 1 · 2nd, from the league's latest scoreboard"""
+        state = self.live.state(league, gid)
+        if not state:
+            return None, ""
+        away, home = state.away, state.home
+        return state, "{}{} {} @ {}{} {}{}".format(
+            self._get_emoji(league.lower(), away.abbreviation),
+            away.abbreviation,
+            away.score,
+            self._get_emoji(league.lower(), home.abbreviation),
+            home.abbreviation,
+            home.score,
+            " · {}".format(self.make_ordinal(state.period))
+            if state.period else "",
+        )
+
+
+    def _route(self, league, state, *events):
+        """Channels subscribed to any of `events` for either team"""
+        return self.subscriptions.route(
+            league, (state.away.abbreviation, state.home.abbreviation), events)
+
+
+    def _announce_league(self, league, state, message, embed, *events):
+        # ids are only unique within a league
+        key = f"{league}:{state.gid}"
+        if not self.dupes.seen(key, message):
+            self.bot.broadcaster.broadcast(
+                self._route(league, state, *events), embed)
+            self.dupes.add(key, message)
+            self._save_dupes()
+
+
+    def _announce_score(self, league, event):
+        state, line = self._league_line(league, event.gid)
+        if not state or not event.previous:
+            return
+        side = state.away if event.score[0] > event.previous[0] \
+            else state.home
+        label = self.live.feeds[league].score_label
+        embed = discord.Embed(description=line, color=0xFFFFFF)
+        embed.set_author(
+            name=f"{league} · {label.upper()} · {side.name}",
+            icon_url=self._get_emoji(
+                league.lower(), side.abbreviation, 'url'))
+        self._announce_league(
+            league, state, f"{label} {event.score}", embed, 'score')
+
+
+    def _announce_lead(self, league, event):
+        state, line = self._league_line(league, event.gid)
+        if not state:
+            return
+        side = getattr(state, event.leader)
+        embed = discord.Embed(description=line, color=0xF5A623)
+        embed.set_author(
+            name=f"{league} · LEAD CHANGE · {side.name}",
+            icon_url=self._get_emoji(
+                league.lower(), side.abbreviation, 'url'))
+        self._announce_league(
+            league, state,
+            f"lead {event.leader} {self.live.trackers[league].score(event.gid)}",
+            embed, 'lead')
+
+
+    def _announce_league_final(self, league, event):
+        # games that were over before we saw them stay quiet
+        if event.previous != LIVE:
+            return
+        state, line = self._league_line(league, event.gid)
+        if not state:
+            return
+        embed = discord.Embed(
+            description=f"{line.rsplit(' · ', 1)[0]} is final!",
+            color=0xD0021B)
+        self._announce_league(
+            league, state, " is ending", embed, 'final')
 
 
     @commands.command(name='testlist')
     async def testlist(self, ctx):
-        if not self.monitored:
+        if not self.subscriptions:
             await ctx.send('no channels found')
             return
-        for key, value in self.monitored.items():
+        for value in self.subscriptions.channels():
             await self.bot.get_channel(value).send(f"{value}")
             message = ""
             for key_, value_ in self.mlb_games.items():
@@ -666,33 +1056,125 @@ class ScoresCog(commands.Cog, name="Scores"):
     @commands.command(name='start', aliases=['startscores'])
     @commands.is_owner()
     async def start_mlb_scores(self, ctx, *, optional_input: str = None):
-        """Start emitting MLB live scores in the channel this command is sent
+        """Start emitting live scores in the channel this command is sent
         from
+
+        Everything by default, or only what matches
+        [team] [--league NHL] [--event start|score|homerun|lead|final]
         """
 
-        if not self.mlb_json:
+        subscription = await self._parse_subscription(ctx, optional_input)
+        if subscription is None:
             return
-
-        if ctx.channel.id not in self.monitored:
-            self.monitored[ctx.channel.id] = ctx.channel.id
-            await ctx.send(f"Added `{ctx.channel}` to my announce list")
+        # MLB alerts hang off today's schedule, the other leagues don't
+        if subscription[0] in (None, 'MLB') and not self.mlb_json:
+            await ctx.send(
+                "I haven't loaded today's MLB schedule yet, try again in a "
+                "minute")
+            return
+        if self.subscriptions.add(ctx.channel.id, *subscription):
+            self._save_subscriptions()
+            await ctx.send(
+                f"Added `{ctx.channel}` to my announce list "
+                f"({self._describe(subscription)})")
         else:
-            await ctx.send(f"`{ctx.channel}` is already on my announce list")
+            await ctx.send(f"`{ctx.channel}` is already on my announce list "
+                           f"({self._describe(subscription)})")
 
 
     @commands.command(name='stop', aliases=['stopscores'])
     @commands.is_owner()
-    async def stop_mlb_scores(self, ctx):
-        """Stop emitting MLB live scores in the channel this command is sent
-        from
+    async def stop_mlb_scores(self, ctx, *, optional_input: str = None):
+        """Stop emitting live scores in the channel this command is sent
+        from, or just the alerts `start` was given the same filters for
         """
-        if ctx.channel.id in self.monitored:
-            self.monitored.pop(ctx.channel.id, None)
+        if optional_input:
+            subscription = await self._parse_subscription(ctx, optional_input)
+            if subscription is None:
+                return
+            removed = self.subscriptions.remove(ctx.channel.id, *subscription)
+        else:
+            removed = self.subscriptions.clear(ctx.channel.id)
+        if removed:
+            self._save_subscriptions()
             await ctx.send(f"Removed `{ctx.channel}` from my announce list")
         else:
             await ctx.send(f"`{ctx.channel}` isn't on my announce list")
 
 
+    @commands.command(name='subscriptions', aliases=['subs'])
+    @commands.is_owner()
+    async def list_subscriptions(self, ctx):
+        """Lists which alerts the channel this command is sent from gets"""
+        filters = self.subscriptions.filters(ctx.channel.id)
+        if not filters:
+            await ctx.send(f"`{ctx.channel}` isn't on my announce list")
+            return
+        await ctx.send("\n".join(
+            self._describe(
+                [None if part == '*' else part for part in key])
+            for key in filters))
+
+
+    async def _parse_subscription(self, ctx, optional_input):
+        """(league, team, event) out of the start/stop arguments, teams
+        resolved against the league's directory; None after telling the
+        user what was wrong
+        """
+        args = self.subscription_options.parse(optional_input or "")
+        league = (args.get('league') or "").upper() or None
+        event = args.get('event')
+        if event is True:
+            await ctx.send("Pick an event: {}".format(", ".join(EVENTS)))
+            return None
+        team = args.get('team') or args.text or None
+        if team:
+            # no league means MLB, where the tracker started
+            league = league or 'MLB'
+            team = await self._resolve_team(league, team)
+            if team is None:
+                await ctx.send(f"I couldn't find that {league} team")
+                return None
+        if league and league != 'MLB' and league not in self.live.feeds:
+            await ctx.send(f"I'm not following {league} games")
+            return None
+        return league, team, event
+
+
+    async def _resolve_team(self, league, text):
+        """The team's abbreviation, as the alerts carry it"""
+        directory = self.bot.teams.get(league)
+        if directory is None:
+            return text.upper()
+        await directory.ensure()
+
+        def _abbreviation(key):
+            return key.isupper() and len(key) <= 4
+
+        if _abbreviation(text.upper()) and text.upper() in directory:
+            return text.upper()
+        value = directory.lookup(text)
+        if value is None:
+            return None
+        if isinstance(value, str) and _abbreviation(value) \
+                and value in directory:
+            return value
+        for key, other in directory.items():
+            if other == value and _abbreviation(key):
+                return key
+        return None
+
+
+    @staticmethod
+    def _describe(subscription):
+        league, team, event = subscription
+        return " · ".join([
+            league or "every league",
+            team or "every team",
+            event or "every alert",
+        ])
+
+
     @commands.command(name='timers', aliases=['t'])
     @commands.is_owner()
     async def control_timers(self, ctx, *, optional_input: str = ""):
@@ -701,23 +1183,54 @@ class ScoresCog(commands.Cog, name="Scores"):
         if optional_input.lower() == "start":
             self._check_date.start()
             self._check_games.start()
+            self._check_leagues.start()
             await ctx.send("All timers started")
             return
         elif optional_input.lower() == "stop":
             self._check_date.stop()
             self._check_games.stop()
+            self._check_leagues.stop()
             await ctx.send("All timers stopped")
             return
         elif optional_input.lower() == "cancel":
             self._check_date.cancel()
             self._check_games.cancel()
+            self._check_leagues.cancel()
             await ctx.send("All timers canceled")
             return
+        elif optional_input.lower() == "status":
+            await ctx.send(
+                "Games loop every {}s · schedule every {}s · last tick "
+                "{:.2f}s · worst {:.2f}s over {} ticks · {} games polled at "
+                "a time\nAlerts: {queued} queued for {channels} channels · "
+                "{sent} sent in {messages} messages · {failed} failed · "
+                "latency {last_latency:.2f}s (worst {worst_latency:.2f}s)"
+                .format(
+                    self._check_games.seconds,
+                    self._check_date.seconds,
+                    self.tick_stats['last'],
+                    self.tick_stats['worst'],
+                    self.tick_stats['ticks'],
+                    self.poll_concurrency,
+                    **self.bot.broadcaster.stats(),
+                )
+                + "".join(
+                    "\n{}: {polls} polls · {throttled} held back by the "
+                    "budget · {errors} errors · {events} events{}".format(
+                        league,
+                        " · live" if league in self.live.live() else "",
+                        **stats)
+                    for league, stats in self.live.stats.items()
+                )
+            )
+            return
         elif optional_input.lower() == "restart":
             self._check_date.cancel()
             self._check_games.cancel()
+            self._check_leagues.cancel()
             self._check_date.start()
             self._check_games.start()
+            self._check_leagues.start()
             await ctx.send("All timers restarted")
             return
         else:
@@ -730,18 +1243,66 @@ class ScoresCog(commands.Cog, name="Scores"):
 #############
 
 
-    @staticmethod
-    async def fetch_json(url: str):
-        async with aiohttp.ClientSession() as cs:
-            async with cs.get(url) as r:
-                return await r.json()
+    def _save_dupes(self):
+        self.bot.store.update('scores', {'dupes': self.dupes.snapshot()})
 
 
-    @staticmethod
-    def fetch_json_requests(url: str):
+    def _save_events(self):
+        self.bot.store.update('scores', {'events': self.tracker.snapshot()})
+
+
+    def _save_league_events(self, league):
+        self.bot.store.update('scores', {
+            f"events:{league.lower()}": self.live.trackers[league].snapshot()
+        })
+
+
+    def _save_subscriptions(self):
+        self.bot.store.update(
+            'scores', {'subscriptions': self.subscriptions.snapshot()})
+
+
+    def _saved_games(self):
+        """mlb_games without the live feeds, which get refetched anyway; the
+        plays already seen come back from the event log
+        """
+        saved = {}
+        for gid, game in self.mlb_games.items():
+            entry = {
+                key: value for key, value in game.items()
+                if key in ('check', 'in_delay', 'started')
+            }
+            if game.get('cursor'):
+                # a pending timecode is refetched from the saved one
+                entry['cursor'] = {
+                    key: value for key, value in game['cursor'].items()
+                    if key != 'pending'
+                }
+            saved[gid] = entry
+        return saved
+
+
+    async def fetch_json(self, url: str, revalidate=False):
+        return await self.bot.web.fetch_json(url, revalidate=revalidate)
+
+
+    async def fetch_json_or_none(self, url: str, hints=None, revalidate=False):
+        """fetch_json that logs and returns None on failure
+
+        When a `hints` dict is passed, the response's Cache-Control max-age
+        is stored in it under 'max_age'. `revalidate` is for the URLs that
+        get polled as-is (the schedule, playByPlay), not the per-game
+        feeds or diffPatch, whose timecode changes every poll. Every MLB
+        request waits its turn in the live engine's shared budget.
+        """
         try:
-            response = requests.get(url).json()
-            return response
+            await self.live.spend('MLB')
+            if hints is None:
+                return await self.fetch_json(url, revalidate)
+            data, headers = await self.bot.web.fetch_json_response(
+                url, revalidate=revalidate)
+            hints['max_age'] = max_age(headers)
+            return data
         except Exception as err:
             LOGGER.error(f"[5] {err}")
             return
@@ -765,63 +1326,6 @@ class ScoresCog(commands.Cog, name="Scores"):
         return str(n) + suffix
 
 
-    @classmethod
-    def _parseargs(self, passed_args):
-        if passed_args:
-            args = shlex.split(passed_args)
-
-            options = {
-                k: True if v.startswith('-') else v
-                for k, v in zip(args, args[1:] + ["--"]) if k.startswith('-')
-            }
-
-            extra = args
-            if options:
-                extra = []
-                for k, v in options.items():
-                    for arg in args:
-                        if arg != k and arg != v:
-                            extra.append(arg)
-
-            options['extra_text'] = ' '.join(extra)
-            return options
-        else:
-            return {}
-
-
-    def _parse_optinput(self, ctx, optional_input):
-        date = pendulum.now()
-        append_team = ""
-        timezone = ""
-        args_dev = self._parseargs(optional_input)
-        if args_dev.get('--tz'):
-            # grab the user-defined timezone
-            timezone = args_dev.get('--tz')
-            # see if it's a short-hand timezone first
-            timezone = self.short_tzs.get(timezone.lower()) or timezone
-            # now check if it's valid
-            try:
-                _ = pendulum.timezone(timezone)
-            except Exception:
-                return
-        if args_dev.get('extra_text', '').lower() == "yesterday":
-            date = pendulum.yesterday().in_tz(
-                timezone or self.default_other_tz)
-        elif args_dev.get('extra_text', '').lower() == "tomorrow":
-            date = pendulum.tomorrow().in_tz(
-                timezone or self.default_other_tz)
-        else:
-            try:
-                date = pendulum.parse(
-                    args_dev.get('extra_text'),
-                    strict=False
-                )
-            except Exception as err:
-                LOGGER.error(f"[6] {err}")
-                append_team = args_dev.get('extra_text').lower()
-
-        return date, append_team, timezone, args_dev
-
     async def _build_embed(self, data, mobile=False, color=0x98FB98):
         pass
 
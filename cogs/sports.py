@@ -1,11 +1,10 @@
 import discord
 from discord.ext import commands
-from discord.utils import get
 
-import requests
 import pendulum
 import aiohttp
 
+import asyncio
 import logging
 import coloredlogs
 # import json
@@ -13,9 +12,13 @@ import random
 import os
 # import errno
 import time
-import redis
-import shlex
-import pickle
+
+from utils.cache import TTLCache
+from utils import dates
+from utils.seasons import SeasonCalendar
+from utils.games import scoreboard_games
+from utils.options import Option, OptionParser
+from utils.projection import fields, project
 
 
 LOGGER = logging.getLogger(__name__)
@@ -54,17 +57,61 @@ class SportsCog(commands.Cog, name="Sports"):
         # update: turns out i'm wrong here. think we actually want this to be
         # the same as default_now_tz
 
-        self.short_tzs = {
-            "edt": "US/Eastern",
-            "est": "US/Eastern",
-            "cdt": "US/Central",
-            "cst": "US/Central",
-            "mst": "US/Mountain",
-            "mdt": "US/Mountain",
-            "pst": "US/Pacific",
-            "pdt": "US/Pacific"
+        # !sports fan-out: leagues slower than fanout_deadline get a
+        # placeholder, anything past fanout_timeout is given up on
+        self.fanout_deadline = 2.5
+        self.fanout_timeout = 20
+
+        # scoreboards shared by every user and command, keyed by
+        # (league, date, team filter), see _scoreboard_ttl for lifetimes
+        self.scoreboards = TTLCache(maxsize=128)
+        self.scoreboard_ttls = {
+            'live': 15,
+            'pre': 3 * 60,
+            'final': 30 * 60,
+            'past': 24 * 60 * 60,
+        }
+        # finished replies per (league, date, team filter, mobile, tz), only
+        # reused while they were built from the scoreboard still cached
+        self.renders = TTLCache(maxsize=256)
+        self.render_ttl = 10 * 60
+        self.render_stats = {'hits': 0, 'misses': 0}
+        # the parts of each league's scoreboard the renderers (and
+        # _game_states) actually read; everything else is dropped right
+        # after parsing instead of sitting in the cache (the fetch itself
+        # still parses the whole body)
+        self.scoreboard_fields = {
+            'NHL': fields('copyright', dates=fields(games=fields(
+                'gamePk', 'gameDate', 'gameType', 'status', 'teams',
+                'linescore', 'seriesSummary'))),
+            'MLB': fields('copyright', dates=fields(games=fields(
+                'gamePk', 'gameDate', 'gameNumber', 'doubleHeader',
+                'resumedFrom', 'seriesDescription', 'seriesStatus',
+                'status', 'teams', 'linescore'))),
+            'NBA': fields(games=fields(
+                'gameId', 'startTimeUTC', 'statusNum', 'extendedStatusNum',
+                'isGameActivated', 'isBuzzerBeater', 'clock', 'period',
+                'vTeam', 'hTeam', 'nugget', 'playoffs')),
+            'NFL': fields(events=fields(
+                'id', 'date', 'status',
+                competitions=fields(
+                    'situation', 'odds',
+                    competitors=fields(
+                        'id', 'homeAway', 'score',
+                        team=fields(
+                            'abbreviation', 'shortDisplayName',
+                            'displayName'))))),
+            'NCB': fields(games=fields(game=fields(
+                'gameID', 'gameState', 'currentPeriod', 'contestClock',
+                'startTimeEpoch', 'home', 'away'))),
         }
 
+        self.short_tzs = dates.SHORT_TZS
+
+        # every league command takes the same [team] [date] [--tz zone]
+        self.scoreboard_options = OptionParser(
+            Option('--tz', convert=self._timezone), days=True)
+
         # if not os.path.exists(os.path.dirname("data/sports_db.json")):
         #     try:
         #         os.makedirs(os.path.dirname("data/sports_db.json"))
@@ -78,33 +125,17 @@ class SportsCog(commands.Cog, name="Sports"):
         # except:
         #     self.user_db = {}
 
-        try:
-            _ = self.bot.db.get('sports_db')
-            self.user_db = pickle.loads(_)
-        except Exception as e:
-            LOGGER.debug(e)
-            self.user_db = {}
-
         self.NHL_SCOREBOARD_ENDPOINT = (
             "https://statsapi.web.nhl.com/api/v1/schedule?"
             "startDate={}&endDate={}"
             "&expand=schedule.teams,schedule.linescore,"
-            "schedule.broadcasts.all,"
-            "schedule.ticket,schedule.game.content.media.epg,"
             "schedule.game.seriesSummary"
-            "&leaderCategories=&site=en_nhl&teamId=")
+            "&site=en_nhl&teamId=")
         self.MLB_SCOREBOARD_ENDPOINT = (
             'https://statsapi.mlb.com/api/v1/schedule'
             '?sportId=1,51&date={}'
-            '&hydrate=team(leaders(showOnPreview('
-            'leaderCategories=[homeRuns,runsBattedIn,'
-            'battingAverage],statGroup=[pitching,'
-            'hitting]))),linescore(matchup,runners),'
-            'flags,liveLookin,review,broadcasts(all),'
-            'decisions,person,probablePitcher,stats,'
-            'homeRuns,previousPlay,game(content('
-            'media(featured,epg),summary),tickets),'
-            'seriesStatus(useOverride=true)&teamId='
+            '&hydrate=team,linescore,seriesStatus(useOverride=true)'
+            '&teamId='
         )
         self.NBA_SCOREBOARD_ENDPOINT = (
             "https://data.nba.net/10s/prod/v2/{}/scoreboard.json"
@@ -128,138 +159,153 @@ class SportsCog(commands.Cog, name="Sports"):
         self.NFL_SCOREBOARD_ENDPOINT = (
             "https://site.api.espn.com/apis/site/v2/sports/football/nfl/"
             "scoreboard?lang=en&region=us&calendartype=blacklist&limit=100"
-            "&showAirings=true&dates=2020&seasontype={type}&week={week}"
+            "&showAirings=true&dates={season}&seasontype={type}&week={week}"
+        )
+        self.NFL_CALENDAR_ENDPOINT = (
+            "https://site.api.espn.com/apis/site/v2/sports/football/nfl/"
+            "scoreboard?lang=en&region=us&limit=1"
         )
         self.NFL_AUTH = None
-        self.NFL_WEEKS = {
-            '2020-09-09': {'week':  1, 'type': 2},
-            '2020-09-16': {'week':  2, 'type': 2},
-            '2020-09-23': {'week':  3, 'type': 2},
-            '2020-09-30': {'week':  4, 'type': 2},
-            '2020-10-07': {'week':  5, 'type': 2},
-            '2020-10-14': {'week':  6, 'type': 2},
-            '2020-10-21': {'week':  7, 'type': 2},
-            '2020-10-28': {'week':  8, 'type': 2},
-            '2020-11-04': {'week':  9, 'type': 2},
-            '2020-11-11': {'week': 10, 'type': 2},
-            '2020-11-18': {'week': 11, 'type': 2},
-            '2020-11-25': {'week': 12, 'type': 2},
-            '2020-12-03': {'week': 13, 'type': 2},
-            '2020-12-09': {'week': 14, 'type': 2},
-            '2020-12-16': {'week': 15, 'type': 2},
-            '2020-12-23': {'week': 16, 'type': 2},
-            '2020-12-30': {'week': 17, 'type': 2},
-            '2021-01-06': {'week':  1, 'type': 3},
-            '2021-01-13': {'week':  2, 'type': 3},
-            '2021-01-20': {'week':  3, 'type': 3},
-            '2021-01-27': {'week':  4, 'type': 3},
-            '2021-02-03': {'week':  5, 'type': 3},
-            '2021-02-10': {'week':  6, 'type': 3}
-        }
-
-        self.NHL_TEAMS = self._fetch_teams("NHL")
-        self.MLB_TEAMS = self._fetch_teams("MLB")
-        self.NBA_TEAMS = self._fetch_teams("NBA")
-
-        self.NFL_TEAMS = {
-            "ARI": "Arizona Cardinals",
-            "ATL": "Atlanta Falcons",
-            "BAL": "Baltimore Ravens",
-            "BUF": "Buffalo Bills",
-            "CAR": "Carolina Panthers",
-            "CHI": "Chicago Bears",
-            "CIN": "Cincinnati Bengals",
-            "CLE": "Cleveland Browns",
-            "DAL": "Dallas Cowboys",
-            "DEN": "Denver Broncos",
-            "DET": "Detroit Lions",
-            "GB":  "Green Bay Packers",
-            "HOU": "Houston Texans",
-            "IND": "Indianapolis Colts",
-            "JAX": "Jacksonville Jaguars",
-            "KC":  "Kansas City Chiefs",
-            "LAC": "Los Angeles Chargers",
-            "LAR": "Los Angeles Rams",
-            "LV":  "Las Vegas Raiders",
-            "MIA": "Miami Dolphins",
-            "MIN": "Minnesota Vikings",
-            "NE":  "New England Patriots",
-            "NO":  "New Orleans Saints",
-            "NYG": "New York Giants",
-            "NYJ": "New York Jets",
-            "PHI": "Philadelphia Eagles",
-            "PIT": "Pittsburgh Steelers",
-            "SEA": "Seattle Seahawks",
-            "SF":  "San Francisco 49ers",
-            "TB":  "Tampa Bay Buccaneers",
-            "TEN": "Tennessee Titans",
-            "WAS": "Washington",
-            "WSH": "Washington",
-        }
-
-    @classmethod
-    def _parseargs(self, passed_args):
-        if passed_args:
-            # passed_args = passed_args.replace("'", '')
-            args = shlex.split(passed_args)
-            # options = {}
-
-            options = {
-                k: True if v.startswith('-') else v
-                for k,v in zip(args, args[1:]+["--"]) if k.startswith('-')
-            }
-
-            extra = args
-            if options:
-                extra = []
-                for k,v in options.items():
-                    for arg in args:
-                        if arg != k and arg != v:
-                            extra.append(arg)
+        # week boundaries for whichever season is on, see utils/seasons.py
+        self.nfl_calendar = SeasonCalendar(
+            "NFL", self.NFL_CALENDAR_ENDPOINT,
+            web=self.bot.web, store=self.bot.store)
+        self.nfl_calendar.load()
+
+        # shared with the rest of the bot and cached on disk, see
+        # utils/teams.py
+        self.NHL_TEAMS = self.bot.teams['NHL']
+        self.MLB_TEAMS = self.bot.teams['MLB']
+        self.NBA_TEAMS = self.bot.teams['NBA']
+        self.NFL_TEAMS = self.bot.teams['NFL']
+
+    async def fetch_json(self, url: str):
+        # scoreboards get asked for again and again, so they're revalidated
+        return await self.bot.web.fetch_json(url, revalidate=True)
+
+    async def _fetch_scoreboard(self, league, date, team, url):
+        """Scoreboard JSON through the shared TTL cache"""
+        return await self.scoreboards.get_or_fetch(
+            (league, str(date), str(team or "")),
+            lambda: self._fetch_projected(league, url),
+            lambda data: self._scoreboard_ttl(league, date, data),
+        )
 
-            options['extra_text'] = ' '.join(extra)
-            return options
-        else:
-            return {}
+    async def _fetch_projected(self, league, url):
+        data = await self.fetch_json(url)
+        spec = self.scoreboard_fields.get(league)
+        return project(data, spec) if spec else data
+
+    def _cached_render(self, key, data):
+        """Replies already built from this very scoreboard, if any"""
+        entry = self.renders.get(key)
+        if entry is not None and entry[0] is data:
+            self.render_stats['hits'] += 1
+            return list(entry[1])
+        self.render_stats['misses'] += 1
+        return None
+
+    def _cache_render(self, key, data, replies):
+        # holding on to `data` is what ties the replies to that version of
+        # the scoreboard; a refetch is a new object and misses
+        self.renders.set(key, (data, list(replies)), self.render_ttl)
+
+    def _scoreboard_ttl(self, league, date, data):
+        """Seconds while anything is live, minutes for a slate that hasn't
+        started and a day for a date that is over and done with
+        """
+        states = set(self._game_states(league, data))
+        if 'live' in states:
+            return self.scoreboard_ttls['live']
+        if 'pre' in states or not states:
+            return self.scoreboard_ttls['pre']
+        try:
+            day = pendulum.parse(str(date), strict=False).date()
+            if day < dates.now(self.default_now_tz).date():
+                return self.scoreboard_ttls['past']
+        except Exception:
+            pass
+        return self.scoreboard_ttls['final']
 
     @staticmethod
-    async def fetch_json(url: str):
-        async with aiohttp.ClientSession() as cs:
-            async with cs.get(url) as r:
-                return await r.json()
+    def _game_states(league, data):
+        """Rough live/pre/final state of every game in a scoreboard"""
+        return [game.state for game in scoreboard_games(league, data)]
 
     @commands.command(name='sports', aliases=["scores"], pass_context=True)
     @commands.cooldown(1, 5, commands.BucketType.user)
     async def do_all_scores(self, ctx, *, optional_input: str = None):
         """Fetches scores from all available leagues
-        (currently NHL, MLB, NBA, and NFL)
+        (currently NHL, MLB, NBA, NFL, and NCB)
         """
-        await ctx.invoke(
-            self.bot.get_command('nhl'),
-            optional_input=optional_input
-        )
-        await ctx.invoke(
-            self.bot.get_command('mlb'),
-            optional_input=optional_input
-        )
-        await ctx.invoke(
-            self.bot.get_command('nba'),
-            optional_input=optional_input
-        )
-        await ctx.invoke(
-            self.bot.get_command('nfl'),
-            optional_input=optional_input
-        )
-        await ctx.invoke(
-            self.bot.get_command('ncb'),
-            optional_input=optional_input
+        leagues = [
+            ("NHL", self._render_nhl),
+            ("MLB", self._render_mlb),
+            ("NBA", self._render_nba),
+            ("NFL", self._render_nfl),
+            ("NCB", self._render_ncb),
+        ]
+        # every league is fetched at once, so the wait is roughly the
+        # slowest upstream instead of the sum of all of them
+        started = time.monotonic()
+        tasks = [
+            asyncio.ensure_future(render(ctx, optional_input))
+            for _, render in leagues
+        ]
+
+        slow = []
+        for (league, _), task in zip(leagues, tasks):
+            # each league goes out as soon as it's in and the ones above it
+            # have been sent; only what's left at the deadline waits
+            left = started + self.fanout_deadline - time.monotonic()
+            if not task.done() and left > 0:
+                await asyncio.wait([task], timeout=left)
+            if not task.done():
+                # keep the league's spot in the channel and fill it in later
+                placeholder = await ctx.send(
+                    f"⏳ _{league} scores are still loading..._")
+                slow.append((league, task, placeholder))
+                continue
+            if task.exception():
+                LOGGER.error(f"[{league}] {task.exception()}")
+                await ctx.send(f"I couldn't fetch {league} scores")
+                continue
+            await self._send_replies(ctx, task.result())
+
+        remaining = max(
+            0, started + self.fanout_timeout - time.monotonic())
+        await asyncio.gather(*[
+            self._fill_placeholder(ctx, league, task, placeholder, remaining)
+            for league, task, placeholder in slow
+        ])
+
+    @commands.command(name='cachestats', hidden=True)
+    @commands.is_owner()
+    async def cache_stats(self, ctx):
+        """Shows scoreboard and render cache hit/miss counters"""
+        stats = self.scoreboards.stats()
+        await ctx.send(
+            "**Scoreboard cache:** {entries} entries, {inflight} in flight\n"
+            "{hits} hits · {misses} misses · {joins} joined in-flight "
+            "fetches ({hit_rate:.0%} served without a new request)\n"
+            "**Render cache:** {renders} entries · {render_hits} hits · "
+            "{render_misses} rebuilt".format(
+                renders=len(self.renders),
+                render_hits=self.render_stats['hits'],
+                render_misses=self.render_stats['misses'],
+                **stats)
         )
 
     @commands.command(name='ncb', aliases=['ncaab', 'collegebasketball'])
     @commands.cooldown(1, 5, commands.BucketType.user)
     async def do_ncb_scores(self, ctx, *, optional_input: str = None):
         """Fetches NCAAB scores from ESPN.com"""
+        replies = await self._render_ncb(ctx, optional_input)
+        await self._send_replies(ctx, replies)
 
+    async def _render_ncb(self, ctx, optional_input):
+        """Builds the `ncb` replies without sending them"""
+        replies = []
         # def _next_key(d, key):
         #     key_iter = iter(d)
 
@@ -289,16 +335,15 @@ class SportsCog(commands.Cog, name="Sports"):
         if member.is_on_mobile():
             mobile_output = True
 
-        user_timezone = self.user_db.get(member_id, {}).get('timezone')
-        # LOGGER.debug((user_timezone, self.user_db))
+        user_timezone = self.bot.profiles.get(member_id, 'timezone')
 
-        date = pendulum.now().in_tz(self.default_now_tz)
-        date_display = pendulum.now().in_tz(self.default_now_tz).format("ddd, MMM Do")
-        append_team = ""
-        team = ""
-        timezone = None
-        if optional_input:
-            date, append_team, timezone, args_dev = self._parse_optinput(optional_input)
+        parsed = self._scoreboard_args(optional_input, None, user_timezone)
+        if parsed is None:
+            replies.append(dict(
+                content="Sorry that is an invalid timezone "
+                "(try one from https://nodatime.org/TimeZones)"))
+            return replies
+        date, append_team, team, timezone = parsed
 
         if append_team:
             LOGGER.debug(append_team)
@@ -312,7 +357,7 @@ class SportsCog(commands.Cog, name="Sports"):
         LOGGER.debug("NCB API called for: {} \n {}".format(url, url2))
 
         try:
-            data = await self.fetch_json(url2)
+            data = await self._fetch_scoreboard("NCB", official_date, "", url2)
             games = data.get('games', {})
         except aiohttp.client_exceptions.ContentTypeError as err:
             LOGGER.error(err)
@@ -320,12 +365,20 @@ class SportsCog(commands.Cog, name="Sports"):
 
         if not games:
             LOGGER.warn("Something went wrong possibly. (NCB)")
-            await ctx.send(
-                "I couldn't find any NCB games for {team}{date}.".format(
+            replies.append(dict(
+                content="I couldn't find any NCB games for {team}{date}.".format(
                     team="{} on ".format(team) if team else "",
                     date=date_display)
-            )
-            return
+            ))
+            return replies
+
+        render_key = ("NCB", official_date, append_team, team, mobile_output,
+                      timezone or user_timezone or self.default_tz)
+        cached = self._cached_render(render_key, data)
+        if cached is not None:
+            if timezone:
+                self.bot.profiles.set(member_id, 'timezone', timezone)
+            return cached
 
         sortorder = {"live":  0,
                      "pre":  1,
@@ -387,23 +440,10 @@ class SportsCog(commands.Cog, name="Sports"):
             home_team += " [{}]".format(
                 teams[0].get('seed')
             ) if teams[0].get('seed') else ""
-            # a_team_emoji = self.bot.get_emoji()
-            for tguild in self.bot.guilds:
-                if tguild.name == "ncb":
-                    guild = tguild
-                    break
-            a_team_emoji = ""
-            h_team_emoji = ""
-            a_team_emoji = get(
-                guild.emojis,
-                name="{}".format(teams[1]['names']['seo']).replace('-', '').lower()) or ""
-            h_team_emoji = get(
-                guild.emojis,
-                name="{}".format(teams[0]['names']['seo']).replace('-', '').lower()) or ""
-            if a_team_emoji:
-                a_team_emoji = "{} ".format(a_team_emoji)
-            if h_team_emoji:
-                h_team_emoji = "{} ".format(h_team_emoji)
+            a_team_emoji = self._team_emoji(
+                "ncb", teams[1]['names']['seo'].replace('-', ''))
+            h_team_emoji = self._team_emoji(
+                "ncb", teams[0]['names']['seo'].replace('-', ''))
             # if away_team == "Washington":
             #     away_team = "Football Team"
             # if home_team == "Washington":
@@ -556,12 +596,11 @@ class SportsCog(commands.Cog, name="Sports"):
                 h_score = ""
             else:
                 try:
-                    game_date = pendulum.from_timestamp(int(game['startTimeEpoch']), tz="US/Eastern").in_tz(
-                        timezone or user_timezone or self.default_tz)
-                    today = pendulum.now().in_tz(
-                        timezone or user_timezone or self.default_tz)
-                    tomorrow = pendulum.tomorrow().in_tz(
-                        timezone or user_timezone or self.default_tz)
+                    checktz = timezone or user_timezone or self.default_tz
+                    game_date = dates.local_time(
+                        int(game['startTimeEpoch']), checktz)
+                    today = dates.now(checktz)
+                    tomorrow = today.add(days=1)
                     if game_date.is_same_day(today):
                         status = game_date.format(
                             "h:mm A zz"
@@ -633,20 +672,20 @@ class SportsCog(commands.Cog, name="Sports"):
         print(away, home, mobile_output_string)
         if mobile_output:
             if not mobile_output_string:
-                await ctx.send(
-                    "I couldn't find any NCB games for {team}{date}.".format(
+                replies.append(dict(
+                    content="I couldn't find any NCB games for {team}{date}.".format(
                         team="{} on".format(team) if team else "",
                         date=date_display)
-                )
-                return
+                ))
+                return replies
         else:
             if not away and not home:
-                await ctx.send(
-                    "I couldn't find any NCB games for {team}{date}.".format(
+                replies.append(dict(
+                    content="I couldn't find any NCB games for {team}{date}.".format(
                         team="{} on".format(team) if team else "",
                         date=date_display)
-                )
-                return
+                ))
+                return replies
 
         embed_data = {
             "league":          "NCB",
@@ -664,10 +703,7 @@ class SportsCog(commands.Cog, name="Sports"):
         # embed = self._build_embed(embed_data, mobile_output, 0x003069)
 
         if timezone:
-            if not self.user_db.get(member_id):
-                self.user_db[member_id] = {}
-            self.user_db[member_id]['timezone'] = timezone
-            self._save()
+            self.bot.profiles.set(member_id, 'timezone', timezone)
 
         # this is really dumb and brute force way to split the games up over
         # multiple embeds because discord doesn't like fields that are greater
@@ -738,44 +774,38 @@ class SportsCog(commands.Cog, name="Sports"):
             embed = self._build_embed(embed_data, mobile_output, 0x0079c2)
 
         if multi:
-            await ctx.send(embed=embed1)
-            await ctx.send(embed=embed2)
+            replies.append(dict(embed=embed1))
+            replies.append(dict(embed=embed2))
         else:
-            await ctx.send(embed=embed)
+            replies.append(dict(embed=embed))
 
         # await ctx.send(embed=embed)
 
+        self._cache_render(render_key, data, replies)
+        return replies
+
 
     @commands.command(name='nfl', aliases=['nflscores', 'football'])
     @commands.cooldown(1, 5, commands.BucketType.user)
     async def do_nfl_scores(self, ctx, *, optional_input: str = None):
         """Fetches NFL scores from NFL.com"""
+        replies = await self._render_nfl(ctx, optional_input)
+        await self._send_replies(ctx, replies)
 
-        def _next_key(d, key):
-            key_iter = iter(d)
-
-            for k in key_iter:
-                if k == key:
-                    return next(key_iter, "2020-02-10")
-
-            return "2020-02-10"
-
-        now = pendulum.now()
-        for week in self.NFL_WEEKS:
-            check = pendulum.parse(week, strict=False)
-            next_key = _next_key(self.NFL_WEEKS, week)
-            print(next_key)
-            next_week = pendulum.parse(next_key, strict=False)
-            print(check, "\t",
-                  now, "\t",
-                  next_week, "\t",
-                  check < now < next_week)
-            if check < now < next_week:
-                current_week = self.NFL_WEEKS[week]
-                break
+    async def _render_nfl(self, ctx, optional_input):
+        """Builds the `nfl` replies without sending them"""
+        replies = []
+
+        await self.nfl_calendar.ensure()
+        current_week = self.nfl_calendar.week()
+        if current_week is None:
+            replies.append(dict(
+                content="I couldn't load the NFL schedule, try again later."))
+            return replies
 
         url = self.NFL_SCOREBOARD_ENDPOINT.format(**current_week)
-        data = await self.fetch_json(url)
+        data = await self._fetch_scoreboard(
+            "NFL", "{season}:{type}:{week}".format(**current_week), "", url)
 
         mobile_output = False
         member = ctx.author
@@ -783,57 +813,24 @@ class SportsCog(commands.Cog, name="Sports"):
         if member.is_on_mobile():
             mobile_output = True
 
-        user_timezone = self.user_db.get(member_id, {}).get('timezone')
-        # LOGGER.debug((user_timezone, self.user_db))
-
-        date = pendulum.now().in_tz(self.default_now_tz).format("YYYY-MM-DD")
-        append_team = ""
-        team = ""
-        timezone = None
-        if optional_input:
-            args = optional_input.split()
-            for idx, arg in enumerate(args):
-                if arg == "--tz":
-                    # grab the user-defined timezone
-                    timezone = args[idx + 1]
-                    # see if it's a short-hand timezone first
-                    timezone = self.short_tzs.get(timezone.lower()) or timezone
-                    # now check if it's valid
-                    try:
-                        _ = pendulum.timezone(timezone)
-                    except Exception:
-                        await ctx.send(
-                            "Sorry that is an invalid timezone "
-                            "(try one from https://nodatime.org/TimeZones)"
-                        )
-                        return
-                if arg.replace("-", "").isdigit():
-                    date = arg
-                if len(arg.lower()) <= 3:
-                    append_team = self.NFL_TEAMS.get(arg.upper()) or ""
-                    team = arg.upper()
-                if not append_team:
-                    for full_name, id_ in self.NFL_TEAMS.items():
-                        if arg.lower() in full_name.lower():
-                            append_team = id_
-                            break
-                if arg.lower() == "tomorrow":
-                    date = pendulum.tomorrow().in_tz(
-                        user_timezone or
-                        self.default_other_tz).format("YYYY-MM-DD")
-                elif arg.lower() == "yesterday":
-                    date = pendulum.yesterday().in_tz(
-                        user_timezone or
-                        self.default_other_tz).format("YYYY-MM-DD")
-
-            if optional_input.lower() == "tomorrow":
-                date = pendulum.tomorrow().in_tz(
-                    user_timezone or
-                    self.default_other_tz).format("YYYY-MM-DD")
-            elif optional_input.lower() == "yesterday":
-                date = pendulum.yesterday().in_tz(
-                    user_timezone or
-                    self.default_other_tz).format("YYYY-MM-DD")
+        user_timezone = self.bot.profiles.get(member_id, 'timezone')
+
+        parsed = self._scoreboard_args(
+            optional_input, self.NFL_TEAMS, user_timezone, "YYYY-MM-DD")
+        if parsed is None:
+            replies.append(dict(
+                content="Sorry that is an invalid timezone "
+                "(try one from https://nodatime.org/TimeZones)"))
+            return replies
+        date, append_team, team, timezone = parsed
+
+        render_key = ("NFL", str(date), append_team, team, mobile_output,
+                      timezone or user_timezone or self.default_tz)
+        cached = self._cached_render(render_key, data)
+        if cached is not None:
+            if timezone:
+                self.bot.profiles.set(member_id, 'timezone', timezone)
+            return cached
 
         LOGGER.debug("NFL API called for: {}".format(url))
 
@@ -843,12 +840,12 @@ class SportsCog(commands.Cog, name="Sports"):
         games = data.get('events', {})
         if not games:
             LOGGER.warn("Something went wrong possibly. (NFL)")
-            await ctx.send(
-                "I couldn't find any NFL games for {team}{date}.".format(
+            replies.append(dict(
+                content="I couldn't find any NFL games for {team}{date}.".format(
                     team="{} on ".format(team) if team else "",
                     date=date)
-            )
-            return
+            ))
+            return replies
 
         sortorder = {"2":  0,
                      "7":  1,
@@ -881,23 +878,19 @@ class SportsCog(commands.Cog, name="Sports"):
             home_team = teams[0]['team']['shortDisplayName'] \
                 if not mobile_output \
                 else teams[0]['team']['abbreviation']
-            # a_team_emoji = self.bot.get_emoji()
-            for tguild in self.bot.guilds:
-                if tguild.name == "nfl":
-                    guild = tguild
-                    break
-            a_team_emoji = get(
-                guild.emojis,
-                name="nfl_"+teams[1]['team']['abbreviation'].lower()) or ""
-            h_team_emoji = get(
-                guild.emojis,
-                name="nfl_"+teams[0]['team']['abbreviation'].lower()) or ""
+            a_team_emoji = self.bot.emoji_index.get(
+                "nfl", "nfl_"+teams[1]['team']['abbreviation'])
+            h_team_emoji = self.bot.emoji_index.get(
+                "nfl", "nfl_"+teams[0]['team']['abbreviation'])
             if away_team == "Washington":
                 away_team = "Football Team"
             if home_team == "Washington":
                 home_team = "Football Team"
-            combined_names = f"{teams[1]['team']['displayName']} \
-                               {teams[0]['team']['displayName']}"
+            # the NFL directory resolves every team to its ESPN code
+            codes = {
+                teams[1]['team']['abbreviation'],
+                teams[0]['team']['abbreviation'],
+            }
 
             if game['status']['type']['state'] == 'in':
                 score_bug = game['competitions'][0]['competitors']
@@ -993,12 +986,10 @@ class SportsCog(commands.Cog, name="Sports"):
                 h_score = ""
             else:
                 try:
-                    game_date = pendulum.parse(game['date']).in_tz(
-                        timezone or user_timezone or self.default_tz)
-                    today = pendulum.now().in_tz(
-                        timezone or user_timezone or self.default_tz)
-                    tomorrow = pendulum.tomorrow().in_tz(
-                        timezone or user_timezone or self.default_tz)
+                    checktz = timezone or user_timezone or self.default_tz
+                    game_date = dates.local_time(game['date'], checktz)
+                    today = dates.now(checktz)
+                    tomorrow = today.add(days=1)
                     if game_date.is_same_day(today):
                         status = game_date.format(
                             "h:mm A zz"
@@ -1032,7 +1023,7 @@ class SportsCog(commands.Cog, name="Sports"):
             home_team = "{}{}".format(h_team_emoji, home_team)
             # blank = get(ctx.guild.emojis, name="blank") or ""
             if append_team:
-                if append_team in combined_names:
+                if append_team in codes:
                     number_of_games = 1
                     if mobile_output:
                         mobile_output_string += "{}{} @ {}{}  |  {}\n".format(
@@ -1069,20 +1060,20 @@ class SportsCog(commands.Cog, name="Sports"):
         # print(away, home, mobile_output_string)
         if mobile_output:
             if not mobile_output_string:
-                await ctx.send(
-                    "I couldn't find any NFL games for {team}{date}.".format(
+                replies.append(dict(
+                    content="I couldn't find any NFL games for {team}{date}.".format(
                         team="{} during Week #".format(team) if team else "",
                         date=current_week)
-                )
-                return
+                ))
+                return replies
         else:
             if not away and not home:
-                await ctx.send(
-                    "I couldn't find any NFL games for {team}{date}.".format(
+                replies.append(dict(
+                    content="I couldn't find any NFL games for {team}{date}.".format(
                         team="{} during Week #".format(team) if team else "",
                         date=current_week)
-                )
-                return
+                ))
+                return replies
 
         embed_data = {
             "league":          "NFL",
@@ -1102,10 +1093,7 @@ class SportsCog(commands.Cog, name="Sports"):
         # embed = self._build_embed(embed_data, mobile_output, 0x003069)
 
         if timezone:
-            if not self.user_db.get(member_id):
-                self.user_db[member_id] = {}
-            self.user_db[member_id]['timezone'] = timezone
-            self._save()
+            self.bot.profiles.set(member_id, 'timezone', timezone)
 
         # this is really dumb and brute force way to split the games up over
         # multiple embeds because discord doesn't like fields that are greater
@@ -1182,13 +1170,16 @@ class SportsCog(commands.Cog, name="Sports"):
             embed = self._build_embed(embed_data, mobile_output, 0x003069)
 
         if multi:
-            await ctx.send(embed=embed1)
-            await ctx.send(embed=embed2)
+            replies.append(dict(embed=embed1))
+            replies.append(dict(embed=embed2))
         else:
-            await ctx.send(embed=embed)
+            replies.append(dict(embed=embed))
 
         # await ctx.send(embed=embed)
 
+        self._cache_render(render_key, data, replies)
+        return replies
+
 
     @commands.command(name='nhl', aliases=['nhlscores', 'hockey'])
     @commands.cooldown(1, 5, commands.BucketType.user)
@@ -1207,7 +1198,13 @@ class SportsCog(commands.Cog, name="Sports"):
              nhl --tz US/Pacific
              nhl --tz pdt bos
         """
+        replies = await self._render_nhl(ctx, optional_input)
+        await self._send_replies(ctx, replies)
 
+    async def _render_nhl(self, ctx, optional_input):
+        """Builds the `nhl` replies without sending them"""
+        replies = []
+        await self.NHL_TEAMS.ensure()
         mobile_output = False
         member = ctx.author
         member_id = str(member.id)
@@ -1219,56 +1216,16 @@ class SportsCog(commands.Cog, name="Sports"):
         if member.is_on_mobile():
             mobile_output = True
 
-        user_timezone = self.user_db.get(member_id, {}).get('timezone')
-        # LOGGER.debug((user_timezone, self.user_db))
+        user_timezone = self.bot.profiles.get(member_id, 'timezone')
 
-        date = pendulum.now().in_tz(self.default_now_tz).format("YYYY-MM-DD")
-        append_team = ""
-        team = ""
-        timezone = None
-        if optional_input:
-            args = optional_input.split()
-            for idx, arg in enumerate(args):
-                if arg == "--tz":
-                    # grab the user-defined timezone
-                    timezone = args[idx + 1]
-                    # see if it's a short-hand timezone first
-                    timezone = self.short_tzs.get(timezone.lower()) or timezone
-                    # now check if it's valid
-                    try:
-                        _ = pendulum.timezone(timezone)
-                    except Exception:
-                        await ctx.send(
-                            "Sorry that is an invalid timezone "
-                            "(try one from https://nodatime.org/TimeZones)")
-                        return
-                if arg.replace("-", "").isdigit():
-                    date = arg
-                if len(arg.lower()) <= 3:
-                    append_team = self.NHL_TEAMS.get(arg.upper()) or ""
-                    team = arg.upper()
-                if not append_team:
-                    for full_name, id_ in self.NHL_TEAMS.items():
-                        if arg.lower() in full_name.lower():
-                            append_team = id_
-                            break
-                if arg.lower() == "tomorrow":
-                    date = pendulum.tomorrow().in_tz(
-                        user_timezone or
-                        self.default_other_tz).format("YYYY-MM-DD")
-                elif arg.lower() == "yesterday":
-                    date = pendulum.yesterday().in_tz(
-                        user_timezone or
-                        self.default_other_tz).format("YYYY-MM-DD")
-
-            if optional_input.lower() == "tomorrow":
-                date = pendulum.tomorrow().in_tz(
-                    user_timezone or
-                    self.default_other_tz).format("YYYY-MM-DD")
-            elif optional_input.lower() == "yesterday":
-                date = pendulum.yesterday().in_tz(
-                    user_timezone or
-                    self.default_other_tz).format("YYYY-MM-DD")
+        parsed = self._scoreboard_args(
+            optional_input, self.NHL_TEAMS, user_timezone, "YYYY-MM-DD")
+        if parsed is None:
+            replies.append(dict(
+                content="Sorry that is an invalid timezone "
+                "(try one from https://nodatime.org/TimeZones)"))
+            return replies
+        date, append_team, team, timezone = parsed
 
         url = "{}{}".format(
             self.NHL_SCOREBOARD_ENDPOINT.format(date, date),
@@ -1276,29 +1233,38 @@ class SportsCog(commands.Cog, name="Sports"):
         LOGGER.debug("NHL API called for: {}".format(url))
 
         # data = requests.get(url).json()
-        data = await self.fetch_json(url)
+        data = await self._fetch_scoreboard("NHL", date, append_team, url)
+
+        render_key = ("NHL", str(date), append_team, team, mobile_output,
+                      timezone or user_timezone or self.default_tz)
+        cached = self._cached_render(render_key, data)
+        if cached is not None:
+            if timezone:
+                self.bot.profiles.set(member_id, 'timezone', timezone)
+            return cached
+
         games = data.get('dates', {})
         if not games:
             LOGGER.warn("Something went wrong possibly. (NHL)")
-            await ctx.send(
-                "I couldn't find any NHL games for {team}{date}.".format(
+            replies.append(dict(
+                content="I couldn't find any NHL games for {team}{date}.".format(
                     team="{} on ".format(team) if team else "",
                     date=date)
-            )
-            return
+            ))
+            return replies
         else:
             games = games[0].get('games', {})
             if not games:
                 LOGGER.warn("Something went wrong possibly. (NHL)")
-                await ctx.send(
-                    "I couldn't find any NHL games for {team}{date}.".format(
+                replies.append(dict(
+                    content="I couldn't find any NHL games for {team}{date}.".format(
                         team="{} on ".format(team) if team else "",
                         date=date)
-                )
-                return
+                ))
+                return replies
 
-        games_date = pendulum.parse(games[0]['gameDate']).in_tz(
-            self.default_other_tz).format("MMM Do")
+        games_date = dates.local_time(
+            games[0]['gameDate'], self.default_other_tz).format("MMM Do")
         number_of_games = len(games)
         # types_of_games = {
         #     'P': ' **PLAYOFF** ',
@@ -1325,26 +1291,14 @@ class SportsCog(commands.Cog, name="Sports"):
             home_team = game['teams']['home']['team']['teamName'] \
                 if not mobile_output \
                 else game['teams']['home']['team']['abbreviation']
-            for tguild in self.bot.guilds:
-                if tguild.name == "nhl":
-                    guild = tguild
-                    break
             a = "nhl_" + game['teams']['away']['team']['abbreviation'].lower()
-            a_team_emoji = get(guild.emojis, name=a)
+            a_team_emoji = self._team_emoji("nhl", a)
             h = "nhl_"+game['teams']['home']['team']['abbreviation'].lower()
-            h_team_emoji = get(guild.emojis, name=h)
-            if a_team_emoji:
-                if "mtl" in a:
-                    a_team_emoji = "💩 "
-                a_team_emoji = "{} ".format(a_team_emoji)
-            else:
-                a_team_emoji = ""
-            if h_team_emoji:
-                if "mtl" in h:
-                    h_team_emoji = "💩 "
-                h_team_emoji = "{} ".format(h_team_emoji)
-            else:
-                h_team_emoji = ""
+            h_team_emoji = self._team_emoji("nhl", h)
+            if a_team_emoji and "mtl" in a:
+                a_team_emoji = "💩 "
+            if h_team_emoji and "mtl" in h:
+                h_team_emoji = "💩 "
             if game['status']['abstractGameState'] == 'Live':
                 score_bug = game['linescore']
                 a_score = score_bug['teams']['away']['goals']
@@ -1408,15 +1362,16 @@ class SportsCog(commands.Cog, name="Sports"):
                 h_score = ""
             else:
                 try:
-                    status = pendulum.parse(game['gameDate']).in_tz(
+                    status = dates.local_time(
+                        game['gameDate'],
                         timezone or user_timezone or self.default_tz).format(
                         "h:mm A zz"
                     )
                     if int(game['status']['codedGameState']) == 2:
                         # Pre-game
                         status += " [Warmup]"
-                    if "AM" == pendulum.parse(game['gameDate']).in_tz(
-                        self.default_tz).format("A") and \
+                    if "AM" == dates.local_time(
+                        game['gameDate'], self.default_tz).format("A") and \
                        int(status.split(":")[0]) < 10:
                         status = "Time TBD"
                 except Exception:
@@ -1461,12 +1416,13 @@ class SportsCog(commands.Cog, name="Sports"):
         embed = self._build_embed(embed_data, mobile_output, 0x95A3AE)
 
         if timezone:
-            if not self.user_db.get(member_id):
-                self.user_db[member_id] = {}
-            self.user_db[member_id]['timezone'] = timezone
-            self._save()
+            self.bot.profiles.set(member_id, 'timezone', timezone)
+
+        replies.append(dict(embed=embed))
+
+        self._cache_render(render_key, data, replies)
+        return replies
 
-        await ctx.send(embed=embed)
 
     @commands.command(name='mlb', aliases=['mlbscores', 'baseball'])
     @commands.cooldown(1, 5, commands.BucketType.user)
@@ -1485,7 +1441,13 @@ class SportsCog(commands.Cog, name="Sports"):
              mlb --tz US/Central
              mlb --tz cst bos
         """
+        replies = await self._render_mlb(ctx, optional_input)
+        await self._send_replies(ctx, replies)
 
+    async def _render_mlb(self, ctx, optional_input):
+        """Builds the `mlb` replies without sending them"""
+        replies = []
+        await self.MLB_TEAMS.ensure()
         mobile_output = False
         member = ctx.author
         member_id = str(member.id)
@@ -1493,81 +1455,51 @@ class SportsCog(commands.Cog, name="Sports"):
         if member.is_on_mobile():
             mobile_output = True
 
-        user_timezone = self.user_db.get(member_id, {}).get('timezone')
+        user_timezone = self.bot.profiles.get(member_id, 'timezone')
         LOGGER.debug((user_timezone))
 
-        date = pendulum.now().in_tz(self.default_now_tz).format("YYYY-MM-DD")
-        append_team = ""
-        team = ""
-        timezone = None
-        if optional_input:
-            args = optional_input.split()
-            for idx, arg in enumerate(args):
-                if arg == "--tz":
-                    # grab the user-defined timezone
-                    timezone = args[idx + 1]
-                    # see if it's a short-hand timezone first
-                    timezone = self.short_tzs.get(timezone.lower()) or timezone
-                    # now check if it's valid
-                    try:
-                        _ = pendulum.timezone(timezone)
-                    except Exception:
-                        await ctx.send(
-                            "Sorry that is an invalid timezone "
-                            "(try one from https://nodatime.org/TimeZones)")
-                        return
-                if arg.replace("-", "").isdigit():
-                    date = arg
-                if len(arg.lower()) <= 3:
-                    append_team = self.MLB_TEAMS.get(arg.upper()) or ""
-                    team = arg.upper()
-                if not append_team:
-                    for full_name, id_ in self.MLB_TEAMS.items():
-                        if arg.lower() in full_name.lower():
-                            append_team = id_
-                            break
-                if arg.lower() == "tomorrow":
-                    date = pendulum.tomorrow().in_tz(
-                        user_timezone or self.default_other_tz).format(
-                            "YYYY-MM-DD")
-                elif arg.lower() == "yesterday":
-                    date = pendulum.yesterday().in_tz(
-                        user_timezone or self.default_other_tz).format(
-                            "YYYY-MM-DD")
-
-            if optional_input.lower() == "tomorrow":
-                date = pendulum.tomorrow().in_tz(
-                    user_timezone or self.default_other_tz).format(
-                        "YYYY-MM-DD")
-            elif optional_input.lower() == "yesterday":
-                date = pendulum.yesterday().in_tz(
-                    user_timezone or self.default_other_tz).format(
-                        "YYYY-MM-DD")
+        parsed = self._scoreboard_args(
+            optional_input, self.MLB_TEAMS, user_timezone, "YYYY-MM-DD")
+        if parsed is None:
+            replies.append(dict(
+                content="Sorry that is an invalid timezone "
+                "(try one from https://nodatime.org/TimeZones)"))
+            return replies
+        date, append_team, team, timezone = parsed
 
         url = self.MLB_SCOREBOARD_ENDPOINT.format(date) + str(append_team)
         LOGGER.debug("MLB API called for: {}".format(url))
 
         # data = requests.get(url).json()
-        data = await self.fetch_json(url)
+        data = await self._fetch_scoreboard("MLB", date, append_team, url)
+
+        render_key = ("MLB", str(date), append_team, team, mobile_output,
+                      timezone or user_timezone or self.default_tz)
+        cached = self._cached_render(render_key, data)
+        if cached is not None:
+            if timezone:
+                self.bot.profiles.set(member_id, 'timezone', timezone)
+            return cached
+
         games = data.get('dates', {})
         if not games:
             LOGGER.warn("Something went wrong possibly. (MLB: fetching games)")
-            await ctx.send(
-                "I couldn't find any MLB games for {team}{date}.".format(
+            replies.append(dict(
+                content="I couldn't find any MLB games for {team}{date}.".format(
                     team="{} on ".format(team) if team else "",
                     date=date)
-            )
-            return
+            ))
+            return replies
         else:
             games = games[0].get('games', {})
             if not games:
                 LOGGER.warn("Something went wrong. (MLB: fetching games)")
-                await ctx.send(
-                    "I couldn't find any MLB games for {team}{date}.".format(
+                replies.append(dict(
+                    content="I couldn't find any MLB games for {team}{date}.".format(
                         team="{} on ".format(team) if team else "",
                         date=date)
-                )
-                return
+                ))
+                return replies
 
         # MLB.com API datetime population for doubleheaders is a JOKE.
         # This hack just matches up games and manually sets the time to +5 mins
@@ -1601,8 +1533,8 @@ class SportsCog(commands.Cog, name="Sports"):
         games.sort(
             key=lambda x: status_sortorder[x["status"]["abstractGameState"]])
 
-        games_date = pendulum.parse(games[0]['gameDate']).in_tz(
-            self.default_other_tz).format('MMM Do \'YY')
+        games_date = dates.local_time(
+            games[0]['gameDate'], self.default_other_tz).format('MMM Do \'YY')
         number_of_games = len(games)
         # types_of_games = {
         #     'P': ' **PLAYOFF** ',
@@ -1649,35 +1581,22 @@ class SportsCog(commands.Cog, name="Sports"):
                 home_team = game['teams']['home']['team']['teamName']
             a = "mlb_"+game['teams']['away']['team']['abbreviation'].lower()
             h = "mlb_"+game['teams']['home']['team']['abbreviation'].lower()
-            LOGGER.debug(self.bot.guilds)
-            for tguild in self.bot.guilds:
-                if tguild.name == "mlb":
-                    guild = tguild
-                    break
-            a_team_emoji = get(guild.emojis, name=a)
-            h_team_emoji = get(guild.emojis, name=h)
-            if a_team_emoji:
-                if "nyy" in a:
-                    a_team_emoji = "💩 "
-                a_team_emoji = "{} ".format(a_team_emoji)
-            else:
-                a_team_emoji = ""
-            if h_team_emoji:
-                if "nyy" in h:
-                    h_team_emoji = "💩 "
-                h_team_emoji = "{} ".format(h_team_emoji)
-            else:
-                h_team_emoji = ""
+            a_team_emoji = self._team_emoji("mlb", a)
+            h_team_emoji = self._team_emoji("mlb", h)
+            if a_team_emoji and "nyy" in a:
+                a_team_emoji = "💩 "
+            if h_team_emoji and "nyy" in h:
+                h_team_emoji = "💩 "
             if game['status']['abstractGameState'] == 'Live':
                 if game['status']['detailedState'] == 'Warmup':
                     try:
                         checktz = timezone or user_timezone or self.default_tz
-                        status = pendulum.parse(
-                            game['gameDate']).in_tz(checktz).format(
+                        status = dates.local_time(
+                            game['gameDate'], checktz).format(
                             "h:mm A zz"
                         )
-                        tbd_check = pendulum.parse(
-                            game['gameDate']).in_tz("US/Eastern").format(
+                        tbd_check = dates.local_time(
+                            game['gameDate'], "US/Eastern").format(
                             "h:mm A zz"
                         )
                         if "AM" in tbd_check:
@@ -1760,8 +1679,8 @@ class SportsCog(commands.Cog, name="Sports"):
             else:
                 try:
                     checktz = timezone or user_timezone or self.default_tz
-                    status = pendulum.parse(
-                        game['gameDate']).in_tz(checktz).format(
+                    status = dates.local_time(
+                        game['gameDate'], checktz).format(
                         "h:mm A zz"
                     )
                     if "AM" in status:
@@ -1903,10 +1822,7 @@ class SportsCog(commands.Cog, name="Sports"):
                 ppd_embed_data, mobile_output, 0xCD0001)
 
         if timezone:
-            if not self.user_db.get(member_id):
-                self.user_db[member_id] = {}
-            self.user_db[member_id]['timezone'] = timezone
-            self._save()
+            self.bot.profiles.set(member_id, 'timezone', timezone)
 
         memes = [
             "COVID19 gonna cancel this shit",
@@ -1918,18 +1834,18 @@ class SportsCog(commands.Cog, name="Sports"):
         ]
 
         if multi:
-            await ctx.send(
-                content='**{}**'.format(random.choice(memes)), embed=embed1)
-            await ctx.send(embed=embed2)
+            replies.append(dict(
+                content='**{}**'.format(random.choice(memes)), embed=embed1))
+            replies.append(dict(embed=embed2))
         else:
-            try:
-                await ctx.send(
-                    content='**{}**'.format(random.choice(memes)), embed=embed)
-            except discord.errors.HTTPException as err:
-                LOGGER.error(err)
-                pass
+            replies.append(dict(
+                content='**{}**'.format(random.choice(memes)), embed=embed))
         if ppd_details:
-            await ctx.send(embed=ppd_embed)
+            replies.append(dict(embed=ppd_embed))
+
+        self._cache_render(render_key, data, replies)
+        return replies
+
 
     @commands.command(name='nba', aliases=['nbascores', 'basketball'])
     @commands.cooldown(1, 5, commands.BucketType.user)
@@ -1948,83 +1864,63 @@ class SportsCog(commands.Cog, name="Sports"):
              nba --tz US/Mountain
              nba --tz mst bos
         """
+        replies = await self._render_nba(ctx, optional_input)
+        await self._send_replies(ctx, replies)
 
+    async def _render_nba(self, ctx, optional_input):
+        """Builds the `nba` replies without sending them"""
+        replies = []
+        await self.NBA_TEAMS.ensure()
         mobile_output = False
         member = ctx.author
         member_id = str(member.id)
         if member.is_on_mobile():
             mobile_output = True
 
-        user_timezone = self.user_db.get(member_id, {}).get('timezone')
-        # LOGGER.debug((user_timezone, self.user_db))
+        user_timezone = self.bot.profiles.get(member_id, 'timezone')
 
-        date = pendulum.now().in_tz(self.default_now_tz).format("YYYYMMDD")
-        append_team = ""
-        team = ""
-        timezone = None
-        if optional_input:
-            args = optional_input.split()
-            for idx, arg in enumerate(args):
-                if arg == "--tz":
-                    # grab the user-defined timezone
-                    timezone = args[idx + 1]
-                    # see if it's a short-hand timezone first
-                    timezone = self.short_tzs.get(timezone.lower()) or timezone
-                    # now check if it's valid
-                    try:
-                        _ = pendulum.timezone(timezone)
-                    except Exception:
-                        await ctx.send(
-                            "Sorry that is an invalid timezone "
-                            "(try one from https://nodatime.org/TimeZones)")
-                        return
-                if arg.replace("-", "").isdigit():
-                    date = arg.replace("-", "")
-                if len(arg.lower()) <= 3:
-                    append_team = self.NBA_TEAMS.get(arg.upper()) or ""
-                    team = arg.upper()
-                if not append_team:
-                    for full_name, id_ in self.NBA_TEAMS.items():
-                        if arg.lower() in full_name.lower():
-                            append_team = id_
-                            team = id_.upper()
-                            break
-                if arg.lower() == "tomorrow":
-                    date = pendulum.tomorrow().in_tz(
-                        user_timezone or self.default_other_tz).format(
-                            "YYYYMMDD")
-                elif arg.lower() == "yesterday":
-                    date = pendulum.yesterday().in_tz(
-                        user_timezone or self.default_other_tz).format(
-                            "YYYYMMDD")
-
-            if optional_input.lower() == "tomorrow":
-                date = pendulum.tomorrow().in_tz(
-                    user_timezone or self.default_other_tz).format("YYYYMMDD")
-            elif optional_input.lower() == "yesterday":
-                date = pendulum.yesterday().in_tz(
-                    user_timezone or self.default_other_tz).format("YYYYMMDD")
+        parsed = self._scoreboard_args(
+            optional_input, self.NBA_TEAMS, user_timezone, "YYYYMMDD")
+        if parsed is None:
+            replies.append(dict(
+                content="Sorry that is an invalid timezone "
+                "(try one from https://nodatime.org/TimeZones)"))
+            return replies
+        date, append_team, team, timezone = parsed
+        if append_team:
+            # every key of the NBA directory resolves to a tricode
+            team = append_team
 
         url = self.NBA_SCOREBOARD_ENDPOINT.format(date)
         LOGGER.debug("NBA API called for: {}".format(url))
 
         # data = requests.get(url).json()
-        data = await self.fetch_json(url)
+        data = await self._fetch_scoreboard("NBA", date, "", url)
+
+        render_key = ("NBA", str(date), append_team, team, mobile_output,
+                      timezone or user_timezone or self.default_tz)
+        cached = self._cached_render(render_key, data)
+        if cached is not None:
+            if timezone:
+                self.bot.profiles.set(member_id, 'timezone', timezone)
+            return cached
+
         games = data.get('games', {})
         if not games:
             LOGGER.warn("Something went wrong possibly. (NBA: fetching games)")
-            await ctx.send(
-                "I couldn't find any NBA games for {team}{date}.".format(
+            replies.append(dict(
+                content="I couldn't find any NBA games for {team}{date}.".format(
                     team="{} on ".format(team) if team else "",
                     date=date)
-            )
-            return
+            ))
+            return replies
 
         sortorder = {2: 0, 1: 1, 3: 2}
         games.sort(key=lambda x: sortorder[x["statusNum"]])
 
-        games_date = pendulum.parse(games[0]['startTimeUTC']).in_tz(
-            self.default_other_tz).format('MMM Do \'YY')
+        games_date = dates.local_time(
+            games[0]['startTimeUTC'], self.default_other_tz).format(
+            'MMM Do \'YY')
         # number_of_games = len(games)
 
         away = ""
@@ -2038,29 +1934,17 @@ class SportsCog(commands.Cog, name="Sports"):
                 away_team = game['vTeam']['triCode']
                 home_team = game['hTeam']['triCode']
             else:
-                away_team = self.NBA_TEAMS.get(game['vTeam']['triCode'], "")
-                home_team = self.NBA_TEAMS.get(game['hTeam']['triCode'], "")
+                away_team = self.NBA_TEAMS.name(game['vTeam']['triCode'], "")
+                home_team = self.NBA_TEAMS.name(game['hTeam']['triCode'], "")
             a = "nba_"+game['vTeam']['triCode'].lower()
             h = "nba_"+game['hTeam']['triCode'].lower()
-            for tguild in self.bot.guilds:
-                if tguild.name == "nba":
-                    guild = tguild
-                    break
-            a_team_emoji = get(guild.emojis, name=a)
-            h_team_emoji = get(guild.emojis, name=h)
+            a_team_emoji = self._team_emoji("nba", a)
+            h_team_emoji = self._team_emoji("nba", h)
             # blank = get(ctx.guild.emojis, name="blank")
-            if a_team_emoji:
-                if "lal" in a:
-                    a_team_emoji = "💩 "
-                a_team_emoji = "{} ".format(a_team_emoji)
-            else:
-                a_team_emoji = ""
-            if h_team_emoji:
-                if "lal" in h:
-                    h_team_emoji = "💩 "
-                h_team_emoji = "{} ".format(h_team_emoji)
-            else:
-                h_team_emoji = ""
+            if a_team_emoji and "lal" in a:
+                a_team_emoji = "💩 "
+            if h_team_emoji and "lal" in h:
+                h_team_emoji = "💩 "
             if game['statusNum'] == 2:
                 a_score = int(game['vTeam']['score'])
                 h_score = int(game['hTeam']['score'])
@@ -2110,7 +1994,8 @@ class SportsCog(commands.Cog, name="Sports"):
                 h_score = ""
             else:
                 try:
-                    status = pendulum.parse(game['startTimeUTC']).in_tz(
+                    status = dates.local_time(
+                        game['startTimeUTC'],
                         timezone or user_timezone or self.default_tz).format(
                         "h:mm A zz"
                     )
@@ -2162,12 +2047,12 @@ class SportsCog(commands.Cog, name="Sports"):
                 games_found += 1
 
         if games_found == 0:
-            await ctx.send(
-                "I couldn't find any NBA games for {team}{date}.".format(
+            replies.append(dict(
+                content="I couldn't find any NBA games for {team}{date}.".format(
                     team="{} on ".format(team) if team else "",
                     date=date)
-            )
-            return
+            ))
+            return replies
 
         content = ""
         if games[0].get("playoffs"):
@@ -2192,51 +2077,98 @@ class SportsCog(commands.Cog, name="Sports"):
         embed = self._build_embed(embed_data, mobile_output, 0x17408B)
 
         if timezone:
-            if not self.user_db.get(member_id):
-                self.user_db[member_id] = {}
-            self.user_db[member_id]['timezone'] = timezone
-            self._save()
+            self.bot.profiles.set(member_id, 'timezone', timezone)
+
+        replies.append(dict(embed=embed))
+
+        self._cache_render(render_key, data, replies)
+        return replies
 
-        await ctx.send(embed=embed)
 
 ###
 # Helpers
 ###
 
-    def _parse_optinput(self, ctx, optional_input):
-        date = pendulum.now()
+    def _scoreboard_args(self, optional_input, teams, user_timezone,
+                         fmt=None):
+        """The date, team and --tz asked for in a league command
+
+        Returns (date, append_team, team, timezone), with the date formatted
+        with `fmt` (a DateTime when there's no `fmt`), or None when --tz
+        isn't a timezone. Without a team directory the leftover words are
+        taken as the team as-is.
+        """
+        args = self.scoreboard_options.parse(optional_input or "")
+        if 'tz' in args.errors:
+            return None
+        timezone = args.get('tz')
+
+        date = dates.now(self.default_now_tz)
+        if args.day in ("tomorrow", "yesterday"):
+            date = dates.now(user_timezone or self.default_other_tz).add(
+                days=1 if args.day == "tomorrow" else -1)
+        elif args.day and args.day != "today":
+            if not fmt:
+                try:
+                    date = pendulum.parse(args.day, strict=False)
+                except Exception as err:
+                    LOGGER.debug(err)
+            elif "-" in fmt:
+                date = args.day
+            else:
+                date = args.day.replace("-", "")
+        if fmt and not isinstance(date, str):
+            date = date.format(fmt)
+
         append_team = ""
-        timezone = ""
-        args_dev = self._parseargs(optional_input)
-        # print(args_dev)
-        if args_dev.get('--tz'):
-            # grab the user-defined timezone
-            timezone = args_dev.get('--tz')
-            # see if it's a short-hand timezone first
-            timezone = self.short_tzs.get(timezone.lower()) or timezone
-            # now check if it's valid
-            try:
-                _ = pendulum.timezone(timezone)
-            except Exception:
-                # await ctx.send(
-                #     "Sorry that is an invalid timezone "
-                #     "(try one from https://nodatime.org/TimeZones)"
-                # )
-                return
-        if args_dev.get('extra_text', '').lower() == "yesterday":
-            date = pendulum.yesterday().in_tz(user_timezone or self.default_other_tz)
-        elif args_dev.get('extra_text', '').lower() == "tomorrow":
-            date = pendulum.tomorrow().in_tz(user_timezone or self.default_other_tz)
-        else:
+        team = ""
+        if teams is None:
+            append_team = args.text.lower()
+        for word in args.words if teams is not None else ():
+            if len(word) <= 3:
+                team = word.upper()
+                append_team = teams.get(team) or ""
+                if append_team:
+                    break
+            append_team = teams.lookup(word) or ""
+            if append_team:
+                break
+        return date, append_team, team, timezone
+
+    def _timezone(self, name):
+        """A --tz value as a real zone name, short forms like "pst" included"""
+        zone = dates.timezone(name)
+        if zone is None:
+            raise ValueError(f"unknown timezone {name}")
+        return zone.name
+
+    async def _send_replies(self, ctx, replies, placeholder=None):
+        """Sends what a _render_* method built, optionally editing the first
+        reply into an existing placeholder message
+        """
+        for reply in replies:
             try:
-                date = pendulum.parse(
-                    args_dev.get('extra_text'), 
-                    strict=False
-                )
-            except:
-                append_team = args_dev.get('extra_text').lower()
-        
-        return date, append_team, timezone, args_dev
+                if placeholder:
+                    await placeholder.edit(
+                        content=reply.get('content'),
+                        embed=reply.get('embed'),
+                    )
+                    placeholder = None
+                else:
+                    await ctx.send(**reply)
+            except discord.errors.HTTPException as err:
+                LOGGER.error(err)
+
+    async def _fill_placeholder(self, ctx, league, task, placeholder, timeout):
+        """Waits out a slow league, then edits its results in place"""
+        try:
+            replies = await asyncio.wait_for(task, timeout=timeout)
+        except asyncio.TimeoutError:
+            replies = [dict(content=f"Timed out fetching {league} scores")]
+        except Exception as err:
+            LOGGER.error(f"[{league}] {err}")
+            replies = [dict(content=f"I couldn't fetch {league} scores")]
+        await self._send_replies(ctx, replies, placeholder=placeholder)
 
     def _strikethrough(self, text):
         return "~~{}~~".format(text)
@@ -2349,44 +2281,12 @@ class SportsCog(commands.Cog, name="Sports"):
 
         return embed
 
-    def _save(self):
-        # with open('data/sports_db.json', 'w+') as f:
-        #     json.dump(self.user_db, f)
-        _ = pickle.dumps(self.user_db)
-        self.bot.db.set('sports_db', _)
-
-    def _fetch_teams(self, mode):
-        if mode == "NHL":
-            data = requests.get(
-                "https://statsapi.web.nhl.com/api/v1/teams").json()
-            data = data['teams']
-            teams = {}
-            for team in data:
-                teams[team['abbreviation']] = team['id']
-                teams[team['name']] = team['id']
-            return teams
-        if mode == "MLB":
-            data = requests.get(
-                "https://statsapi.mlb.com/api/v1/teams?sportId=1").json()
-            data = data['teams']
-            teams = {}
-            for team in data:
-                teams[team['abbreviation']] = team['id']
-                teams[team['name']] = team['id']
-            return teams
-        if mode == "NBA":
-            year = pendulum.now().year
-            year -= 1
-            data = requests.get(
-                f"http://data.nba.net/data/10s/prod/v1/{year}/teams.json")
-            data = data.json()
-            data = data['league']['standard']
-            teams = {}
-            for team in data:
-                if team['isNBAFranchise']:
-                    teams[team['tricode']] = team['nickname']
-                    teams[team['fullName']] = team['tricode']
-            return teams
+    def _team_emoji(self, league, name):
+        """A team's icon from its league's guild, ready to put in front of
+        the team name, or "" when there isn't one
+        """
+        emoji = self.bot.emoji_index.get(league, name)
+        return "{} ".format(emoji) if emoji else ""
 
 
 def setup(bot):
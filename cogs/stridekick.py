@@ -2,28 +2,19 @@ import discord
 from discord.ext import commands, tasks
 from discord.utils import get
 
-import requests
 import pendulum
-import aiohttp
-from tempfile import mkstemp
-import subprocess
 import logging
 import coloredlogs
 import random
 import os
 import time
 import json
-import redis
-import shlex
-import pickle
 
 from re import sub
 import boto3
-import requests
 import pendulum
 # import pandas as pd
 from botocore.config import Config
-from requests.api import head
 from warrant.aws_srp import AWSSRP
 
 
@@ -79,28 +70,15 @@ class StridekickCog(commands.Cog, name="Stridekick"):
             "pdt": "US/Pacific"
         }
 
-        try:
-            _ = self.db.get('sports_db')
-            self.user_db = pickle.loads(_)
-        except Exception as e:
-            LOGGER.debug(e)
-            self.user_db = {}
-
 
     @tasks.loop(seconds=5)
     async def _auth(self):
         now = pendulum.now()
         if not self.token or now >= self.expires:
             print(self.expires.to_iso8601_string())
-            client = boto3.client('cognito-idp', region_name='us-east-1', config=Config(signature_version="UNSIGNED"))
-            aws = AWSSRP(
-                username=self.bot.environs.get("STRIDEKICK_USER"),
-                password=self.bot.environs.get("STRIDEKICK_PASS"),
-                pool_id=self.bot.environs.get("STRIDEKICK_POOL"),
-                client_id=self.bot.environs.get("STRIDEKICK_CLNT"),
-                client=client,
-            )
-            tokens = aws.authenticate_user()
+            # boto3 is sync-only, keep client setup and the SRP round trips
+            # off the loop
+            tokens = await self.bot.run_blocking(self._authenticate)
             id_token = tokens['AuthenticationResult']['IdToken']
             refresh_token = tokens['AuthenticationResult']['RefreshToken']
             access_token = tokens['AuthenticationResult']['AccessToken']
@@ -120,36 +98,20 @@ class StridekickCog(commands.Cog, name="Stridekick"):
             return
 
 
-    @classmethod
-    def _parseargs(self, passed_args):
-        if passed_args:
-            # passed_args = passed_args.replace("'", '')
-            args = shlex.split(passed_args)
-            # options = {}
-
-            options = {
-                k: True if v.startswith('-') else v
-                for k,v in zip(args, args[1:]+["--"]) if k.startswith('-')
-            }
-
-            extra = args
-            if options:
-                extra = []
-                for k,v in options.items():
-                    for arg in args:
-                        if arg != k and arg != v:
-                            extra.append(arg)
+    def _authenticate(self):
+        client = boto3.client('cognito-idp', region_name='us-east-1', config=Config(signature_version="UNSIGNED"))
+        aws = AWSSRP(
+            username=self.bot.environs.get("STRIDEKICK_USER"),
+            password=self.bot.environs.get("STRIDEKICK_PASS"),
+            pool_id=self.bot.environs.get("STRIDEKICK_POOL"),
+            client_id=self.bot.environs.get("STRIDEKICK_CLNT"),
+            client=client,
+        )
+        return aws.authenticate_user()
 
-            options['extra_text'] = ' '.join(extra)
-            return options
-        else:
-            return {}
 
-    @staticmethod
-    async def fetch_json(url: str):
-        async with aiohttp.ClientSession() as cs:
-            async with cs.get(url) as r:
-                return await r.json()
+    async def fetch_json(self, url: str):
+        return await self.bot.web.fetch_json(url)
 
     @commands.command(name='testsk')
     async def test_stridekick(self, ctx, *, optional_input: str = None):
@@ -202,11 +164,11 @@ class StridekickCog(commands.Cog, name="Stridekick"):
             },
         ]
 
-        data = requests.post(base_api, json=payload, headers=headers)
+        data = await self.bot.web.post_json(base_api, payload, headers=headers)
 
         active_challenge = None
 
-        for subdata in data.json():
+        for subdata in data:
             d = subdata.get('data', {})
             me = d.get('me', {})
             groups = me.get('groups', [{}])
@@ -315,10 +277,8 @@ class StridekickCog(commands.Cog, name="Stridekick"):
             }
         ]
 
-        response = requests.post(base_api, headers=headers, json=payload)
-
-
-        json_data = response.json()
+        json_data = await self.bot.web.post_json(
+            base_api, payload, headers=headers)
         challenge = json_data[0].get('data', {})
 
         temp_color = int("0x{}".format(
@@ -480,8 +440,7 @@ class StridekickCog(commands.Cog, name="Stridekick"):
             },
         ]
 
-        data = requests.post(base_api, json=payload, headers=headers)
-        json = data.json()
+        json = await self.bot.web.post_json(base_api, payload, headers=headers)
         historic_data = {}
 
         historic_data[json[0]['data']['me']['username']] = (json[0]['data']['me']['activity']['steps'], json[0]['data']['me']['activity']['distance'], json[0]['data']['me']['avatar'])
@@ -1,9 +1,6 @@
 import os
 import logging
 import coloredlogs
-import aiohttp
-import redis
-import pickle
 import pendulum
 import re
 from urllib.parse import quote_plus
@@ -30,35 +27,9 @@ class WeatherCog(commands.Cog, name="Weather"):
         self.google_api_key = os.environ.get("GOOGLE_API_KEY")
         self.weather_api_key = os.environ.get("WEATHER_API_KEY")
 
-        try:
-            self.db = redis.from_url(
-                os.environ.get("REDIS_URL"),
-                socket_timeout=3
-            )
-        except Exception as e:
-            LOGGER.error(e)
-            pass
-
-        try:
-            _ = self.db.get('sports_db')
-            self.user_db = pickle.loads(_)
-        except Exception as e:
-            LOGGER.debug(e)
-            self.user_db = {}
-
-    # @classmethod
-    def _save(self):
-        _ = pickle.dumps(self.user_db)
-        self.db.set('sports_db', _)
-
-    @staticmethod
-    async def fetch_json(url: str, headers=None):
+    async def fetch_json(self, url: str, headers=None):
         LOGGER.debug(url)
-        async with aiohttp.ClientSession() as cs:
-            # print(headers)
-            async with cs.get(url, headers=headers) as r:
-                # print(r.headers)
-                return await r.json()
+        return await self.bot.web.fetch_json(url, headers=headers)
 
     @commands.command(name='aqi', aliases=['airquality'])
     @commands.cooldown(1, 30, commands.BucketType.user)
@@ -67,7 +38,7 @@ class WeatherCog(commands.Cog, name="Weather"):
 
         member = ctx.author
         member_id = str(member.id)
-        user_location = self.user_db.get(member_id, {}).get('location')
+        user_location = self.bot.profiles.get(member_id, 'location')
 
         optional_input = optional_input or user_location
         if not optional_input:
@@ -202,10 +173,7 @@ class WeatherCog(commands.Cog, name="Weather"):
         # await ctx.send(content=f"**{raw_feed.feed.title}**", embed=embed)
 
         if optional_input:
-            if not self.user_db.get(member_id):
-                self.user_db[member_id] = {}
-            self.user_db[member_id]['location'] = optional_input
-            self._save()
+            self.bot.profiles.set(member_id, 'location', optional_input)
 
     @commands.command(name='weather', aliases=['w', 'wz'])
     # @commands.cooldown(1, 30, commands.BucketType.user)
@@ -214,7 +182,7 @@ class WeatherCog(commands.Cog, name="Weather"):
 
         member = ctx.author
         member_id = str(member.id)
-        user_location = self.user_db.get(member_id, {}).get('location')
+        user_location = self.bot.profiles.get(member_id, 'location')
 
         optional_input = optional_input or user_location
         if not optional_input:
@@ -233,10 +201,7 @@ class WeatherCog(commands.Cog, name="Weather"):
             await ctx.send(embed=embed)
 
         if optional_input:
-            if not self.user_db.get(member_id):
-                self.user_db[member_id] = {}
-            self.user_db[member_id]['location'] = optional_input
-            self._save()
+            self.bot.profiles.set(member_id, 'location', optional_input)
 
     async def _build_alert_embed(self, alerts, tz):
         """Build weather alerts embed and return"""
@@ -9,7 +9,14 @@ import logging
 import coloredlogs
 
 from dotenv import dotenv_values, load_dotenv
-import redis
+
+from utils.aio import BlockingPool, LoopWatchdog
+from utils.broadcast import Broadcaster
+from utils.emoji import EmojiIndex
+from utils.profiles import ProfileService
+from utils.storage import migrate_pickles, open_store
+from utils.teams import league_directories
+from utils.web import WebClient
 
 try:
     # dev build only requires this
@@ -43,18 +50,44 @@ class Bot(commands.Bot):
 
         )
 
-        try:
-            self.db = redis.from_url(
-                os.environ.get("REDIS_URL"),
-                socket_timeout=3
-            )
-        except Exception as e:
-            LOGGER.error(e)
-            self.db = {}
-            pass
-
         self.environs = environvars
 
+        # one pooled HTTP client for every cog, see utils/web.py
+        self.web = WebClient.from_env(self.environs)
+        # anything that can't be made async runs here instead of on the loop
+        self.blocking = BlockingPool(
+            max_workers=int(self.environs.get("BLOCKING_WORKERS", 4)))
+        # per-user settings and tracker state, see utils/storage.py
+        self.store = open_store(self.environs, run_blocking=self.run_blocking)
+        migrate_pickles(self.store)
+        # every cog reads and saves user settings through here
+        self.profiles = ProfileService(self.store)
+        # team icons by (league guild, emoji name), kept current by listeners
+        self.emoji_index = EmojiIndex(self)
+        # team lookups shared by every league command and the scores alerts
+        self.teams = league_directories(self.web)
+        # alerts going out to many channels, one worker per channel
+        self.broadcaster = Broadcaster(self)
+        self.watchdog = LoopWatchdog(
+            threshold_ms=int(self.environs.get("LOOP_LAG_MS", 250)))
+
+    async def run_blocking(self, func, *args, **kwargs):
+        return await self.blocking.run(func, *args, **kwargs)
+
+    async def start(self, *args, **kwargs):
+        self.watchdog.start()
+        await super().start(*args, **kwargs)
+
+    async def close(self):
+        # cogs save their state as they unload, so let that happen first
+        await super().close()
+        self.broadcaster.close()
+        self.watchdog.stop()
+        await self.web.close()
+        await self.store.flush()
+        self.blocking.shutdown()
+        self.store.close()
+
 def get_prefix(bot, message):
     """A callable Prefix for our bot. This could be edited to allow per server prefixes."""
 
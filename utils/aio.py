@@ -0,0 +1,110 @@
+import asyncio
+import functools
+import logging
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import coloredlogs
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class BlockingPool:
+    """Small bounded thread pool for the bits of code that can't be async
+    (boto3, redis-py, subprocess setup, ...) so they never run on the loop
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="blocking",
+        )
+
+    async def run(self, func, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+class LoopWatchdog:
+    """Logs any callback that blocks the event loop for longer than
+    `threshold_ms`
+
+    A heartbeat task on the loop stamps the time every `interval` seconds
+    while a plain thread watches the stamp. When the stamp goes stale the
+    thread logs the loop thread's current stack (i.e. the offender), and
+    the heartbeat logs the total stall once the loop comes back.
+    """
+
+    def __init__(self, threshold_ms=250, interval=0.1):
+        self.threshold = threshold_ms / 1000
+        self.interval = interval
+        self._last_beat = time.monotonic()
+        self._loop_thread = None
+        self._task = None
+        self._thread = None
+        self._stopped = threading.Event()
+        self.worst_lag = 0.0
+
+    def start(self):
+        if self._task is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.ensure_future(self._heartbeat())
+        self._thread = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _heartbeat(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._last_beat = now
+            lag = now - expected
+            if lag > self.threshold:
+                self.worst_lag = max(self.worst_lag, lag)
+                LOGGER.warning(
+                    f"event loop was blocked for {lag * 1000:.0f}ms")
+
+    def _watch(self):
+        reported = None
+        while not self._stopped.wait(self.interval):
+            beat = self._last_beat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled <= self.threshold or reported == beat:
+                continue
+            # only dump the stack once per stall
+            reported = beat
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame, limit=8))
+            LOGGER.warning(
+                f"event loop blocked for over {stalled * 1000:.0f}ms in:\n"
+                f"{stack}"
+            )
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+
+import coloredlogs
+import discord
+from discord.http import Route
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class Broadcaster:
+    """Outbound queue for alerts that go to many channels
+
+    send() only queues the embed; every channel has its own worker, so a
+    slow or rate limited channel holds up nobody else. Whatever piled up
+    for a channel since its last message goes out together as one message
+    with up to `max_embeds` embeds and `max_chars` characters of embed text,
+    Discord's per-message limits (a discord.py 1.x send() can only carry
+    one, so this posts through the HTTP client directly, which still
+    applies Discord's per-route buckets and retries 429s). A message that
+    still fails with a 429 or 5xx is retried `retries` more times before
+    it's dropped.
+    """
+
+    def __init__(self, bot, *, max_embeds=10, max_chars=6000, retries=3):
+        self.bot = bot
+        self.max_embeds = max_embeds
+        self.max_chars = max_chars
+        self.retries = retries
+        self._queues = {}   # channel id -> asyncio.Queue of (queued at, embed)
+        self._workers = {}  # channel id -> task
+        self.sent = 0
+        self.messages = 0
+        self.failed = 0
+        self.last_latency = 0.0
+        self.worst_latency = 0.0
+
+    def send(self, channel_id, embed):
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = asyncio.Queue()
+        queue.put_nowait((time.monotonic(), embed))
+        worker = self._workers.get(channel_id)
+        if worker is None or worker.done():
+            self._workers[channel_id] = asyncio.ensure_future(
+                self._work(channel_id, queue))
+
+    def broadcast(self, channel_ids, embed):
+        for channel_id in channel_ids:
+            self.send(channel_id, embed)
+
+    def depth(self):
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    def stats(self):
+        return {
+            'channels': len(self._queues),
+            'queued': self.depth(),
+            'sent': self.sent,
+            'messages': self.messages,
+            'failed': self.failed,
+            'last_latency': self.last_latency,
+            'worst_latency': self.worst_latency,
+        }
+
+    async def _work(self, channel_id, queue):
+        pending = None
+        while pending or not queue.empty():
+            batch = [pending or queue.get_nowait()]
+            pending = None
+            # an embed over the limit on its own still goes out, alone
+            chars = len(batch[0][1])
+            while len(batch) < self.max_embeds and not queue.empty():
+                item = queue.get_nowait()
+                if chars + len(item[1]) > self.max_chars:
+                    pending = item
+                    break
+                batch.append(item)
+                chars += len(item[1])
+            await self._deliver(channel_id, batch)
+
+    async def _deliver(self, channel_id, batch):
+        route = Route('POST', '/channels/{channel_id}/messages',
+                      channel_id=channel_id)
+        payload = {'embeds': [embed.to_dict() for _, embed in batch]}
+        for attempt in range(self.retries + 1):
+            try:
+                await self.bot.http.request(route, json=payload)
+                break
+            except discord.HTTPException as err:
+                if err.status != 429 and err.status < 500 \
+                        or attempt == self.retries:
+                    self.failed += len(batch)
+                    LOGGER.error(f"[{channel_id}] dropped {len(batch)} "
+                                 f"alerts ({err.status}): {err}")
+                    return
+                LOGGER.warning(f"[{channel_id}] {err.status}, retrying")
+                await asyncio.sleep(2 ** attempt)
+            except Exception as err:
+                self.failed += len(batch)
+                LOGGER.error(f"[{channel_id}] dropped {len(batch)} "
+                             f"alerts: {err}")
+                return
+        latency = time.monotonic() - batch[0][0]
+        self.sent += len(batch)
+        self.messages += 1
+        self.last_latency = latency
+        self.worst_latency = max(self.worst_latency, latency)
+        if len(batch) > 1:
+            LOGGER.debug(f"[{channel_id}] sent {len(batch)} alerts at once")
+
+    def close(self):
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+import coloredlogs
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class TTLCache:
+    """In-memory LRU cache where every entry carries its own TTL
+
+    get_or_fetch() is single-flight: while a key is being loaded, anyone
+    else asking for it waits on that same fetch instead of starting another.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._data = OrderedDict()  # key -> (expires_at, value)
+        self._inflight = {}
+        self.hits = 0
+        self.misses = 0
+        self.joins = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key, value, ttl):
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        self._data.clear()
+
+    async def get_or_fetch(self, key, fetch, ttl):
+        """Return the cached value for `key`, loading it with `fetch()` on a
+        miss
+
+        `ttl` is either seconds or a callable that gets the fresh value and
+        returns seconds, so the lifetime can depend on what came back.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, fetch, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._loaded(key, t))
+        else:
+            self.joins += 1
+        # shield so one impatient caller can't cancel everyone else's fetch
+        return await asyncio.shield(task)
+
+    async def _load(self, key, fetch, ttl):
+        value = await fetch()
+        seconds = ttl(value) if callable(ttl) else ttl
+        if seconds and seconds > 0:
+            self.set(key, value, seconds)
+        return value
+
+    def _loaded(self, key, task):
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception():
+            # nobody may be left waiting, don't let asyncio complain
+            LOGGER.debug(f"fetch for {key} failed: {task.exception()}")
+
+    def stats(self):
+        lookups = self.hits + self.misses + self.joins
+        return {
+            'entries': len(self._data),
+            'inflight': len(self._inflight),
+            'hits': self.hits,
+            'misses': self.misses,
+            'joins': self.joins,
+            'hit_rate': (self.hits + self.joins) / lookups if lookups else 0,
+        }
+
+
+_MISSING = object()
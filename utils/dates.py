@@ -0,0 +1,84 @@
+import bisect
+import functools
+import time
+
+import pendulum
+
+
+SHORT_TZS = {
+    "edt": "US/Eastern",
+    "est": "US/Eastern",
+    "cdt": "US/Central",
+    "cst": "US/Central",
+    "mst": "US/Mountain",
+    "mdt": "US/Mountain",
+    "pst": "US/Pacific",
+    "pdt": "US/Pacific"
+}
+
+
+@functools.lru_cache(maxsize=256)
+def timezone(name):
+    """The pendulum Timezone for a zone name or short form like "pst", None
+    when there's no such zone (that gets remembered too)
+    """
+    zone = SHORT_TZS.get(name.lower()) or name
+    try:
+        return pendulum.timezone(zone)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def local_time(stamp, tz):
+    """An ISO 8601 string or epoch seconds from a feed, in `tz`
+
+    Feeds repeat the same start times on every refresh, so each
+    (stamp, tz) pair is only parsed and converted once.
+    """
+    if isinstance(stamp, (int, float)):
+        return pendulum.from_timestamp(stamp, tz=tz)
+    return pendulum.parse(stamp).in_tz(tz)
+
+
+_now = {}  # tz -> (minute, DateTime)
+
+
+def now(tz):
+    """pendulum.now(tz), worked out at most once a minute per zone
+
+    Good enough for picking "today" and comparing dates, not for timing.
+    """
+    minute = int(time.time() // 60)
+    cached = _now.get(tz)
+    if cached is None or cached[0] != minute:
+        cached = _now[tz] = (minute, pendulum.now(tz))
+    return cached[1]
+
+
+class WeekTable:
+    """Season weeks keyed by the day they start on, found with bisect
+
+    `weeks` maps "YYYY-MM-DD" start days to whatever a week is described
+    by; the days are parsed once here instead of on every lookup. Moments
+    before the first week get the first one and after the last week the
+    last one.
+    """
+
+    def __init__(self, weeks, tz="UTC"):
+        starts = sorted(
+            (pendulum.parse(day, tz=tz).int_timestamp, day)
+            for day in weeks)
+        self._starts = [stamp for stamp, _ in starts]
+        self._weeks = [weeks[day] for _, day in starts]
+
+    def __len__(self):
+        return len(self._weeks)
+
+    def at(self, moment=None):
+        """The week `moment` (a DateTime, default now) falls in"""
+        if not self._weeks:
+            return None
+        stamp = time.time() if moment is None else moment.timestamp()
+        idx = bisect.bisect_right(self._starts, stamp) - 1
+        return self._weeks[max(idx, 0)]
@@ -0,0 +1,83 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
+import coloredlogs
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class DedupeStore:
+    """Remembers what has already been announced so it only goes out once
+
+    Entries are keyed by a stable content digest (unlike hash(), the same
+    parts give the same key in every process) and kept in insertion order,
+    so lookups are O(1) and expiry only ever looks at the oldest entries.
+    Anything older than `max_age` seconds is dropped, and so is the oldest
+    entry once there are more than `maxsize`.
+    """
+
+    def __init__(self, max_age=36 * 60 * 60, maxsize=10000):
+        self.max_age = max_age
+        self.maxsize = maxsize
+        self._seen = OrderedDict()  # digest -> first seen (epoch seconds)
+
+    def __len__(self):
+        return len(self._seen)
+
+    def __contains__(self, digest):
+        self.prune()
+        return digest in self._seen
+
+    @staticmethod
+    def key(*parts):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\x1f".join(str(part) for part in parts).encode())
+        return digest.hexdigest()
+
+    def seen(self, *parts):
+        """Whether this combination of parts was already added"""
+        return self.key(*parts) in self
+
+    def add(self, *parts):
+        digest = self.key(*parts)
+        self._seen[digest] = time.time()
+        self._seen.move_to_end(digest)
+        while len(self._seen) > self.maxsize:
+            self._seen.popitem(last=False)
+
+    def prune(self, now=None):
+        cutoff = (now or time.time()) - self.max_age
+        while self._seen:
+            digest, stamp = next(iter(self._seen.items()))
+            if stamp > cutoff:
+                break
+            del self._seen[digest]
+
+    def snapshot(self):
+        """JSON-friendly copy of the store, oldest first"""
+        self.prune()
+        return [[digest, stamp] for digest, stamp in self._seen.items()]
+
+    @classmethod
+    def restore(cls, snapshot, **kwargs):
+        """Rebuild a store from snapshot(); anything unreadable gives an
+        empty store
+        """
+        store = cls(**kwargs)
+        try:
+            for digest, stamp in snapshot or []:
+                store._seen[digest] = float(stamp)
+        except Exception as err:
+            LOGGER.debug(f"starting with empty dedupe store: {err}")
+            store._seen.clear()
+        store.prune()
+        return store
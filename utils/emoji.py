@@ -0,0 +1,72 @@
+import logging
+
+import coloredlogs
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class EmojiIndex:
+    """Custom emoji looked up by (guild name, emoji name) in O(1)
+
+    Team icons live in one guild per league ("mlb", "nhl", ...), so callers
+    ask for e.g. ("mlb", "mlb_sf"). Each guild is indexed when it becomes
+    available and re-indexed whenever its emojis (or name) change, so
+    nothing has to walk bot.guilds / guild.emojis while rendering.
+    """
+
+    def __init__(self, bot):
+        self._index = {}   # (guild name, emoji name) -> (str form, url)
+        self._guilds = {}  # guild id -> guild name it was indexed under
+        bot.add_listener(self._index_guild, 'on_guild_available')
+        bot.add_listener(self._index_guild, 'on_guild_join')
+        bot.add_listener(self._drop_guild, 'on_guild_remove')
+        bot.add_listener(self._renamed, 'on_guild_update')
+        bot.add_listener(self._emojis_changed, 'on_guild_emojis_update')
+
+    def __len__(self):
+        return len(self._index)
+
+    def get(self, guild_name, emoji_name, default=""):
+        """The emoji's message form (``<:name:id>``)"""
+        entry = self._index.get((guild_name.lower(), emoji_name.lower()))
+        return entry[0] if entry else default
+
+    def url(self, guild_name, emoji_name, default=""):
+        entry = self._index.get((guild_name.lower(), emoji_name.lower()))
+        return entry[1] if entry else default
+
+    def index(self, guild, emojis=None):
+        self.drop(guild)
+        name = guild.name.lower()
+        self._guilds[guild.id] = name
+        emojis = guild.emojis if emojis is None else emojis
+        for emoji in emojis:
+            self._index[(name, emoji.name.lower())] = (str(emoji), str(emoji.url))
+        LOGGER.debug(f"indexed {len(emojis)} emoji for {guild.name}")
+
+    def drop(self, guild):
+        name = self._guilds.pop(guild.id, None)
+        if name is None:
+            return
+        for key in [key for key in self._index if key[0] == name]:
+            del self._index[key]
+
+    async def _index_guild(self, guild):
+        self.index(guild)
+
+    async def _drop_guild(self, guild):
+        self.drop(guild)
+
+    async def _renamed(self, before, after):
+        if before.name != after.name:
+            self.index(after)
+
+    async def _emojis_changed(self, guild, before, after):
+        self.index(guild, after)
@@ -0,0 +1,315 @@
+from utils.projection import fields, project
+
+
+class TeamState:
+    """One side of a GameState"""
+
+    __slots__ = ('id', 'abbreviation', 'name', 'score', 'wins', 'losses',
+                 'pct', 'lineup', 'starter')
+
+    def __init__(self, id=None, abbreviation="", name="", score=0, wins=0,
+                 losses=0, pct=".000", lineup=(), starter=None):
+        self.id = id
+        self.abbreviation = abbreviation
+        self.name = name
+        self.score = score
+        self.wins = wins
+        self.losses = losses
+        self.pct = pct
+        self.lineup = lineup    # ((name, position), ...) in batting order
+        self.starter = starter  # (name, era) of the probable pitcher
+
+    def __repr__(self):
+        return f"{self.abbreviation} {self.score}"
+
+
+class GameState:
+    """A game boiled down to what the bot shows about it
+
+    Upstream feeds run to hundreds of KB per game; adapters turn them into
+    one of these (a few hundred bytes) as soon as they're parsed so nothing
+    keeps the feed itself around. `state` is always 'pre', 'live' or
+    'final', whatever the league calls it.
+    """
+
+    __slots__ = ('league', 'gid', 'state', 'detailed', 'start', 'period',
+                 'period_state', 'away', 'home', 'timecode', 'wait',
+                 'pitches', 'weather', 'venue')
+
+    def __init__(self, league, gid, state='pre', detailed="", start=None,
+                 period=None, period_state=None, away=None, home=None,
+                 timecode=None, wait=None, pitches=None, weather=None,
+                 venue=None):
+        self.league = league
+        self.gid = gid
+        self.state = state
+        self.detailed = detailed
+        self.start = start
+        self.period = period              # inning, quarter, ...
+        self.period_state = period_state  # e.g. "Top", "Middle", "End"
+        self.away = away or TeamState()
+        self.home = home or TeamState()
+        self.timecode = timecode  # feed timestamp, for diffPatch
+        self.wait = wait          # seconds the feed asks us to wait
+        self.pitches = pitches or {}  # pitcher id -> pitches thrown
+        self.weather = weather or {}
+        self.venue = venue or {}
+
+    def __repr__(self):
+        return (f"<{self.league} {self.gid} {self.state} {self.away!r} @ "
+                f"{self.home!r} {self.period_state or ''} "
+                f"{self.period or ''}>")
+
+
+_STATSAPI_STATES = {'Live': 'live', 'Preview': 'pre', 'Final': 'final'}
+
+_VENUE = fields(
+    'name',
+    location=fields('city', 'stateAbbrev'),
+    fieldInfo=fields('capacity', 'roofType', 'turfType'),
+)
+
+
+class StatsAPIAdapter:
+    """MLB and NHL statsapi schedules, plus MLB's live game feed"""
+
+    score_key = {'MLB': 'runs', 'NHL': 'goals'}
+
+    @staticmethod
+    def games(data):
+        for day in data.get('dates', []):
+            yield from day.get('games', [])
+
+    @classmethod
+    def from_schedule(cls, league, game):
+        linescore = game.get('linescore', {})
+        sides = {}
+        for side in ('away', 'home'):
+            entry = game.get('teams', {}).get(side, {})
+            team = entry.get('team', {})
+            record = entry.get('leagueRecord', {})
+            sides[side] = TeamState(
+                id=team.get('id'),
+                abbreviation=team.get('abbreviation', ""),
+                name=team.get('teamName', team.get('name', "")),
+                score=entry.get('score', 0),
+                wins=record.get('wins', 0),
+                losses=record.get('losses', 0),
+                pct=record.get('pct', ".000"),
+            )
+        return GameState(
+            league, str(game.get('gamePk', "")),
+            state=_STATSAPI_STATES.get(
+                game.get('status', {}).get('abstractGameState'), 'pre'),
+            detailed=game.get('status', {}).get('detailedState', ""),
+            start=game.get('gameDate'),
+            period=linescore.get('currentInning',
+                                 linescore.get('currentPeriod')),
+            period_state=linescore.get('inningState'),
+            away=sides['away'],
+            home=sides['home'],
+        )
+
+    @classmethod
+    def from_feed(cls, feed):
+        """GameState from a v1.1 MLB live feed (/feed/live, or a diffPatch
+        that came back whole)
+        """
+        gd = feed.get('gameData', {})
+        live = feed.get('liveData', {})
+        linescore = live.get('linescore', {})
+        boxscore = live.get('boxscore', {}).get('teams', {})
+        status = gd.get('status', {})
+        sides = {}
+        for side in ('away', 'home'):
+            team = gd.get('teams', {}).get(side, {})
+            record = team.get('record', {})
+            players = boxscore.get(side, {}).get('players', {})
+            lineup = []
+            for player_id in boxscore.get(side, {}).get('battingOrder', []):
+                player = players.get(f"ID{player_id}")
+                if player:
+                    lineup.append((
+                        player['person']['fullName'],
+                        player['position']['abbreviation'],
+                    ))
+            starter = None
+            probable = gd.get('probablePitchers', {}).get(side, {})
+            player = players.get(f"ID{probable.get('id')}")
+            if player:
+                starter = (
+                    player['person']['fullName'],
+                    player.get('seasonStats', {}).get(
+                        'pitching', {}).get('era', "-.--"),
+                )
+            sides[side] = TeamState(
+                id=team.get('id'),
+                abbreviation=team.get('abbreviation', ""),
+                name=team.get('teamName', ""),
+                score=linescore.get('teams', {}).get(side, {}).get('runs', 0),
+                wins=record.get('wins', 0),
+                losses=record.get('losses', 0),
+                pct=record.get('winningPercentage', ".000"),
+                lineup=tuple(lineup),
+                starter=starter,
+            )
+        meta = feed.get('metaData', {})
+        return GameState(
+            'MLB', str(gd.get('game', {}).get('pk', feed.get('gamePk', ""))),
+            state=_STATSAPI_STATES.get(status.get('abstractGameState'), 'pre'),
+            detailed=status.get('detailedState', ""),
+            start=gd.get('datetime', {}).get('dateTime'),
+            period=linescore.get('currentInning'),
+            period_state=linescore.get('inningState'),
+            away=sides['away'],
+            home=sides['home'],
+            timecode=meta.get('timeStamp'),
+            wait=meta.get('wait'),
+            pitches=cls.pitch_counts(boxscore),
+            weather=dict(gd.get('weather', {})),
+            venue=project(gd.get('venue', {}), _VENUE),
+        )
+
+    @staticmethod
+    def pitch_counts(teams):
+        """pitcher id -> pitches thrown, from a boxscore's `teams`"""
+        pitches = {}
+        for side in ('away', 'home'):
+            for player in teams.get(side, {}).get('players', {}).values():
+                thrown = player.get('stats', {}).get(
+                    'pitching', {}).get('numberOfPitches')
+                if thrown:
+                    pitches[player['person']['id']] = thrown
+        return pitches
+
+    @staticmethod
+    def apply_schedule(state, game):
+        """Bring `state` up to date with a schedule entry's status, score
+        and inning, which is all that moves between live feed fetches
+        """
+        status = game.get('status', {})
+        state.state = _STATSAPI_STATES.get(
+            status.get('abstractGameState'), state.state)
+        state.detailed = status.get('detailedState', state.detailed)
+        for side in ('away', 'home'):
+            score = game.get('teams', {}).get(side, {}).get('score')
+            if score is not None:
+                getattr(state, side).score = score
+        linescore = game.get('linescore', {})
+        state.period = linescore.get('currentInning', state.period)
+        state.period_state = linescore.get('inningState', state.period_state)
+        return state
+
+
+class NBAAdapter:
+    """data.nba.net scoreboards"""
+
+    states = {1: 'pre', 2: 'live', 3: 'final'}
+
+    @staticmethod
+    def games(data):
+        return data.get('games', [])
+
+    @classmethod
+    def from_schedule(cls, league, game):
+        sides = {}
+        for side, key in (('away', 'vTeam'), ('home', 'hTeam')):
+            team = game.get(key, {})
+            sides[side] = TeamState(
+                id=team.get('teamId'),
+                abbreviation=team.get('triCode', ""),
+                name=team.get('triCode', ""),
+                score=team.get('score') or 0,
+                wins=team.get('win', 0),
+                losses=team.get('loss', 0),
+            )
+        return GameState(
+            league, str(game.get('gameId', "")),
+            state=cls.states.get(game.get('statusNum'), 'pre'),
+            start=game.get('startTimeUTC'),
+            period=game.get('period', {}).get('current'),
+            away=sides['away'],
+            home=sides['home'],
+        )
+
+
+class ESPNAdapter:
+    """ESPN site API scoreboards (NFL)"""
+
+    states = {'pre': 'pre', 'in': 'live', 'post': 'final'}
+
+    @staticmethod
+    def games(data):
+        return data.get('events', [])
+
+    @classmethod
+    def from_schedule(cls, league, game):
+        sides = {}
+        competitors = (game.get('competitions') or [{}])[0].get(
+            'competitors', [])
+        for competitor in competitors:
+            team = competitor.get('team', {})
+            sides[competitor.get('homeAway')] = TeamState(
+                id=competitor.get('id'),
+                abbreviation=team.get('abbreviation', ""),
+                name=team.get('shortDisplayName', ""),
+                score=competitor.get('score', 0),
+            )
+        status = game.get('status', {})
+        return GameState(
+            league, str(game.get('id', "")),
+            state=cls.states.get(status.get('type', {}).get('state'), 'pre'),
+            detailed=status.get('type', {}).get('description', ""),
+            start=game.get('date'),
+            period=status.get('period'),
+            away=sides.get('away'),
+            home=sides.get('home'),
+        )
+
+
+class NCAAAdapter:
+    """data.ncaa.com scoreboards (NCB); anything that isn't live or yet to
+    start (forfeits included) counts as final
+    """
+
+    @staticmethod
+    def games(data):
+        return [entry['game'] for entry in data.get('games', [])]
+
+    @classmethod
+    def from_schedule(cls, league, game):
+        sides = {}
+        for side in ('away', 'home'):
+            team = game.get(side, {})
+            sides[side] = TeamState(
+                abbreviation=team.get('names', {}).get('char6', ""),
+                name=team.get('names', {}).get('short', ""),
+                score=team.get('score') or 0,
+            )
+        state = game.get('gameState')
+        return GameState(
+            league, str(game.get('gameID', "")),
+            state=state if state in ('live', 'pre') else 'final',
+            start=game.get('startTimeEpoch'),
+            period=game.get('currentPeriod'),
+            away=sides['away'],
+            home=sides['home'],
+        )
+
+
+ADAPTERS = {
+    'MLB': StatsAPIAdapter,
+    'NHL': StatsAPIAdapter,
+    'NBA': NBAAdapter,
+    'NFL': ESPNAdapter,
+    'NCB': NCAAAdapter,
+}
+
+
+def scoreboard_games(league, data):
+    """Every game in one of `league`'s scoreboards as a GameState"""
+    adapter = ADAPTERS.get(league)
+    if adapter is None or not isinstance(data, dict):
+        return []
+    return [adapter.from_schedule(league, game)
+            for game in adapter.games(data)]
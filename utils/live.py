@@ -0,0 +1,287 @@
+import asyncio
+import logging
+import time
+
+import coloredlogs
+import pendulum
+
+from utils.games import scoreboard_games
+from utils.tracker import (
+    FINAL, LIVE, POSTPONED, SCHEDULED, LeadChanged, ScoreChanged)
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class RateBudget:
+    """Token bucket: `rate` requests a second on average, `burst` at once"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def ready(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return self.tokens >= 1
+
+    def take(self):
+        self.tokens -= 1
+
+    async def acquire(self):
+        """Wait for a token and take it"""
+        while not self.ready():
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+        self.take()
+
+
+class LeagueFeed:
+    """How to follow one league off its public scoreboard
+
+    `url` gets the league's current date (in `tz`, as `date_format`) when
+    it has a {date} in it. `alerts` picks which of 'score', 'lead' and
+    'final' are worth announcing; `score_label` names a score change
+    ("Goal"). Polls come every `live_every` seconds while a game is on and
+    every `idle_every` otherwise, never more than `qps` a second. A team's
+    score jump in `held_scores` (a touchdown, before its extra point) waits
+    up to `hold_for` seconds for that team's next score, and the two are
+    announced as one.
+    """
+
+    def __init__(self, league, url, *, date_format="YYYY-MM-DD",
+                 tz="US/Eastern", alerts=('score', 'lead', 'final'),
+                 score_label="Score", live_every=30, idle_every=300,
+                 qps=0.2, held_scores=(), hold_for=90):
+        self.league = league
+        self.url = url
+        self.date_format = date_format
+        self.tz = tz
+        self.alerts = set(alerts)
+        self.score_label = score_label
+        self.live_every = live_every
+        self.idle_every = idle_every
+        self.qps = qps
+        self.held_scores = set(held_scores)
+        self.hold_for = hold_for
+
+    def url_for(self, moment=None):
+        moment = (moment or pendulum.now()).in_tz(self.tz)
+        return self.url.format(date=moment.format(self.date_format))
+
+
+LEAGUE_FEEDS = {
+    'NHL': LeagueFeed(
+        'NHL',
+        "https://statsapi.web.nhl.com/api/v1/schedule?date={date}"
+        "&expand=schedule.teams,schedule.linescore",
+        alerts=('score', 'final'), score_label="Goal", live_every=15),
+    # scores change every possession, only the lead is worth a message
+    'NBA': LeagueFeed(
+        'NBA', "https://data.nba.net/10s/prod/v2/{date}/scoreboard.json",
+        date_format="YYYYMMDD", alerts=('lead', 'final'), live_every=20),
+    # with no dates ESPN serves the current week
+    'NFL': LeagueFeed(
+        'NFL',
+        "https://site.api.espn.com/apis/site/v2/sports/football/nfl/"
+        "scoreboard?lang=en&region=us&calendartype=blacklist&limit=100",
+        score_label="Scoring drive", live_every=20, held_scores=(6,)),
+}
+
+
+def phase_for(state):
+    """Tracker phase for a scoreboard GameState"""
+    if 'Postponed' in state.detailed or 'Cancel' in state.detailed:
+        return POSTPONED
+    if state.state == 'live':
+        return LIVE
+    if state.state == 'final':
+        return FINAL
+    return SCHEDULED
+
+
+def _scorer(event):
+    """0 when the away side scored, 1 for the home side"""
+    return 0 if event.score[0] > event.previous[0] else 1
+
+
+def _score(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class LiveEngine:
+    """Follows every league in `feeds` off its scoreboard on one scheduler
+
+    tick() polls the leagues that are due, as long as both the league's
+    own budget and the shared `max_qps` one allow it; a league that's over
+    budget waits for a later tick, so upstream traffic stays bounded
+    however many leagues have games on. Each scoreboard is diffed against
+    the league's GameTracker (phases, scores, who leads) and whatever
+    changed is published to the tracker's subscribers. The first score
+    seen for a game, or one before it starts, is only recorded.
+
+    MLB isn't a LeagueFeed: its alerts come from the play-by-play feeds,
+    which the scores cog polls on its own loops. Those requests still go
+    through spend(), so `max_qps` bounds every league's upstream traffic,
+    MLB's included.
+    """
+
+    def __init__(self, feeds, web, *, trackers, max_qps=1.0):
+        self.feeds = feeds
+        self.web = web
+        self.trackers = trackers  # league -> GameTracker
+        self.budget = RateBudget(max_qps, burst=max(1, len(feeds)))
+        self.budgets = {
+            league: RateBudget(feed.qps) for league, feed in feeds.items()}
+        self.states = {league: {} for league in feeds}  # latest GameStates
+        # gid -> (held since, ScoreChanged) waiting on the rest of a drive
+        self.held = {league: {} for league in feeds}
+        self.next_poll = dict.fromkeys(feeds, 0)
+        self.stats = {
+            league: {'polls': 0, 'throttled': 0, 'errors': 0, 'events': 0}
+            for league in feeds
+        }
+
+    async def spend(self, league):
+        """Wait until the shared budget allows one more request for a
+        league polled outside tick()
+        """
+        stats = self.stats.setdefault(
+            league, {'polls': 0, 'throttled': 0, 'errors': 0, 'events': 0})
+        stats['polls'] += 1
+        if not self.budget.ready():
+            stats['throttled'] += 1
+        await self.budget.acquire()
+
+    def state(self, league, gid):
+        return self.states.get(league, {}).get(gid)
+
+    def live(self):
+        """Leagues with a game on right now"""
+        return [
+            league for league, tracker in self.trackers.items()
+            if tracker.in_phase(LIVE)
+        ]
+
+    async def tick(self):
+        """Poll whatever is due; returns the leagues that recorded events"""
+        now = time.time()
+        due = []
+        for league in self.feeds:
+            if self.next_poll[league] > now:
+                continue
+            if not (self.budget.ready() and self.budgets[league].ready()):
+                self.stats[league]['throttled'] += 1
+                continue
+            self.budget.take()
+            self.budgets[league].take()
+            due.append(league)
+        changed = await asyncio.gather(*[self._poll(league) for league in due])
+        return [league for league, events in zip(due, changed) if events]
+
+    async def _poll(self, league):
+        feed = self.feeds[league]
+        stats = self.stats[league]
+        stats['polls'] += 1
+        try:
+            data = await self.web.fetch_json(
+                feed.url_for(), revalidate=True)
+            events = await self._diff(league, scoreboard_games(league, data))
+        except Exception as err:
+            stats['errors'] += 1
+            LOGGER.error(f"[{league}] {err}")
+            events = 0
+        delay = feed.live_every if self.trackers[league].in_phase(LIVE) \
+            else feed.idle_every
+        self.next_poll[league] = time.time() + delay
+        stats['events'] += events
+        return events
+
+    async def _diff(self, league, games):
+        tracker = self.trackers[league]
+        states = self.states[league]
+        held = self.held[league]
+        publish = []
+        quiet = 0
+        listed = set()
+        now = time.time()
+        for gid, (since, event) in list(held.items()):
+            if now - since >= self.feeds[league].hold_for:
+                del held[gid]
+                publish.append(event)
+        for state in games:
+            gid = state.gid
+            listed.add(gid)
+            states[gid] = state
+            event = tracker.observe(gid, phase_for(state))
+            changes, recorded = self._score_changes(league, state)
+            publish.extend(changes)
+            quiet += recorded
+            if event:
+                if gid in held:
+                    # nothing more is coming for it in this phase
+                    publish.append(held.pop(gid)[1])
+                publish.append(event)
+
+        # games that dropped off the scoreboard (yesterday's) are forgotten
+        gone = set(tracker.phases) - listed
+        if gone:
+            tracker.forget(gone)
+            for gid in gone:
+                states.pop(gid, None)
+                held.pop(gid, None)
+
+        for event in publish:
+            await tracker.publish(event)
+        return len(publish) + quiet + len(gone)
+
+    def _score_changes(self, league, state):
+        """Events for `state`'s score, and how many were only recorded"""
+        tracker = self.trackers[league]
+        gid = state.gid
+        score = (_score(state.away.score), _score(state.home.score))
+        known = tracker.score(gid)
+        if score == known:
+            return [], 0
+        if known is None or state.state == 'pre':
+            tracker.record(ScoreChanged(gid, score))
+            return [], 1
+        leader = tracker.leader(gid)
+        events = self._hold(league, tracker.record(
+            ScoreChanged(gid, score, previous=known)), state)
+        if leader and tracker.leader(gid) != leader:
+            events.append(tracker.record(
+                LeadChanged(gid, tracker.leader(gid))))
+        return events, 0
+
+    def _hold(self, league, event, state):
+        """The score changes to publish now for `event`, merged with the
+        one held for the same game when the same team scored again
+        """
+        held = self.held[league]
+        ready = []
+        if event.gid in held:
+            first = held.pop(event.gid)[1]
+            if _scorer(first) == _scorer(event):
+                return [ScoreChanged(
+                    event.gid, event.score, previous=first.previous)]
+            ready.append(first)
+        jump = max(after - before for after, before in zip(
+            event.score, event.previous))
+        if jump in self.feeds[league].held_scores and state.state == 'live':
+            held[event.gid] = (time.time(), event)
+        else:
+            ready.append(event)
+        return ready
@@ -0,0 +1,126 @@
+import functools
+import shlex
+from types import MappingProxyType
+
+
+DAY_WORDS = ("today", "tomorrow", "yesterday")
+
+
+class Option:
+    """One ``--option`` a command takes
+
+    Options take the next word as their value unless `flag` is set. With
+    `choices`, the next word is only taken when it's one of them and the
+    option is simply True otherwise (``--prelim`` vs ``--prelim early``).
+    `convert` turns the raw value into whatever the command wants; a
+    ValueError from it is reported back rather than raised.
+    """
+
+    def __init__(self, *names, dest=None, flag=False, choices=None,
+                 convert=None):
+        self.names = tuple(name.lower() for name in names)
+        self.dest = dest or self.names[0].lstrip('-')
+        self.flag = flag
+        self.choices = tuple(choices) if choices else None
+        self.convert = convert
+
+
+class ParsedArgs:
+    """What came out of OptionParser.parse(); shared between identical
+    inputs, so treat it as read-only
+    """
+
+    __slots__ = ('options', 'words', 'day', 'errors', 'unknown')
+
+    def __init__(self, options, words, day, errors, unknown):
+        self.options = MappingProxyType(options)
+        self.words = tuple(words)
+        self.day = day
+        self.errors = MappingProxyType(errors)
+        self.unknown = tuple(unknown)
+
+    def __repr__(self):
+        return (f"ParsedArgs(options={dict(self.options)}, "
+                f"words={self.words}, day={self.day!r}, "
+                f"errors={dict(self.errors)})")
+
+    def get(self, dest, default=None):
+        return self.options.get(dest, default)
+
+    @property
+    def text(self):
+        """Everything that wasn't an option, e.g. a search string"""
+        return " ".join(self.words)
+
+
+class OptionParser:
+    """Declarative replacement for the old per-cog _parseargs copies
+
+    Build one per command (or family of commands) when the cog loads:
+
+        OptionParser(Option('--tz', convert=...), days=True)
+
+    parse() splits the input once, shell-style, and sorts every word into
+    an option value, a day (when `days` is set: today/tomorrow/yesterday or
+    something made of digits and dashes, last one wins) or a plain word.
+    Results for identical inputs are cached.
+    """
+
+    def __init__(self, *options, days=False, cache_size=256):
+        self.days = days
+        self._options = {}
+        for option in options:
+            for name in option.names:
+                self._options[name] = option
+        self.parse = functools.lru_cache(maxsize=cache_size)(self._parse)
+
+    def _parse(self, text):
+        options, words, errors, unknown = {}, [], {}, []
+        day = None
+        tokens = self._split(text or "")
+        idx = 0
+        while idx < len(tokens):
+            token = tokens[idx]
+            idx += 1
+            option = self._options.get(token.lower())
+            if option is None:
+                if token.startswith('--'):
+                    unknown.append(token)
+                elif self.days and (
+                        token.lower() in DAY_WORDS
+                        or token.replace('-', '').isdigit()):
+                    day = token.lower()
+                else:
+                    words.append(token)
+                continue
+
+            nxt = tokens[idx] if idx < len(tokens) else None
+            if option.flag:
+                options[option.dest] = True
+                continue
+            if option.choices is not None:
+                if nxt is not None and nxt.lower() in option.choices:
+                    options[option.dest] = nxt.lower()
+                    idx += 1
+                else:
+                    options[option.dest] = True
+                continue
+            if nxt is None or nxt.startswith('--'):
+                errors[option.dest] = f"{token} needs a value"
+                continue
+            idx += 1
+            try:
+                options[option.dest] = (
+                    option.convert(nxt) if option.convert else nxt)
+            except ValueError as err:
+                errors[option.dest] = str(err) or f"bad value for {token}"
+
+        return ParsedArgs(options, words, day, errors, unknown)
+
+    @staticmethod
+    def _split(text):
+        try:
+            return shlex.split(text)
+        except ValueError:
+            # an unbalanced quote, most likely an apostrophe in a name
+            return text.replace('"', ' ').replace("'", "").split()
@@ -0,0 +1,45 @@
+import logging
+
+import coloredlogs
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class ProfileService:
+    """The one copy of every user's saved settings (timezone, location, ...)
+
+    Everything is loaded from the store once at startup and served from
+    memory after that. set() updates memory and writes the one changed
+    field through to the store, so cogs never overwrite each other.
+    """
+
+    prefix = "user:"
+
+    def __init__(self, store):
+        self.store = store
+        try:
+            self._profiles = store.load_all(self.prefix)
+        except Exception as err:
+            LOGGER.error(f"couldn't load profiles: {err}")
+            self._profiles = {}
+
+    def __len__(self):
+        return len(self._profiles)
+
+    def get(self, member_id, field, default=None):
+        return self._profiles.get(str(member_id), {}).get(field, default)
+
+    def set(self, member_id, field, value):
+        member_id = str(member_id)
+        profile = self._profiles.setdefault(member_id, {})
+        if profile.get(field) == value:
+            return
+        profile[field] = value
+        self.store.update(f"{self.prefix}{member_id}", {field: value})
@@ -0,0 +1,32 @@
+def fields(*names, **nested):
+    """Shorthand for a projection: `names` are kept whole, `nested` are
+    projected further
+
+        fields('status', 'teams', dates=fields(games=fields('gamePk')))
+    """
+    spec = dict.fromkeys(names, True)
+    spec.update(nested)
+    return spec
+
+
+def project(data, spec):
+    """Copy of `data` holding only what `spec` asks for
+
+    `spec` is True (keep the value as it is) or a dict of key -> spec.
+    Lists are projected item by item and keys a payload doesn't have are
+    left out, so the result keeps the feed's shape and the code reading
+    it doesn't change. The payload has already been parsed whole by then,
+    so this trims what gets cached and held between polls, not the peak
+    of the fetch itself; that's only narrowed upstream, by asking for less
+    (hydrate/expand) where an API lets us.
+    """
+    if spec is True:
+        return data
+    if isinstance(data, list):
+        return [project(item, spec) for item in data]
+    if isinstance(data, dict):
+        return {
+            key: project(data[key], sub)
+            for key, sub in spec.items() if key in data
+        }
+    return data
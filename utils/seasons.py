@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import time
+
+import coloredlogs
+import pendulum
+
+from utils.dates import WeekTable
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class SeasonCalendar:
+    """A league's weeks (pre-season through post-season) as published in
+    the ``leagues[0].calendar`` of an ESPN scoreboard
+
+    Each season is fetched once and kept in the store under
+    ``calendar:<league>``, one field per season. A new one is only looked
+    for after the last known week has ended, at most every `retry_after`
+    seconds, so the off-season keeps serving the final week until ESPN
+    publishes the next schedule. load() reads the stored seasons back and,
+    like the store's other reads, is meant for cog setup.
+    """
+
+    def __init__(self, league, url, *, web, store, retry_after=6 * 60 * 60):
+        self.league = league
+        self.url = url
+        self.web = web
+        self.store = store
+        self.name = f"calendar:{league.lower()}"
+        self.retry_after = retry_after
+        self.season = None
+        self.ends = 0
+        self.checked = 0
+        self._table = WeekTable({})
+        self._task = None
+
+    def __len__(self):
+        return len(self._table)
+
+    def week(self, moment=None):
+        """The week `moment` (default now) falls in, as a dict with season,
+        type (1 pre, 2 regular, 3 post), week, label, start and end; None
+        until a calendar has been loaded
+        """
+        return self._table.at(moment)
+
+    async def ensure(self):
+        if (time.time() > self.ends
+                and time.time() - self.checked > self.retry_after):
+            await self.refresh()
+        return self
+
+    async def refresh(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._refresh())
+        await asyncio.shield(self._task)
+
+    async def _refresh(self):
+        self.checked = time.time()
+        try:
+            season, weeks = parse_espn_calendar(
+                await self.web.fetch_json(self.url, revalidate=True))
+        except Exception as err:
+            LOGGER.error(f"couldn't fetch the {self.league} calendar: {err}")
+            return
+        if not weeks:
+            LOGGER.error(f"no weeks in the {self.league} calendar")
+            return
+        if season != self.season:
+            LOGGER.info(f"loaded the {season} {self.league} calendar")
+        self._set(season, weeks)
+        self.store.update(self.name, {str(season): weeks})
+
+    def load(self):
+        try:
+            seasons = self.store.load(self.name)
+        except Exception as err:
+            LOGGER.error(f"couldn't load the {self.league} calendar: {err}")
+            return
+        if seasons:
+            season = max(seasons, key=int)
+            self._set(int(season), seasons[season])
+
+    def _set(self, season, weeks):
+        self.season = season
+        self._table = WeekTable({week['start']: week for week in weeks})
+        self.ends = max(
+            pendulum.parse(week['end']).timestamp() for week in weeks)
+
+
+def parse_espn_calendar(data):
+    """(season year, weeks) out of an ESPN scoreboard response"""
+    league = data['leagues'][0]
+    season = int(league['season']['year'])
+    weeks = []
+    for part in league.get('calendar', []):
+        # daily sports list bare dates here, there are no weeks to find
+        if not isinstance(part, dict):
+            continue
+        for entry in part.get('entries', []):
+            weeks.append({
+                'season': season,
+                'type': int(part['value']),
+                'week': int(entry['value']),
+                'label': entry.get('label', ''),
+                'start': entry['startDate'],
+                'end': entry['endDate'],
+            })
+    return season, weeks
@@ -0,0 +1,259 @@
+import asyncio
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+
+import coloredlogs
+import redis
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+_DELETE = object()
+
+
+class _Store:
+    """Records made of named fields (a Redis hash, in Redis terms)
+
+    Reads are plain blocking calls, meant for cog setup. Writes only touch
+    the fields that changed: update() queues them and they all go out
+    together `flush_delay` seconds later as one pipeline/transaction, on
+    the bot's blocking pool when `run_blocking` is given.
+    """
+
+    def __init__(self, *, run_blocking=None, flush_delay=0.5):
+        self.run_blocking = run_blocking
+        self.flush_delay = flush_delay
+        self._pending = {}  # name -> {field: encoded value or _DELETE}
+        self._flusher = None
+
+    def load(self, name):
+        fields = {
+            field: json.loads(value)
+            for field, value in self._read(name).items()
+        }
+        for field, value in self._pending.get(name, {}).items():
+            if value is _DELETE:
+                fields.pop(field, None)
+            else:
+                fields[field] = json.loads(value)
+        return fields
+
+    def load_all(self, prefix):
+        """Every record whose name starts with `prefix`, keyed by the rest of
+        the name
+        """
+        names = set(self._names(prefix)) | {
+            name for name in self._pending if name.startswith(prefix)
+        }
+        records = {name[len(prefix):]: self.load(name) for name in names}
+        return {key: fields for key, fields in records.items() if fields}
+
+    def update(self, name, fields):
+        pending = self._pending.setdefault(name, {})
+        for field, value in fields.items():
+            pending[field] = json.dumps(value)
+        self._schedule()
+
+    def delete(self, name, *fields):
+        pending = self._pending.setdefault(name, {})
+        for field in fields:
+            pending[field] = _DELETE
+        self._schedule()
+
+    def _schedule(self):
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_delay)
+        await self.flush()
+
+    async def flush(self):
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        try:
+            if self.run_blocking:
+                await self.run_blocking(self._write, batch)
+            else:
+                self._write(batch)
+        except Exception as err:
+            LOGGER.error(f"couldn't write {len(batch)} records: {err}")
+            self._requeue(batch)
+
+    def flush_now(self):
+        """Blocking flush, for places that can't await (cog_unload)"""
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        try:
+            self._write(batch)
+        except Exception as err:
+            LOGGER.error(f"couldn't write {len(batch)} records: {err}")
+            self._requeue(batch)
+
+    def _requeue(self, batch):
+        # anything updated since the failed write is newer, keep that
+        for name, fields in batch.items():
+            self._pending[name] = {**fields, **self._pending.get(name, {})}
+
+    def close(self):
+        pass
+
+
+class RedisStore(_Store):
+
+    def __init__(self, client, **kwargs):
+        super().__init__(**kwargs)
+        self.client = client
+
+    def _read(self, name):
+        return {
+            field.decode(): value
+            for field, value in self.client.hgetall(name).items()
+        }
+
+    def _names(self, prefix):
+        for name in self.client.scan_iter(match=f"{prefix}*"):
+            yield name.decode()
+
+    def _write(self, batch):
+        pipe = self.client.pipeline(transaction=False)
+        for name, fields in batch.items():
+            live = {f: v for f, v in fields.items() if v is not _DELETE}
+            dead = [f for f, v in fields.items() if v is _DELETE]
+            if live:
+                pipe.hset(name, mapping=live)
+            if dead:
+                pipe.hdel(name, *dead)
+        pipe.execute()
+
+    def close(self):
+        self.client.close()
+
+
+class SQLiteStore(_Store):
+    """Local stand-in for Redis when there's no REDIS_URL (dev boxes)"""
+
+    def __init__(self, path, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                " name TEXT NOT NULL,"
+                " field TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " PRIMARY KEY (name, field))"
+            )
+
+    def _read(self, name):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT field, value FROM records WHERE name = ?", (name,))
+            return dict(rows.fetchall())
+
+    def _names(self, prefix):
+        like = prefix.replace("\\", "\\\\").replace("%", "\\%") \
+            .replace("_", "\\_")
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT name FROM records WHERE name LIKE ? "
+                "ESCAPE '\\'", (f"{like}%",))
+            return [name for name, in rows.fetchall()]
+
+    def _write(self, batch):
+        live = [
+            (name, field, value)
+            for name, fields in batch.items()
+            for field, value in fields.items() if value is not _DELETE
+        ]
+        dead = [
+            (name, field)
+            for name, fields in batch.items()
+            for field, value in fields.items() if value is _DELETE
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (name, field, value) "
+                "VALUES (?, ?, ?)", live)
+            self._conn.executemany(
+                "DELETE FROM records WHERE name = ? AND field = ?", dead)
+
+    def close(self):
+        self._conn.close()
+
+
+def open_store(environ, **kwargs):
+    """Redis when REDIS_URL is set and reachable, SQLite otherwise"""
+    url = environ.get("REDIS_URL")
+    if url:
+        try:
+            client = redis.from_url(url, socket_timeout=3)
+            client.ping()
+            return RedisStore(client, **kwargs)
+        except Exception as err:
+            LOGGER.error(f"couldn't reach redis, using sqlite: {err}")
+    path = environ.get("STORE_PATH", "data/bot.sqlite3")
+    LOGGER.info(f"storing data in {path}")
+    return SQLiteStore(path, **kwargs)
+
+
+def migrate_pickles(store):
+    """One-off move of the old pickled blobs into per-field records
+
+    'sports_db' (user settings) becomes one 'user:<id>' record per user and
+    'scores_db' (live scores state) becomes the 'scores' record. The blobs
+    are renamed to '<key>:pickled' rather than deleted, so this only ever
+    runs once.
+    """
+    if not isinstance(store, RedisStore):
+        return
+    batch = {}
+
+    users = _unpickle(store.client, 'sports_db')
+    for member_id, fields in (users or {}).items():
+        batch[f"user:{member_id}"] = {
+            field: json.dumps(value) for field, value in fields.items()
+        }
+
+    scores = _unpickle(store.client, 'scores_db')
+    if scores:
+        batch['scores'] = {
+            'monitored': json.dumps(list(scores.get('monitored', {}))),
+            'games_start': json.dumps(scores.get('games_start', [])),
+            'games_end': json.dumps(scores.get('games_end', [])),
+            'games_ppd': json.dumps(scores.get('games_ppd', [])),
+        }
+
+    if not batch:
+        return
+    store._write(batch)
+    for key, blob in (('sports_db', users), ('scores_db', scores)):
+        if blob is not None:
+            store.client.rename(key, f"{key}:pickled")
+    LOGGER.info(f"migrated {len(batch)} pickled records")
+
+
+def _unpickle(client, key):
+    try:
+        blob = client.get(key)
+        return pickle.loads(blob) if blob is not None else None
+    except Exception as err:
+        LOGGER.error(f"couldn't migrate {key}: {err}")
+        return None
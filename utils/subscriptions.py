@@ -0,0 +1,118 @@
+import itertools
+import logging
+
+import coloredlogs
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+ANY = '*'
+EVENTS = ('start', 'score', 'homerun', 'lead', 'final')
+
+
+class SubscriptionIndex:
+    """Which channels want which score alerts
+
+    A subscription is a (league, team, event) filter, any part of which
+    can be left out to match everything. Channels are indexed under the
+    exact filter they hold, so routing an alert only looks up the handful
+    of keys it could match (its league or any, each of its teams or any,
+    each of its event types or any) and costs O(matching channels) however
+    many subscriptions there are.
+    """
+
+    def __init__(self):
+        self._filters = {}  # channel id -> {(league, team, event), ...}
+        self._index = {}    # (league, team, event) -> {channel id, ...}
+
+    def __len__(self):
+        return len(self._filters)
+
+    def __contains__(self, channel_id):
+        return channel_id in self._filters
+
+    def channels(self):
+        return list(self._filters)
+
+    def filters(self, channel_id):
+        return sorted(self._filters.get(channel_id, ()))
+
+    @staticmethod
+    def key(league=None, team=None, event=None):
+        return (
+            league.upper() if league else ANY,
+            team.upper() if team else ANY,
+            event.lower() if event else ANY,
+        )
+
+    def add(self, channel_id, league=None, team=None, event=None):
+        """Returns False when the channel already had this filter"""
+        key = self.key(league, team, event)
+        filters = self._filters.setdefault(channel_id, set())
+        if key in filters:
+            return False
+        filters.add(key)
+        self._index.setdefault(key, set()).add(channel_id)
+        return True
+
+    def remove(self, channel_id, league=None, team=None, event=None):
+        key = self.key(league, team, event)
+        filters = self._filters.get(channel_id, set())
+        if key not in filters:
+            return False
+        filters.discard(key)
+        if not filters:
+            del self._filters[channel_id]
+        self._unindex(key, channel_id)
+        return True
+
+    def clear(self, channel_id):
+        """Drop every filter the channel has, returning how many there were"""
+        filters = self._filters.pop(channel_id, set())
+        for key in filters:
+            self._unindex(key, channel_id)
+        return len(filters)
+
+    def _unindex(self, key, channel_id):
+        channels = self._index.get(key)
+        if channels is not None:
+            channels.discard(channel_id)
+            if not channels:
+                del self._index[key]
+
+    def route(self, league, teams=(), events=()):
+        """Channels that want an alert about `teams` in `league` that is
+        any of `events`
+        """
+        leagues = (league.upper(), ANY)
+        teams = (*(team.upper() for team in teams if team), ANY)
+        events = (*events, ANY)
+        matched = set()
+        for key in itertools.product(leagues, teams, events):
+            matched.update(self._index.get(key, ()))
+        return matched
+
+    def snapshot(self):
+        return {
+            str(channel_id): [list(key) for key in sorted(filters)]
+            for channel_id, filters in self._filters.items()
+        }
+
+    @classmethod
+    def restore(cls, snapshot):
+        index = cls()
+        for channel_id, filters in (snapshot or {}).items():
+            for key in filters:
+                try:
+                    index.add(int(channel_id), *(
+                        None if part == ANY else part for part in key))
+                except (TypeError, ValueError) as err:
+                    LOGGER.debug(f"skipping bad subscription {key}: {err}")
+        return index
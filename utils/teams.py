@@ -0,0 +1,349 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+
+import coloredlogs
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class TeamDirectory:
+    """One league's teams, as the same {tricode/full name: value} mapping the
+    cogs always used, plus indexes so lookups never scan it
+
+    Remote directories are loaded on first use rather than at import, kept
+    in `cache_dir` between runs and re-fetched in the background once they
+    are older than `refresh_every` (the old copy keeps being served in the
+    meantime). A static mapping can be passed as `teams` instead, with its
+    `names`. `parse` returns the mapping along with display names for its
+    values, which name() looks up.
+    """
+
+    def __init__(self, league, url=None, parse=None, *, web=None, teams=None,
+                 names=None, aliases=None, cache_dir="data/teams",
+                 refresh_every=24 * 60 * 60, retry_after=5 * 60):
+        self.league = league
+        self.url = url
+        self.parse = parse
+        self.web = web
+        self.path = os.path.join(cache_dir, f"{league.lower()}.json")
+        self.refresh_every = refresh_every
+        self.retry_after = retry_after
+        self.fetched = 0
+        self._failed = 0
+        self._task = None
+        self.aliases = aliases or {}
+        self._teams = {}
+        self._names = {}
+        self.search = TeamSearch({})
+        self._loaded = teams is not None
+        if teams is not None:
+            self._set(teams, time.time(), names)
+
+    def __len__(self):
+        return len(self._teams)
+
+    def __iter__(self):
+        return iter(self._teams)
+
+    def items(self):
+        return self._teams.items()
+
+    def get(self, key, default=None):
+        return self._teams.get(key, default)
+
+    def name(self, value, default=None):
+        """Display name for one of the directory's values"""
+        return self._names.get(value, default)
+
+    def lookup(self, text):
+        """Best match for `text` (see TeamSearch), or None"""
+        return self.search.best(text)
+
+    def _set(self, teams, fetched, names=None):
+        self._teams = dict(teams)
+        self._names = dict(names or {})
+        self.fetched = fetched
+        self.search = TeamSearch(self._teams, self.aliases)
+
+    async def ensure(self):
+        """Make sure there's something to serve, refreshing it in the
+        background when it's old
+        """
+        if not self._loaded:
+            self._loaded = True
+            self._read_cache()
+        if self.url is None:
+            return self
+        now = time.time()
+        if now - self._failed < self.retry_after:
+            return self
+        if not self._teams:
+            await self.refresh()
+        elif now - self.fetched > self.refresh_every:
+            self._start_refresh()
+        return self
+
+    async def refresh(self):
+        await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._refresh())
+        return self._task
+
+    async def _refresh(self):
+        url = self.url() if callable(self.url) else self.url
+        try:
+            teams, names = self.parse(
+                await self.web.fetch_json(url, revalidate=True))
+        except Exception as err:
+            self._failed = time.time()
+            LOGGER.error(f"couldn't refresh {self.league} teams: {err}")
+            return
+        self._set(teams, time.time(), names)
+        LOGGER.debug(f"loaded {len(self._teams)} {self.league} team keys")
+        self._write_cache()
+
+    def _read_cache(self):
+        try:
+            with open(self.path) as f:
+                cached = json.load(f)
+            self._set(cached['teams'], cached['fetched'], cached['names'])
+        except FileNotFoundError:
+            pass
+        except Exception as err:
+            LOGGER.debug(f"ignoring {self.path}: {err}")
+
+    def _write_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump({
+                    'fetched': self.fetched,
+                    'teams': self._teams,
+                    'names': self._names,
+                }, f)
+        except Exception as err:
+            LOGGER.error(f"couldn't cache {self.league} teams: {err}")
+
+
+class TeamSearch:
+    """Ranked team lookup over a directory's keys (tricodes, full names) and
+    any aliases, built once per directory refresh
+
+    An exact key or alias wins outright, then the start of any word in one
+    ("yank", "giants", "eagles"), then close spellings by shared trigrams
+    ("yankes").
+    Ties go to whichever team comes first in the directory, same as the
+    linear scans this replaced.
+    """
+
+    min_similarity = 0.4
+
+    def __init__(self, teams, aliases=None):
+        self._exact = {}     # key or alias -> value
+        self._prefixes = {}  # start of a word -> (value, word length)
+        self._words = []     # (word, value)
+        self._grams = defaultdict(set)  # trigram -> indexes into _words
+        self._order = {}     # value -> position in the directory
+        for key, value in teams.items():
+            self._order.setdefault(value, len(self._order))
+            self._add(key, value)
+        for alias, key in (aliases or {}).items():
+            if key in teams:
+                self._add(alias, teams[key])
+
+    def _add(self, name, value):
+        name = name.lower()
+        self._exact.setdefault(name, value)
+        for word in name.split():
+            for end in range(1, len(word) + 1):
+                self._prefixes.setdefault(word[:end], (value, len(word)))
+            idx = len(self._words)
+            self._words.append((word, value))
+            for gram in self._trigrams(word):
+                self._grams[gram].add(idx)
+
+    @staticmethod
+    def _trigrams(word):
+        padded = f"  {word} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def match(self, text, limit=5):
+        """Up to `limit` (score, value) pairs, best first, scores in 0-1"""
+        text = text.lower().strip()
+        if not text:
+            return []
+        scores = {}
+
+        def _score(value, score):
+            if score > scores.get(value, 0):
+                scores[value] = score
+
+        if text in self._exact:
+            _score(self._exact[text], 1.0)
+        if text in self._prefixes:
+            value, length = self._prefixes[text]
+            _score(value, 0.5 + 0.4 * len(text) / length)
+        grams = self._trigrams(text)
+        shared = defaultdict(int)
+        for gram in grams:
+            for idx in self._grams.get(gram, ()):
+                shared[idx] += 1
+        for idx, count in shared.items():
+            word, value = self._words[idx]
+            similarity = count / len(grams | self._trigrams(word))
+            if similarity >= self.min_similarity:
+                _score(value, 0.8 * similarity)
+
+        ranked = sorted(
+            scores.items(), key=lambda item: (-item[1], self._order[item[0]]))
+        return [(score, value) for value, score in ranked[:limit]]
+
+    def best(self, text):
+        ranked = self.match(text, limit=1)
+        return ranked[0][1] if ranked else None
+
+
+def league_directories(web, **kwargs):
+    """The team directories every cog shares, keyed by league"""
+    return {
+        'NHL': TeamDirectory(
+            "NHL", "https://statsapi.web.nhl.com/api/v1/teams",
+            _parse_statsapi_teams, web=web, aliases=NHL_ALIASES, **kwargs),
+        'MLB': TeamDirectory(
+            "MLB", "https://statsapi.mlb.com/api/v1/teams?sportId=1",
+            _parse_statsapi_teams, web=web, aliases=MLB_ALIASES, **kwargs),
+        'NBA': TeamDirectory(
+            "NBA",
+            lambda: "http://data.nba.net/data/10s/prod/v1/{}/teams.json".format(
+                time.localtime().tm_year - 1),
+            _parse_nba_teams, web=web, aliases=NBA_ALIASES, **kwargs),
+        'NFL': TeamDirectory(
+            "NFL", teams=_by_name(NFL_TEAMS), names=NFL_TEAMS,
+            aliases=NFL_ALIASES, **kwargs),
+    }
+
+
+def _by_name(names):
+    """{code: display name} as a directory where the code and the name
+    (city and nickname) both resolve to the code
+    """
+    teams = {}
+    for code, name in names.items():
+        teams[code] = code
+        teams[name] = code
+    return teams
+
+
+def _parse_statsapi_teams(data):
+    teams = {}
+    for team in data['teams']:
+        teams[team['abbreviation']] = team['id']
+        teams[team['name']] = team['id']
+    return teams, {}
+
+
+def _parse_nba_teams(data):
+    teams = {}
+    names = {}
+    for team in data['league']['standard']:
+        if team['isNBAFranchise']:
+            teams[team['tricode']] = team['tricode']
+            teams[team['fullName']] = team['tricode']
+            teams[team['nickname']] = team['tricode']
+            names[team['tricode']] = team['nickname']
+    return teams, names
+
+
+NFL_TEAMS = {
+    "ARI": "Arizona Cardinals",
+    "ATL": "Atlanta Falcons",
+    "BAL": "Baltimore Ravens",
+    "BUF": "Buffalo Bills",
+    "CAR": "Carolina Panthers",
+    "CHI": "Chicago Bears",
+    "CIN": "Cincinnati Bengals",
+    "CLE": "Cleveland Browns",
+    "DAL": "Dallas Cowboys",
+    "DEN": "Denver Broncos",
+    "DET": "Detroit Lions",
+    "GB":  "Green Bay Packers",
+    "HOU": "Houston Texans",
+    "IND": "Indianapolis Colts",
+    "JAX": "Jacksonville Jaguars",
+    "KC":  "Kansas City Chiefs",
+    "LAC": "Los Angeles Chargers",
+    "LAR": "Los Angeles Rams",
+    "LV":  "Las Vegas Raiders",
+    "MIA": "Miami Dolphins",
+    "MIN": "Minnesota Vikings",
+    "NE":  "New England Patriots",
+    "NO":  "New Orleans Saints",
+    "NYG": "New York Giants",
+    "NYJ": "New York Jets",
+    "PHI": "Philadelphia Eagles",
+    "PIT": "Pittsburgh Steelers",
+    "SEA": "Seattle Seahawks",
+    "SF":  "San Francisco 49ers",
+    "TB":  "Tampa Bay Buccaneers",
+    "TEN": "Tennessee Titans",
+    "WSH": "Washington",
+}
+
+# nicknames people actually type, each pointing at a key of its directory
+NFL_ALIASES = {
+    "niners": "SF",
+    "pats": "NE",
+    "bucs": "TB",
+    "jags": "JAX",
+    "was": "WSH",
+    "skins": "WSH",
+    "hawks": "SEA",
+}
+
+MLB_ALIASES = {
+    "yanks": "NYY",
+    "cubbies": "CHC",
+    "halos": "LAA",
+    "barves": "ATL",
+    "jays": "TOR",
+    "nats": "WSH",
+    "dbacks": "AZ",
+    "snakes": "AZ",
+}
+
+NHL_ALIASES = {
+    "habs": "MTL",
+    "leafs": "TOR",
+    "pens": "PIT",
+    "caps": "WSH",
+    "canes": "CAR",
+    "sens": "OTT",
+    "bolts": "TBL",
+    "avs": "COL",
+    "preds": "NSH",
+    "hawks": "CHI",
+    "knights": "VGK",
+}
+
+NBA_ALIASES = {
+    "sixers": "Philadelphia 76ers",
+    "cavs": "Cleveland Cavaliers",
+    "mavs": "Dallas Mavericks",
+    "wolves": "Minnesota Timberwolves",
+    "blazers": "Portland Trail Blazers",
+    "dubs": "Golden State Warriors",
+    "knicks": "New York Knicks",
+}
@@ -0,0 +1,287 @@
+import inspect
+import logging
+import time
+from collections import defaultdict
+
+import coloredlogs
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+SCHEDULED = 'scheduled'
+WARMUP = 'warmup'
+LIVE = 'live'
+DELAYED = 'delayed'
+FINAL = 'final'
+POSTPONED = 'postponed'
+
+# phases a game can move to from each phase; anything else upstream
+# reports (flags flicker) is ignored. Postponed and suspended games can
+# come back under the same id, final is final.
+TRANSITIONS = {
+    SCHEDULED: {WARMUP, LIVE, DELAYED, FINAL, POSTPONED},
+    WARMUP: {LIVE, DELAYED, FINAL, POSTPONED},
+    LIVE: {DELAYED, FINAL, POSTPONED},
+    DELAYED: {WARMUP, LIVE, FINAL, POSTPONED},
+    POSTPONED: {SCHEDULED, WARMUP, LIVE, DELAYED},
+    FINAL: set(),
+}
+
+
+class GameEvent:
+    """Something that happened to a game, as kept in the tracker's log"""
+
+    __slots__ = ('gid', 'at')
+    kind = None
+
+    def __init__(self, gid, at=None):
+        self.gid = gid
+        self.at = at or time.time()
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.gid}>"
+
+    def payload(self):
+        return None
+
+    def to_json(self):
+        return [self.kind, self.gid, self.at, self.payload()]
+
+
+class PhaseChanged(GameEvent):
+    """Base for the phase events; `previous` is None the first time a game
+    is seen
+    """
+
+    __slots__ = ('previous',)
+    phase = None
+
+    def __init__(self, gid, previous=None, at=None):
+        super().__init__(gid, at)
+        self.previous = previous
+
+    def payload(self):
+        return self.previous
+
+
+class GameScheduled(PhaseChanged):
+    kind = phase = SCHEDULED
+
+
+class GameWarmup(PhaseChanged):
+    kind = phase = WARMUP
+
+
+class GameLive(PhaseChanged):
+    kind = phase = LIVE
+
+
+class GameDelayed(PhaseChanged):
+    kind = phase = DELAYED
+
+
+class GameFinal(PhaseChanged):
+    kind = phase = FINAL
+
+
+class GamePostponed(PhaseChanged):
+    kind = phase = POSTPONED
+
+
+class ScoringPlay(GameEvent):
+    """A scoring play seen for the first time; `play` is the upstream play
+    itself, handed to subscribers but not kept in the log
+    """
+
+    __slots__ = ('idx', 'play')
+    kind = 'scoring_play'
+
+    def __init__(self, gid, idx, play=None, at=None):
+        super().__init__(gid, at)
+        self.idx = idx
+        self.play = play
+
+    def payload(self):
+        return self.idx
+
+
+class PlaysSeen(GameEvent):
+    """Scoring plays that had already happened when a game was first
+    looked at, remembered without being announced
+    """
+
+    __slots__ = ('idxs',)
+    kind = 'plays_seen'
+
+    def __init__(self, gid, idxs, at=None):
+        super().__init__(gid, at)
+        self.idxs = list(idxs)
+
+    def payload(self):
+        return self.idxs
+
+
+class ScoreChanged(GameEvent):
+    """The (away, home) score moved; `previous` is what it was, handed to
+    subscribers but not kept in the log
+    """
+
+    __slots__ = ('score', 'previous')
+    kind = 'score'
+
+    def __init__(self, gid, score, previous=None, at=None):
+        super().__init__(gid, at)
+        self.score = tuple(score)
+        self.previous = previous
+
+    def payload(self):
+        return list(self.score)
+
+
+class LeadChanged(GameEvent):
+    """The other side ('away' or 'home') went ahead"""
+
+    __slots__ = ('leader',)
+    kind = 'lead'
+
+    def __init__(self, gid, leader, at=None):
+        super().__init__(gid, at)
+        self.leader = leader
+
+    def payload(self):
+        return self.leader
+
+
+PHASE_EVENTS = {
+    cls.phase: cls for cls in (
+        GameScheduled, GameWarmup, GameLive, GameDelayed, GameFinal,
+        GamePostponed)
+}
+
+EVENT_TYPES = {
+    cls.kind: cls for cls in (
+        *PHASE_EVENTS.values(), ScoringPlay, PlaysSeen, ScoreChanged,
+        LeadChanged)
+}
+
+
+class GameTracker:
+    """Per-game state machine driven by an append-only event log
+
+    observe() is fed the phase upstream reports for a game and only
+    records (and returns) an event when that's a real transition, so a
+    tick costs nothing for games that didn't change. Phases, scores, who
+    leads and the scoring plays seen so far are derived from the log
+    alone: snapshot() it, restore() it after a restart and the tracker is
+    where it left off.
+    publish() hands an event to whatever subscribed to its type (or a
+    base type); coroutine handlers are awaited. Handler errors are logged,
+    or re-raised with `raise_errors` for callers that should only record()
+    an event once it has been handled (for alerts, queued: delivery is the
+    broadcaster's).
+    """
+
+    def __init__(self):
+        self.phases = {}  # gid -> phase
+        self.log = []
+        self._plays = {}  # gid -> scoring play indexes seen
+        self._scores = {}  # gid -> (away, home)
+        self._leaders = {}  # gid -> 'away'/'home', whoever led last
+        self._subscribers = defaultdict(list)
+
+    def __len__(self):
+        return len(self.phases)
+
+    def phase(self, gid):
+        return self.phases.get(gid)
+
+    def plays(self, gid):
+        return self._plays.get(gid, set())
+
+    def score(self, gid):
+        return self._scores.get(gid)
+
+    def leader(self, gid):
+        return self._leaders.get(gid)
+
+    def in_phase(self, *phases):
+        return [gid for gid, phase in self.phases.items() if phase in phases]
+
+    def subscribe(self, event_type, handler):
+        self._subscribers[event_type].append(handler)
+
+    def observe(self, gid, phase):
+        previous = self.phases.get(gid)
+        if phase == previous:
+            return None
+        if previous is not None and phase not in TRANSITIONS[previous]:
+            LOGGER.debug(f"[{gid}] ignoring {previous} -> {phase}")
+            return None
+        return self.record(PHASE_EVENTS[phase](gid, previous))
+
+    def record(self, event):
+        self._apply(event)
+        self.log.append(event)
+        return event
+
+    def _apply(self, event):
+        if isinstance(event, PhaseChanged):
+            self.phases[event.gid] = event.phase
+        elif isinstance(event, ScoringPlay):
+            self._plays.setdefault(event.gid, set()).add(event.idx)
+        elif isinstance(event, PlaysSeen):
+            self._plays.setdefault(event.gid, set()).update(event.idxs)
+        elif isinstance(event, ScoreChanged):
+            self._scores[event.gid] = event.score
+            away, home = event.score
+            if away != home:
+                self._leaders[event.gid] = 'away' if away > home else 'home'
+
+    async def publish(self, event, *, raise_errors=False):
+        for event_type in type(event).__mro__:
+            for handler in self._subscribers.get(event_type, ()):
+                try:
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as err:
+                    if raise_errors:
+                        raise
+                    LOGGER.error(f"{event!r} handler failed: {err}")
+
+    def forget(self, gids):
+        """Drop games (and their history) that aren't worth keeping, e.g.
+        anything not on today's schedule
+        """
+        gids = set(gids)
+        if not gids:
+            return
+        for gid in gids:
+            self.phases.pop(gid, None)
+            self._plays.pop(gid, None)
+            self._scores.pop(gid, None)
+            self._leaders.pop(gid, None)
+        self.log = [event for event in self.log if event.gid not in gids]
+
+    def snapshot(self):
+        return [event.to_json() for event in self.log]
+
+    @classmethod
+    def restore(cls, snapshot):
+        tracker = cls()
+        for entry in snapshot or ():
+            try:
+                kind, gid, at, payload = entry
+                event = EVENT_TYPES[kind](gid, payload, at=at)
+            except (KeyError, TypeError, ValueError) as err:
+                LOGGER.debug(f"skipping bad event {entry}: {err}")
+                continue
+            tracker.record(event)
+        return tracker
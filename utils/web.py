@@ -0,0 +1,261 @@
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import aiohttp
+import coloredlogs
+
+try:
+    # aiohttp only decodes brotli bodies when one of these is installed
+    import brotli  # noqa: F401
+    _ENCODINGS = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ENCODINGS = "gzip, deflate, br"
+    except ImportError:
+        _ENCODINGS = "gzip, deflate"
+
+try:
+    # several times faster than the json module on the big scoreboards
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    # faster threaded dns lookups when aiodns is around
+    import aiodns  # noqa: F401
+    _RESOLVER = aiohttp.AsyncResolver
+except ImportError:
+    _RESOLVER = None
+
+
+LOGGER = logging.getLogger(__name__)
+coloredlogs.install(
+    level='DEBUG', logger=LOGGER,
+    fmt="[{asctime}] <{name}> {levelname:>8} | {message}",
+    datefmt='%Y-%m-%d %H:%M:%S',
+    style='{'
+)
+
+
+class _Validated:
+    """A JSON response kept for revalidation with its ETag/Last-Modified"""
+
+    __slots__ = ('etag', 'modified', 'data', 'size', 'parse_time')
+
+    def __init__(self, etag, modified, data, size, parse_time):
+        self.etag = etag
+        self.modified = modified
+        self.data = data
+        self.size = size
+        self.parse_time = parse_time
+
+
+class WebClient:
+    """Bot-wide pooled HTTP client shared by every cog
+
+    One aiohttp session (and connection pool) lives for the life of the bot
+    so repeat lookups against the same API reuse warm keep-alive
+    connections instead of paying DNS + TCP + TLS setup every time.
+
+    JSON GETs made with `revalidate=True` are conditional: responses that
+    came with an ETag or Last-Modified are kept, parsed, and sent back as
+    If-None-Match/If-Modified-Since, the least recently used going first
+    once they add up to more than `max_validated_bytes` of body. A 304
+    hands back the object parsed last time, so callers must treat fetched
+    JSON as read-only. Only polled URLs that repeat are worth opting in;
+    per-game documents and URLs whose query changes every poll would only
+    sit in the cache. savings() reports per endpoint what that saved.
+    """
+
+    def __init__(self, *, limit=100, limit_per_host=10, dns_ttl=300,
+                 keepalive=30, total_timeout=20, connect_timeout=5,
+                 read_timeout=15, max_validated_bytes=8 * 1024 * 1024):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_ttl = dns_ttl
+        self.keepalive = keepalive
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout,
+            sock_connect=connect_timeout,
+            sock_read=read_timeout,
+        )
+        self.headers = {
+            'Accept-Encoding': _ENCODINGS,
+        }
+        self._session = None
+        self.max_validated_bytes = max_validated_bytes
+        self._validated = OrderedDict()  # url -> _Validated
+        self._validated_bytes = 0
+        self._savings = {}  # endpoint -> counters
+
+    @classmethod
+    def from_env(cls, environ):
+        """Build a client using any HTTP_* overrides found in the env"""
+
+        def _num(key, default):
+            try:
+                return type(default)(environ.get(key, default))
+            except (TypeError, ValueError):
+                LOGGER.error(f"bad value for {key}, using {default}")
+                return default
+
+        return cls(
+            limit=_num("HTTP_POOL_LIMIT", 100),
+            limit_per_host=_num("HTTP_POOL_PER_HOST", 10),
+            dns_ttl=_num("HTTP_DNS_TTL", 300),
+            keepalive=_num("HTTP_KEEPALIVE", 30),
+            total_timeout=_num("HTTP_TIMEOUT", 20.0),
+            connect_timeout=_num("HTTP_CONNECT_TIMEOUT", 5.0),
+            read_timeout=_num("HTTP_READ_TIMEOUT", 15.0),
+            max_validated_bytes=_num(
+                "HTTP_MAX_VALIDATED_BYTES", 8 * 1024 * 1024),
+        )
+
+    @property
+    def session(self):
+        """The shared session, created lazily inside the running loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive,
+                enable_cleanup_closed=True,
+                resolver=_RESOLVER() if _RESOLVER else None,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers=self.headers,
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def fetch_json(self, url: str, headers=None, *,
+                         content_type='application/json', revalidate=False,
+                         **kwargs):
+        """`content_type=None` skips the check for APIs that mislabel
+        their JSON; `revalidate` makes it a conditional request
+        """
+        data, _ = await self._get_json(
+            url, headers, content_type, revalidate, kwargs)
+        return data
+
+    async def fetch_json_response(self, url: str, headers=None, *,
+                                  content_type='application/json',
+                                  revalidate=False, **kwargs):
+        """Like fetch_json, but also hands back the response headers so
+        callers can look at caching hints
+        """
+        return await self._get_json(
+            url, headers, content_type, revalidate, kwargs)
+
+    async def _get_json(self, url, headers, content_type, revalidate, kwargs):
+        cached = self._validated.get(url) if revalidate else None
+        if cached:
+            headers = dict(headers or {})
+            if cached.etag:
+                headers.setdefault('If-None-Match', cached.etag)
+            if cached.modified:
+                headers.setdefault('If-Modified-Since', cached.modified)
+        savings = self._savings_for(url)
+        savings['requests'] += 1
+        async with self.session.get(url, headers=headers, **kwargs) as r:
+            if r.status == 304 and cached:
+                self._validated.move_to_end(url)
+                savings['not_modified'] += 1
+                savings['bytes_saved'] += cached.size
+                savings['parse_saved'] += cached.parse_time
+                return cached.data, r.headers
+            size = len(await r.read())
+            started = time.perf_counter()
+            data = await r.json(loads=_loads, content_type=content_type)
+            parse_time = time.perf_counter() - started
+            savings['bytes'] += size
+            savings['parse_time'] += parse_time
+            etag = r.headers.get('ETag')
+            modified = r.headers.get('Last-Modified')
+            self._forget(url)
+            if revalidate and r.status == 200 and (etag or modified) \
+                    and size <= self.max_validated_bytes:
+                self._validated[url] = _Validated(
+                    etag, modified, data, size, parse_time)
+                self._validated_bytes += size
+                while self._validated_bytes > self.max_validated_bytes:
+                    _, oldest = self._validated.popitem(last=False)
+                    self._validated_bytes -= oldest.size
+            return data, r.headers
+
+    def _forget(self, url):
+        cached = self._validated.pop(url, None)
+        if cached:
+            self._validated_bytes -= cached.size
+
+    def _savings_for(self, url):
+        endpoint = _endpoint(url)
+        savings = self._savings.get(endpoint)
+        if savings is None:
+            savings = self._savings[endpoint] = {
+                'requests': 0, 'not_modified': 0, 'bytes': 0,
+                'bytes_saved': 0, 'parse_time': 0.0, 'parse_saved': 0.0,
+            }
+        return savings
+
+    def savings(self):
+        """(endpoint, counters) for every JSON endpoint fetched, the ones
+        revalidation saved the most bytes on first
+        """
+        return sorted(self._savings.items(),
+                      key=lambda item: item[1]['bytes_saved'], reverse=True)
+
+    async def fetch_text(self, url: str, headers=None, **kwargs):
+        async with self.session.get(url, headers=headers, **kwargs) as r:
+            r.raise_for_status()
+            return await r.text()
+
+    async def fetch_bytes(self, url: str, headers=None, **kwargs):
+        async with self.session.get(url, headers=headers, **kwargs) as r:
+            return await r.read()
+
+    async def post_json(self, url: str, payload=None, headers=None, **kwargs):
+        async with self.session.post(
+                url, json=payload, headers=headers, **kwargs) as r:
+            return await r.json(loads=_loads)
+
+
+_IDS = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def _endpoint(url):
+    """`url` without its query and with numeric path segments (game ids,
+    dates) folded, so savings add up per API rather than per game
+    """
+    parts = urlsplit(url)
+    return parts.netloc + _IDS.sub("{id}", parts.path)
+
+
+_MAX_AGE = re.compile(r"(?:^|[,\s])max-age=(\d+)", re.I)
+
+
+def max_age(headers):
+    """Seconds the response says it stays fresh for, from Cache-Control
+    (``no-cache``/``no-store`` count as 0), or None when it doesn't say
+    """
+    if not headers:
+        return None
+    control = headers.get('Cache-Control', '')
+    if re.search(r"no-(?:cache|store)", control, re.I):
+        return 0
+    age = _MAX_AGE.search(control)
+    return int(age.group(1)) if age else None